@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:05
+
+from django.db import migrations
+
+# Prefix search in the member directory filters on lower(column) LIKE 'x%'.
+# Only text_pattern_ops indexes serve LIKE under a non-C collation, and
+# opclasses are PostgreSQL-specific, so these are created there only.
+COLUMNS = ["email", "first_name", "last_name"]
+
+
+def add_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for column in COLUMNS:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS users_{column}_prefix_idx ON users (lower({column}) text_pattern_ops)"
+            )
+
+
+def remove_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for column in COLUMNS:
+            cursor.execute(f"DROP INDEX IF EXISTS users_{column}_prefix_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_prefix_indexes, remove_prefix_indexes),
+    ]
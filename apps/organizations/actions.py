@@ -0,0 +1,49 @@
+"""
+Registry of activity actions. Activity rows store the small integer code;
+the display text is what the feed and API show.
+
+Codes are persisted: never renumber or reuse one, only append.
+"""
+
+UNKNOWN_ACTION = 0
+
+ACTIVITY_ACTIONS = {
+    UNKNOWN_ACTION: "updated",
+    1: "created organization",
+    2: "created project",
+    3: "created task",
+    4: "completed task",
+    5: "moved task to In Progress",
+    6: "moved task to To Do",
+    7: "added member",
+    8: "removed member",
+    9: "changed role to admin",
+    10: "changed role to member",
+    11: "changed role to viewer",
+    12: "imported tasks into",
+}
+
+ACTION_CODES = {text: code for code, text in ACTIVITY_ACTIONS.items()}
+
+ACTION_CHOICES = sorted(ACTIVITY_ACTIONS.items())
+
+
+def action_code(text):
+    """
+    Code for a registered action text. Unregistered text is a programming
+    error: add it to ACTIVITY_ACTIONS first.
+    """
+    try:
+        return ACTION_CODES[text]
+    except KeyError:
+        raise ValueError(f"Unregistered activity action: {text!r}") from None
+
+
+def action_text(code, legacy_action=None):
+    """
+    Display text for a code. Rows converted from free text whose action was
+    never registered carry the original text in legacy_action.
+    """
+    if code == UNKNOWN_ACTION and legacy_action:
+        return legacy_action
+    return ACTIVITY_ACTIONS.get(code, ACTIVITY_ACTIONS[UNKNOWN_ACTION])
@@ -1,4 +1,27 @@
+import atexit
+import contextvars
+import logging
+import queue
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from apps.organizations.actions import action_code
 from apps.organizations.models import Activity
+from core.events import send_event
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "BACKGROUND": False,
+    "MAX_QUEUE": 10000,
+    "BATCH_SIZE": 500,
+    "FLUSH_INTERVAL": 1.0,
+}
+
+# Activities committed during the current request, written once at the end.
+_request_buffer = contextvars.ContextVar("activity_request_buffer", default=None)
 
 
 def get_actor_name(user):
@@ -12,10 +35,172 @@ def get_actor_name(user):
     return getattr(user, "email", "Someone") or "Someone"
 
 
-def log_activity(user, action, target_title, org_id):
-    Activity.objects.create(
+def build_activity(user, action, target_title, org_id):
+    return Activity(
+        organisation_id=org_id,
+        actor_id=getattr(user, "id", None),
         actor_name=get_actor_name(user),
-        action=action,
+        action_code=action_code(action),
         target_title=target_title,
-        org_id=str(org_id),
     )
+
+
+def log_activity(user, action, target_title, org_id):
+    log_activities(user, [(action, target_title)], org_id)
+
+
+def log_activities(user, entries, org_id):
+    """
+    Queue several (action, target_title) entries.
+
+    Entries are only accepted once the surrounding transaction commits and are
+    dropped on rollback. Inside a request they are then held until the
+    response is ready and written with one INSERT (see buffered_activity).
+    """
+    activities = [build_activity(user, action, target_title, org_id) for action, target_title in entries]
+    if activities:
+        transaction.on_commit(lambda: _accept(activities))
+
+
+def _accept(activities):
+    buffer = _request_buffer.get()
+    if buffer is not None:
+        buffer.extend(activities)
+    else:
+        _dispatch(activities)
+
+
+def _dispatch(activities):
+    flusher = get_background_flusher()
+    if flusher is None or not flusher.submit(activities):
+        write_activities(activities)
+
+
+def write_activities(activities):
+    Activity.objects.bulk_create(activities)
+    by_org = defaultdict(list)
+    for activity in activities:
+        by_org[activity.organisation_id].append(activity)
+    for org_id, entries in by_org.items():
+        send_event(org_id, "activity", {
+            "entries": [
+                {
+                    "actor_name": activity.actor_name,
+                    "action": activity.action,
+                    "target_title": activity.target_title,
+                    "created_at": activity.created_at,
+                }
+                for activity in entries
+            ],
+        })
+
+
+def get_activity_version(org_id):
+    """
+    The organisation's newest and oldest entries as (created_at, id). New
+    entries move the first and archiving moves the second; both are read
+    from the database, so every worker sees a change on its next read.
+    Cached feed renders are keyed by it.
+    """
+    entries = Activity.objects.filter(organisation_id=org_id)
+    return (
+        entries.order_by("-created_at", "-id").values_list("created_at", "id").first(),
+        entries.order_by("created_at", "id").values_list("created_at", "id").first(),
+    )
+
+
+@contextmanager
+def buffered_activity():
+    """
+    Collect activities committed inside the block and write them in one batch
+    on exit. Nested blocks share the outer buffer.
+    """
+    if _request_buffer.get() is not None:
+        yield
+        return
+    buffer = []
+    token = _request_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _request_buffer.reset(token)
+        if buffer:
+            _dispatch(buffer)
+
+
+class ActivityFlusher(threading.Thread):
+    """
+    Optional in-process writer that batches activities across requests.
+
+    The queue is bounded; when a batch doesn't fit, submit() queues none of
+    it and returns False so the caller writes it synchronously. Bursts slow
+    requests down instead of dropping entries, and no entry is written twice.
+    """
+
+    def __init__(self, max_queue, batch_size, flush_interval):
+        super().__init__(name="activity-flusher", daemon=True)
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stopped = threading.Event()
+        self._submit_lock = threading.Lock()
+
+    def submit(self, activities):
+        # Only this thread takes items out, so free space can only grow while
+        # a submitter holds the lock and every put below succeeds.
+        with self._submit_lock:
+            if 0 < self.queue.maxsize < self.queue.qsize() + len(activities):
+                return False
+            for activity in activities:
+                self.queue.put_nowait(activity)
+        return True
+
+    def run(self):
+        while not self._stopped.is_set() or not self.queue.empty():
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+
+    def _next_batch(self):
+        batch = []
+        try:
+            batch.append(self.queue.get(timeout=self.flush_interval))
+            while len(batch) < self.batch_size:
+                batch.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write(self, batch):
+        try:
+            write_activities(batch)
+        except Exception:
+            logger.exception("Failed to write %d activity entries.", len(batch))
+        finally:
+            close_old_connections()
+
+    def stop(self, timeout=5.0):
+        self._stopped.set()
+        self.join(timeout)
+
+
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def get_background_flusher():
+    global _flusher
+    config = {**DEFAULTS, **getattr(settings, "ACTIVITY_WRITER", {})}
+    if not config["BACKGROUND"]:
+        return None
+    if _flusher is None:
+        with _flusher_lock:
+            if _flusher is None:
+                _flusher = ActivityFlusher(
+                    max_queue=config["MAX_QUEUE"],
+                    batch_size=config["BATCH_SIZE"],
+                    flush_interval=config["FLUSH_INTERVAL"],
+                )
+                _flusher.start()
+                atexit.register(_flusher.stop)
+    return _flusher
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class OrganizationsConfig(AppConfig):
     name = "apps.organizations"
+
+    def ready(self):
+        # Member writes from any path (API, admin) bump the data version.
+        from apps.organizations import signals  # noqa: F401
@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from apps.organizations.activity import log_activities
+from apps.organizations.models import OrganisationMember
+from apps.organizations.serializers import AddMemberSerializer, OrganisationMemberSerializer
+from apps.organizations.versions import bump_data_version
+from core.membership_cache import invalidate_memberships
+
+User = get_user_model()
+
+
+def bulk_add_members(tenant, actor, rows):
+    """
+    Add many (email, role) pairs to one organisation.
+
+    One query resolves the users, one finds existing memberships, one
+    bulk INSERT adds the rest and one INSERT writes their activity rows.
+    Returns (results, added) where results has one entry per input row, in
+    order, with a status of added, already_member, not_found, duplicate or
+    invalid.
+    """
+    results = []
+    valid = []
+    for row in rows:
+        item = AddMemberSerializer(data=row)
+        if item.is_valid():
+            valid.append((len(results), item.validated_data))
+            results.append({"email": item.validated_data["email"], "status": None})
+        else:
+            email = row.get("email") if isinstance(row, dict) else None
+            results.append({"email": email, "status": "invalid", "errors": item.errors})
+
+    users = {
+        user.email: user
+        for user in User.objects.filter(email__in={data["email"] for _, data in valid})
+    }
+    existing = set(
+        OrganisationMember.objects.filter(
+            organisation=tenant,
+            user_id__in=[user.id for user in users.values()],
+        ).values_list("user_id", flat=True)
+    )
+
+    to_create = []
+    adding = set()
+    for index, data in valid:
+        user = users.get(data["email"])
+        if user is None:
+            results[index]["status"] = "not_found"
+        elif user.id in existing:
+            results[index]["status"] = "already_member"
+        elif user.id in adding:
+            results[index]["status"] = "duplicate"
+        else:
+            adding.add(user.id)
+            to_create.append((index, OrganisationMember(user=user, organisation=tenant, role=data["role"])))
+
+    if to_create:
+        with transaction.atomic():
+            OrganisationMember.objects.bulk_create([member for _, member in to_create])
+            log_activities(actor, [("added member", member.user.email) for _, member in to_create], tenant.id)
+            # bulk_create sends no post_save signals.
+            bump_data_version(tenant.id)
+        invalidate_memberships([member.user_id for _, member in to_create], tenant.id)
+        for index, member in to_create:
+            results[index].update(status="added", member=OrganisationMemberSerializer(member).data)
+
+    return results, len(to_create)
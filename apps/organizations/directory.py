@@ -0,0 +1,75 @@
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Coalesce, Concat, Left, Lower, NullIf, StrIndex, Trim
+from rest_framework import serializers
+from apps.organizations.models import OrganisationMember
+
+ROLES = [choice for choice, _ in OrganisationMember._meta.get_field("role").choices]
+
+# Same rule as OrganisationMemberSerializer.get_name, computed by the database:
+# "First Last", or the part of the email before the @.
+MEMBER_NAME = Coalesce(
+    NullIf(Trim(Concat("user__first_name", Value(" "), "user__last_name")), Value("")),
+    Left("user__email", StrIndex("user__email", Value("@")) - 1),
+)
+
+_joined_at = serializers.DateTimeField()
+
+
+def member_directory(org_id, role=None, query=None):
+    """
+    Members of one organisation as value rows (id, name, email, role,
+    joined_at), optionally limited to a role and to an email or name prefix.
+
+    Prefix matches compare lower(column) LIKE 'prefix%', which PostgreSQL
+    answers from the text_pattern_ops indexes on users (accounts 0002).
+    """
+    queryset = OrganisationMember.objects.filter(organisation_id=org_id)
+    if role:
+        queryset = queryset.filter(role=role)
+    if query:
+        queryset = _prefix_filter(queryset, query.strip().lower())
+    return queryset.values("id", "role", "joined_at", email=F("user__email"), name=MEMBER_NAME)
+
+
+def _prefix_filter(queryset, query):
+    queryset = queryset.alias(
+        email_lower=Lower("user__email"),
+        first_name_lower=Lower("user__first_name"),
+        last_name_lower=Lower("user__last_name"),
+    )
+    first, _, rest = query.partition(" ")
+    if rest.strip():
+        # "ada lov" matches first name "Ada…" with last name "Lov…".
+        return queryset.filter(first_name_lower__startswith=first, last_name_lower__startswith=rest.strip())
+    return queryset.filter(
+        Q(email_lower__startswith=query)
+        | Q(first_name_lower__startswith=query)
+        | Q(last_name_lower__startswith=query)
+    )
+
+
+def member_rows(rows):
+    return [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "email": row["email"],
+            "role": row["role"],
+            "joined_at": _joined_at.to_representation(row["joined_at"]),
+        }
+        for row in rows
+    ]
+
+
+def member_summary(org_id):
+    """
+    Member counts by role in one GROUP BY on the (organisation, role) index.
+    """
+    counts = dict(
+        OrganisationMember.objects.filter(organisation_id=org_id)
+        .values_list("role")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    by_role = {role: counts.get(role, 0) for role in ROLES}
+    return {"total": sum(by_role.values()), "by_role": by_role}
@@ -0,0 +1,147 @@
+import gzip
+import json
+import os
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from apps.organizations.actions import action_text
+from apps.organizations.models import Activity, ActivityArchive
+
+FIELDS = ["id", "actor_name", "action_code", "legacy_action", "target_title", "organisation_id", "created_at"]
+
+
+def _archive_row(row):
+    # The archive keeps the readable form so it doesn't depend on the action registry.
+    return {
+        "id": row["id"],
+        "actor_name": row["actor_name"],
+        "action": action_text(row["action_code"], row["legacy_action"]),
+        "target_title": row["target_title"],
+        "org_id": str(row["organisation_id"]),
+        "created_at": row["created_at"],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Move activity older than each organisation's retention window into "
+        "activities_archive or gzipped NDJSON files, in small batches. Safe to "
+        "re-run after an interruption."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Default retention in days (ACTIVITY_RETENTION['DEFAULT_DAYS']).")
+        parser.add_argument(
+            "--org-days",
+            action="append",
+            default=[],
+            metavar="ORG_ID=DAYS",
+            help="Per-organisation retention override; may be repeated.",
+        )
+        parser.add_argument("--org", action="append", default=[], help="Only process these organisation ids.")
+        parser.add_argument("--to", choices=["table", "ndjson"], default="table")
+        parser.add_argument("--output-dir", help="Directory for NDJSON files (required with --to ndjson).")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would move.")
+        parser.add_argument("--vacuum", action="store_true", help="Run VACUUM ANALYZE afterwards (PostgreSQL).")
+
+    def handle(self, *args, **options):
+        policy = getattr(settings, "ACTIVITY_RETENTION", {})
+        default_days = options["days"] or policy.get("DEFAULT_DAYS", 90)
+        org_days = {**policy.get("ORGS", {}), **self._parse_org_days(options["org_days"])}
+
+        if options["to"] == "ndjson":
+            if not options["output_dir"]:
+                raise CommandError("--output-dir is required with --to ndjson.")
+            os.makedirs(options["output_dir"], exist_ok=True)
+
+        org_ids = options["org"] or (
+            str(org_id) for org_id in Activity.objects.order_by().values_list("organisation_id", flat=True).distinct()
+        )
+        now = timezone.now()
+        total = 0
+        started = time.monotonic()
+
+        for org_id in org_ids:
+            cutoff = now - timedelta(days=int(org_days.get(org_id, default_days)))
+            expired = Activity.objects.filter(organisation_id=org_id, created_at__lt=cutoff)
+            if options["dry_run"]:
+                count = expired.count()
+                total += count
+                self.stdout.write(f"{org_id}: {count} rows older than {cutoff:%Y-%m-%d}")
+                continue
+
+            moved = self._archive_org(org_id, expired, options)
+            if moved:
+                self.stdout.write(f"{org_id}: moved {moved} rows")
+            total += moved
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"{total} rows would be archived."))
+            return
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write(
+            self.style.SUCCESS(f"Archived {total} rows in {elapsed:.1f}s ({total / elapsed:.0f} rows/s).")
+        )
+
+        if options["vacuum"] and total:
+            self._vacuum()
+
+    def _archive_org(self, org_id, expired, options):
+        moved = 0
+        while True:
+            # Each batch is its own short transaction: copy, then delete the
+            # same ids. An interrupted run leaves every batch either fully
+            # moved or untouched, so re-running simply continues.
+            with transaction.atomic():
+                rows = [
+                    _archive_row(row)
+                    for row in expired.order_by("created_at", "id").values(*FIELDS)[: options["batch_size"]]
+                ]
+                if not rows:
+                    return moved
+                if options["to"] == "table":
+                    ActivityArchive.objects.bulk_create(
+                        [ActivityArchive(**row) for row in rows],
+                        ignore_conflicts=True,
+                    )
+                else:
+                    self._write_ndjson(options["output_dir"], org_id, rows)
+                Activity.objects.filter(id__in=[row["id"] for row in rows]).delete()
+            moved += len(rows)
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+    def _write_ndjson(self, output_dir, org_id, rows):
+        # Named by the id range, so a batch replayed after a crash overwrites
+        # its own file instead of duplicating rows.
+        name = f"activities-{org_id}-{rows[0]['id']}-{rows[-1]['id']}.ndjson.gz"
+        path = os.path.join(output_dir, name)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+            for row in rows:
+                handle.write(json.dumps({**row, "created_at": row["created_at"].isoformat()}) + "\n")
+        os.replace(tmp_path, path)
+
+    def _vacuum(self):
+        if connection.vendor != "postgresql":
+            self.stdout.write("Skipping VACUUM: only supported on PostgreSQL.")
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"VACUUM ANALYZE {Activity._meta.db_table}")
+        self.stdout.write("Vacuumed activities table.")
+
+    @staticmethod
+    def _parse_org_days(values):
+        parsed = {}
+        for value in values:
+            org_id, _, days = value.partition("=")
+            if not org_id or not days.isdigit():
+                raise CommandError(f"Invalid --org-days value: {value!r}. Use ORG_ID=DAYS.")
+            parsed[org_id] = int(days)
+        return parsed
@@ -1,11 +1,23 @@
-from django.core.management.base import BaseCommand
-from apps.organizations.models import Activity
+from django.core.management.base import BaseCommand, CommandError
+from apps.organizations.actions import action_code
+from apps.organizations.models import Activity, Organisation
 
 
 class Command(BaseCommand):
     help = "Insert demo activity records for the dashboard."
 
+    def add_arguments(self, parser):
+        parser.add_argument("--org", help="Organisation id to seed (defaults to the first organisation).")
+
     def handle(self, *args, **options):
+        organisation = (
+            Organisation.objects.filter(id=options["org"]).first()
+            if options["org"]
+            else Organisation.objects.order_by("created_at").first()
+        )
+        if organisation is None:
+            raise CommandError("No organisation to seed; create one first.")
+
         entries = [
             {
                 "actor_name": "John",
@@ -26,10 +38,10 @@ class Command(BaseCommand):
 
         records = [
             Activity(
+                organisation=organisation,
                 actor_name=item["actor_name"],
-                action=item["action"],
+                action_code=action_code(item["action"]),
                 target_title=item["target_title"],
-                org_id="demo-org",
             )
             for item in entries
         ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0005_activity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivityArchive",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("actor_name", models.CharField(max_length=255)),
+                ("action", models.CharField(max_length=255)),
+                ("target_title", models.CharField(max_length=255)),
+                ("org_id", models.CharField(max_length=255)),
+                ("created_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "activities_archive",
+                "indexes": [
+                    models.Index(fields=["org_id", "created_at"], name="activities__org_id_a54265_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,86 @@
+import uuid
+from django.db import migrations, models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Cast, Replace
+
+BATCH_SIZE = 10000
+
+# Frozen copy of apps.organizations.actions at the time of this migration.
+ACTION_CODES = {
+    "created organization": 1,
+    "created project": 2,
+    "created task": 3,
+    "completed task": 4,
+    "moved task to In Progress": 5,
+    "moved task to To Do": 6,
+    "added member": 7,
+    "removed member": 8,
+    "changed role to admin": 9,
+    "changed role to member": 10,
+    "changed role to viewer": 11,
+    "imported tasks into": 12,
+}
+UNKNOWN_ACTION = 0
+
+
+def _as_uuid(value):
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def backfill_activity(apps, schema_editor):
+    """
+    Convert org_id strings to organisation FKs and action text to codes,
+    one id range at a time so every statement stays short: per batch, one
+    DELETE for rows whose org_id does not name an existing organisation
+    (e.g. the old "demo-org" seed), which the new FK cannot keep, and one
+    UPDATE that fills the new columns. Text with no registered code is kept
+    in legacy_action, since 0009 drops the action column.
+    """
+    Activity = apps.get_model("organizations", "Activity")
+    Organisation = apps.get_model("organizations", "Organisation")
+
+    raw_org_ids = Activity.objects.order_by().values_list("org_id", flat=True).distinct()
+    candidates = {raw: _as_uuid(raw) for raw in raw_org_ids}
+    existing = set(
+        Organisation.objects.filter(id__in=[v for v in candidates.values() if v]).values_list("id", flat=True)
+    )
+    valid_orgs = {raw: org for raw, org in candidates.items() if org in existing}
+
+    # Spell every kept org_id the canonical way so SQL can convert it below.
+    for raw, org in valid_orgs.items():
+        if raw != str(org):
+            Activity.objects.filter(org_id=raw).update(org_id=str(org))
+    canonical = sorted({str(org) for org in valid_orgs.values()})
+
+    if schema_editor.connection.features.has_native_uuid_field:
+        organisation_id = Cast("org_id", models.UUIDField())
+    else:
+        # UUIDs are stored as 32 hex digits without dashes.
+        organisation_id = Replace("org_id", Value("-"), Value(""))
+    action_code = Case(
+        *[When(action=text, then=Value(code)) for text, code in ACTION_CODES.items()],
+        default=Value(UNKNOWN_ACTION),
+    )
+    legacy_action = Case(When(action__in=list(ACTION_CODES), then=Value(None)), default=F("action"))
+
+    last_id = Activity.objects.order_by("-id").values_list("id", flat=True).first() or 0
+    for start in range(0, last_id + 1, BATCH_SIZE):
+        batch = Activity.objects.filter(id__gte=start, id__lt=start + BATCH_SIZE)
+        batch.exclude(org_id__in=canonical).delete()
+        batch.update(organisation_id=organisation_id, action_code=action_code, legacy_action=legacy_action)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("organizations", "0007_activity_compact_fields"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0008_backfill_activity_compact_fields"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="activity",
+            name="activity_org_created_idx",
+        ),
+        migrations.RemoveField(
+            model_name="activity",
+            name="action",
+        ),
+        migrations.RemoveField(
+            model_name="activity",
+            name="org_id",
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="action_code",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (0, "updated"),
+                    (1, "created organization"),
+                    (2, "created project"),
+                    (3, "created task"),
+                    (4, "completed task"),
+                    (5, "moved task to In Progress"),
+                    (6, "moved task to To Do"),
+                    (7, "added member"),
+                    (8, "removed member"),
+                    (9, "changed role to admin"),
+                    (10, "changed role to member"),
+                    (11, "changed role to viewer"),
+                    (12, "imported tasks into"),
+                ]
+            ),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="organisation",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="activities",
+                to="organizations.organisation",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(fields=["organisation", "created_at"], name="activities_organis_869414_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0010_dataversion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organisationmember',
+            index=models.Index(fields=['organisation', 'joined_at', 'id'], name='organisatio_organis_4ca9b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organisationmember',
+            index=models.Index(fields=['organisation', 'role', 'joined_at', 'id'], name='organisatio_organis_815ddc_idx'),
+        ),
+    ]
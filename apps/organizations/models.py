@@ -2,6 +2,7 @@
 import uuid
 from django.db import models
 from django.conf import settings
+from apps.organizations.actions import ACTION_CHOICES, action_text
 
 
 class Organisation(models.Model):
@@ -57,24 +58,91 @@ class OrganisationMember(models.Model):
         indexes = [
             models.Index(fields=["organisation", "user"]),
             models.Index(fields=["user"]),
+            # Member directory: keyset pages, with or without a role filter.
+            models.Index(fields=["organisation", "joined_at", "id"]),
+            models.Index(fields=["organisation", "role", "joined_at", "id"]),
         ]
 
     def __str__(self):
         return f"{self.user.email} in {self.organisation.name} as {self.role}"
 
 
+class DataVersion(models.Model):
+    """
+    Per-organisation counter bumped after every committed write to tasks,
+    projects or members. List endpoints derive their ETags from it.
+    """
+    organisation = models.OneToOneField(
+        Organisation,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="data_version",
+    )
+    version = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "organisation_data_versions"
+
+    def __str__(self):
+        return f"{self.organisation_id} v{self.version}"
+
+
 class Activity(models.Model):
     """
     Human-readable activity feed entry.
+
+    Stored compactly: the organisation as a UUID FK, the action as a code from
+    apps.organizations.actions, and the actor as an id plus a cached name.
     """
+    organisation = models.ForeignKey(
+        Organisation,
+        on_delete=models.CASCADE,
+        related_name="activities",
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="activities",
+    )
     actor_name = models.CharField(max_length=255)
-    action = models.CharField(max_length=255)
+    action_code = models.PositiveSmallIntegerField(choices=ACTION_CHOICES)
+    # Original text of rows converted from free text with an unregistered
+    # action; new rows always use a registered code and leave this empty.
+    legacy_action = models.CharField(max_length=255, null=True, blank=True)
     target_title = models.CharField(max_length=255)
-    org_id = models.CharField(max_length=255, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "activities"
+        indexes = [
+            models.Index(fields=["organisation", "created_at"]),
+        ]
+
+    @property
+    def action(self):
+        return action_text(self.action_code, self.legacy_action)
+
+    def __str__(self):
+        return f"{self.actor_name} {self.action} {self.target_title}"
+
+
+class ActivityArchive(models.Model):
+    """
+    Activity rows moved out of the hot table by the archive_activity command.
+    Keeps the original id so re-running an interrupted batch is idempotent.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    actor_name = models.CharField(max_length=255)
+    action = models.CharField(max_length=255)
+    target_title = models.CharField(max_length=255)
+    org_id = models.CharField(max_length=255)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "activities_archive"
         indexes = [
             models.Index(fields=["org_id", "created_at"]),
         ]
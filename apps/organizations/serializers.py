@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from apps.organizations.models import Organisation, OrganisationMember
+from apps.organizations.models import Organisation, OrganisationMember, Activity
 
 class OrganisationSerializer(serializers.ModelSerializer):
     """
@@ -32,5 +32,17 @@ class AddMemberSerializer(serializers.Serializer):
     role = serializers.ChoiceField(choices=["admin", "member", "viewer"])
 
 
+class BulkAddMemberSerializer(serializers.Serializer):
+    members = serializers.ListField(child=serializers.DictField(), allow_empty=False, max_length=1000)
+
+
 class RoleUpdateSerializer(serializers.Serializer):
     role = serializers.ChoiceField(choices=["admin", "member", "viewer"])
+
+
+class ActivitySerializer(serializers.ModelSerializer):
+    action = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = Activity
+        fields = ["id", "actor_name", "action", "target_title", "created_at"]
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.organizations.models import Organisation, OrganisationMember
+from apps.organizations.versions import bump_data_version
+
+
+@receiver(post_save, sender=OrganisationMember, dispatch_uid="organizations.member_version")
+def member_saved(sender, instance, **kwargs):
+    bump_data_version(instance.organisation_id)
+
+
+@receiver(post_delete, sender=OrganisationMember, dispatch_uid="organizations.member_delete_version")
+def member_deleted(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Organisation) or getattr(origin, "model", None) is Organisation:
+        return
+    bump_data_version(instance.organisation_id)
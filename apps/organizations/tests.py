@@ -1,3 +1,357 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.template.loader import render_to_string
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.accounts.models import User
+from apps.organizations.actions import UNKNOWN_ACTION, action_code
+from apps.organizations.activity import ActivityFlusher, buffered_activity, build_activity, log_activity
+from apps.organizations.feed import render_activity_feed
+from apps.organizations.models import Activity, ActivityArchive, Organisation, OrganisationMember
+from apps.organizations.serializers import OrganisationMemberSerializer
+from core.membership_cache import MembershipCache, membership_cache
 
-# Create your tests here.
+CREATED = action_code("created task")
+
+
+class ActivityWriterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org = Organisation.objects.create(name="Acme", owner=self.user)
+
+    def test_entries_written_once_per_buffer(self):
+        with CaptureQueriesContext(connection) as context:
+            with buffered_activity():
+                with self.captureOnCommitCallbacks(execute=True):
+                    log_activity(self.user, "created task", "One", self.org.id)
+                    log_activity(self.user, "created task", "Two", self.org.id)
+                self.assertEqual(Activity.objects.count(), 0)
+        inserts = [q for q in context.captured_queries if q["sql"].startswith('INSERT INTO "activities"')]
+        self.assertEqual(len(inserts), 1)
+        activity = Activity.objects.filter(organisation=self.org).first()
+        self.assertEqual(activity.actor, self.user)
+        self.assertEqual(activity.action_code, action_code("created task"))
+        self.assertEqual(activity.action, "created task")
+
+    def test_unregistered_action_is_rejected(self):
+        with self.assertRaises(ValueError):
+            log_activity(self.user, "teleported task", "One", self.org.id)
+
+    def test_legacy_action_text_is_shown_for_unknown_codes(self):
+        Activity.objects.create(
+            organisation=self.org, actor_name="Ann", action_code=UNKNOWN_ACTION,
+            legacy_action="archived project", target_title="Old site",
+        )
+        self.assertEqual(Activity.objects.get().action, "archived project")
+        self.assertIn("archived project", render_activity_feed(self.org.id))
+
+
+class ActivityFlusherTests(TestCase):
+    def test_submit_queues_all_or_nothing(self):
+        owner = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        org = Organisation.objects.create(name="Acme", owner=owner)
+        flusher = ActivityFlusher(max_queue=3, batch_size=10, flush_interval=0.1)
+        entries = [build_activity(owner, "created task", f"Task {n}", org.id) for n in range(4)]
+        self.assertTrue(flusher.submit(entries[:2]))
+        self.assertFalse(flusher.submit(entries[2:]))
+        self.assertEqual(flusher.queue.qsize(), 2)
+        self.assertTrue(flusher.submit(entries[2:3]))
+
+
+class ActivityRollbackTests(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org = Organisation.objects.create(name="Acme", owner=self.user)
+
+    def test_rolled_back_entries_are_dropped(self):
+        with buffered_activity():
+            try:
+                with transaction.atomic():
+                    log_activity(self.user, "created task", "Lost", self.org.id)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            with transaction.atomic():
+                log_activity(self.user, "created task", "Kept", self.org.id)
+        self.assertEqual(list(Activity.objects.values_list("target_title", flat=True)), ["Kept"])
+
+
+class ActivityListViewTests(TestCase):
+    def setUp(self):
+        membership_cache.clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org = Organisation.objects.create(name="Acme", owner=self.user)
+        OrganisationMember.objects.create(user=self.user, organisation=self.org, role="owner")
+        Activity.objects.bulk_create([
+            Activity(organisation=self.org, actor_name="Ann", action_code=CREATED, target_title=f"Task {i}")
+            for i in range(5)
+        ])
+        other = Organisation.objects.create(name="Other", owner=self.user)
+        Activity.objects.create(organisation=other, actor_name="Eve", action_code=CREATED, target_title="Other")
+        self.client = APIClient()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_X_ORG_ID=str(self.org.id))
+
+    def test_pages_newest_first_and_polls_with_etag(self):
+        first = self.client.get("/api/activities/?page_size=3")
+        self.assertEqual(first.status_code, 200)
+        second = self.client.get(first.data["next"])
+        titles = [row["target_title"] for row in first.data["results"] + second.data["results"]]
+        self.assertEqual(titles, [f"Task {i}" for i in range(4, -1, -1)])
+        self.assertIsNone(second.data["next"])
+
+        poll_url = f"/api/activities/?since={first.data['latest']}"
+        poll = self.client.get(poll_url)
+        self.assertEqual(poll.data["results"], [])
+        cached = self.client.get(poll_url, HTTP_IF_NONE_MATCH=poll["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+        Activity.objects.create(organisation=self.org, actor_name="Ann", action_code=CREATED, target_title="Task 5")
+        fresh = self.client.get(poll_url, HTTP_IF_NONE_MATCH=poll["ETag"])
+        self.assertEqual(fresh.status_code, 200)
+        self.assertEqual([row["target_title"] for row in fresh.data["results"]], ["Task 5"])
+
+
+class ActivityFeedCacheTests(TestCase):
+    def setUp(self):
+        owner = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org_id = Organisation.objects.create(name="Acme", owner=owner).id
+        Activity.objects.create(organisation_id=self.org_id, actor_name="Ann", action_code=CREATED, target_title="Tom & Jerry")
+
+    def fresh_render(self):
+        activities = Activity.objects.filter(organisation_id=self.org_id).order_by("-created_at")[:20]
+        return render_to_string("organizations/activity_list.html", {"activities": activities})
+
+    def test_cached_feed_matches_template_and_skips_render_queries(self):
+        expected = self.fresh_render()
+        self.assertEqual(render_activity_feed(self.org_id), expected)
+        with self.assertNumQueries(2):
+            self.assertEqual(render_activity_feed(self.org_id), expected)
+
+    def test_new_activity_refreshes_feed(self):
+        render_activity_feed(self.org_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            log_activity(None, "completed task", "Ship it", self.org_id)
+        self.assertIn("Ship it", render_activity_feed(self.org_id))
+
+    def test_archiving_refreshes_feed(self):
+        Activity.objects.filter(organisation_id=self.org_id).update(created_at=timezone.now() - timedelta(days=400))
+        self.assertIn("Tom &amp; Jerry", render_activity_feed(self.org_id))
+        call_command("archive_activity", stdout=StringIO())
+        self.assertNotIn("Tom &amp; Jerry", render_activity_feed(self.org_id))
+
+
+class ArchiveActivityCommandTests(TestCase):
+    def test_moves_only_expired_rows(self):
+        owner = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        org = Organisation.objects.create(name="Acme", owner=owner)
+        Activity.objects.bulk_create([
+            Activity(organisation=org, actor_name="Ann", action_code=CREATED, target_title=f"Old {i}")
+            for i in range(5)
+        ])
+        Activity.objects.update(created_at=timezone.now() - timedelta(days=120))
+        Activity.objects.create(organisation=org, actor_name="Ann", action_code=CREATED, target_title="New")
+
+        call_command("archive_activity", "--days", "90", "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(list(Activity.objects.values_list("target_title", flat=True)), ["New"])
+        archived = ActivityArchive.objects.filter(org_id=str(org.id))
+        self.assertEqual(archived.count(), 5)
+        self.assertEqual(set(archived.values_list("action", flat=True)), {"created task"})
+
+
+class WorkspaceMembersETagTests(TestCase):
+    def test_member_changes_invalidate_etag(self):
+        membership_cache.clear()
+        owner = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        org = Organisation.objects.create(name="Acme", owner=owner)
+        OrganisationMember.objects.create(user=owner, organisation=org, role="owner")
+        client = APIClient()
+        token = RefreshToken.for_user(owner).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_X_ORG_ID=str(org.id))
+        url = f"/api/workspaces/{org.id}/members/"
+
+        etag = client.get(url)["ETag"]
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            OrganisationMember.objects.create(
+                user=User.objects.create_user(email="new@example.com", password="Str0ng-pass!"),
+                organisation=org,
+            )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["members"]), 2)
+
+
+class MembershipCacheInvalidationTests(TestCase):
+    def setUp(self):
+        membership_cache.clear()
+        self.owner = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org = Organisation.objects.create(name="Acme", owner=self.owner)
+        OrganisationMember.objects.create(user=self.owner, organisation=self.org, role="owner")
+        self.admin = User.objects.create_user(email="admin@example.com", password="Str0ng-pass!")
+        self.admin_member = OrganisationMember.objects.create(user=self.admin, organisation=self.org, role="admin")
+        viewer = User.objects.create_user(email="viewer@example.com", password="Str0ng-pass!")
+        self.viewer_member = OrganisationMember.objects.create(user=viewer, organisation=self.org, role="viewer")
+        self.base = f"/api/workspaces/{self.org.id}/members/"
+
+    def client_for(self, user):
+        client = APIClient()
+        token = RefreshToken.for_user(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_X_ORG_ID=str(self.org.id))
+        return client
+
+    def test_role_downgrade_applies_on_next_request(self):
+        admin = self.client_for(self.admin)
+        self.assertEqual(admin.get(self.base).status_code, 200)
+        self.assertEqual(membership_cache.get(self.admin.id, self.org.id)[1], "admin")
+
+        response = self.client_for(self.owner).patch(
+            f"{self.base}{self.admin_member.id}/role", {"role": "member"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        response = admin.delete(f"{self.base}{self.viewer_member.id}")
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(OrganisationMember.objects.filter(id=self.viewer_member.id).exists())
+
+    def test_removed_member_loses_access_on_next_request(self):
+        admin = self.client_for(self.admin)
+        self.assertEqual(admin.get(self.base).status_code, 200)
+
+        response = self.client_for(self.owner).delete(f"{self.base}{self.admin_member.id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(admin.get(self.base).status_code, 403)
+
+    @override_settings(CACHES={"shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "membership-tests"}})
+    def test_shared_alias_invalidates_other_workers(self):
+        workers = [MembershipCache(100, 60, local_timeout=0, cache_alias="shared") for _ in range(2)]
+        workers[0].set(self.admin.id, self.org.id, self.org, "admin")
+        self.assertEqual(workers[1].get(self.admin.id, self.org.id)[1], "admin")
+        workers[0].invalidate(self.admin.id, self.org.id)
+        self.assertIsNone(workers[1].get(self.admin.id, self.org.id))
+
+    @override_settings(CACHES={"shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "membership-race"}})
+    def test_set_after_a_racing_invalidation_is_dropped(self):
+        for cache in (MembershipCache(100, 60), MembershipCache(100, 60, local_timeout=0, cache_alias="shared")):
+            generation = cache.generation(self.admin.id, self.org.id)
+            # The role changes between this request's database read and its set().
+            cache.invalidate(self.admin.id, self.org.id)
+            cache.set(self.admin.id, self.org.id, self.org, "admin", generation)
+            self.assertIsNone(cache.get(self.admin.id, self.org.id))
+
+            cache.set(self.admin.id, self.org.id, self.org, "member", cache.generation(self.admin.id, self.org.id))
+            self.assertEqual(cache.get(self.admin.id, self.org.id)[1], "member")
+
+    def test_renaming_the_organisation_drops_cached_rows(self):
+        owner = self.client_for(self.owner)
+        self.assertEqual(owner.get(self.base).status_code, 200)
+        self.assertIsNotNone(membership_cache.get(self.owner.id, self.org.id))
+        response = owner.patch(f"/api/organisations/{self.org.id}/", {"name": "Acme Ltd"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(membership_cache.get(self.owner.id, self.org.id))
+
+
+class WorkspaceMemberBulkAddTests(TestCase):
+    def setUp(self):
+        membership_cache.clear()
+        self.owner = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org = Organisation.objects.create(name="Acme", owner=self.owner)
+        OrganisationMember.objects.create(user=self.owner, organisation=self.org, role="owner")
+        self.url = f"/api/workspaces/{self.org.id}/members/bulk-add"
+
+    def client_for(self, user):
+        client = APIClient()
+        token = RefreshToken.for_user(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_X_ORG_ID=str(self.org.id))
+        return client
+
+    def test_reports_each_email_and_adds_in_constant_queries(self):
+        User.objects.bulk_create(
+            [User(email=f"user{n}@example.com", password="!") for n in range(40)]
+        )
+        members = [{"email": f"user{n}@example.com", "role": "member"} for n in range(40)]
+        members += [
+            {"email": "owner@example.com", "role": "admin"},
+            {"email": "user0@example.com", "role": "viewer"},
+            {"email": "ghost@example.com", "role": "member"},
+            {"email": "user1@example.com", "role": "owner"},
+        ]
+        client = self.client_for(self.owner)
+        with CaptureQueriesContext(connection) as context:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = client.post(self.url, {"members": members}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["added"], 40)
+        statuses = [result["status"] for result in response.data["results"][40:]]
+        self.assertEqual(statuses, ["already_member", "duplicate", "not_found", "invalid"])
+        self.assertEqual(response.data["results"][0]["member"]["email"], "user0@example.com")
+        self.assertLess(len(context.captured_queries), 20)
+        self.assertEqual(OrganisationMember.objects.filter(organisation=self.org).count(), 41)
+        self.assertEqual(Activity.objects.filter(organisation=self.org, action_code=action_code("added member")).count(), 40)
+
+    def test_members_cannot_bulk_add(self):
+        member = User.objects.create_user(email="member@example.com", password="Str0ng-pass!")
+        OrganisationMember.objects.create(user=member, organisation=self.org, role="member")
+        response = self.client_for(member).post(
+            self.url, {"members": [{"email": "owner@example.com", "role": "admin"}]}, format="json"
+        )
+        self.assertEqual(response.status_code, 403)
+
+
+class MemberDirectoryTests(TestCase):
+    def setUp(self):
+        membership_cache.clear()
+        self.owner = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org = Organisation.objects.create(name="Acme", owner=self.owner)
+        OrganisationMember.objects.create(user=self.owner, organisation=self.org, role="owner")
+        people = [
+            ("ada@example.com", "Ada", "Lovelace", "admin"),
+            ("alan@example.com", "Alan", "Turing", "member"),
+            ("grace@example.com", "", "", "member"),
+            ("ADRIAN@example.com", "Adrian", "Smith", "viewer"),
+        ]
+        for email, first, last, role in people:
+            user = User.objects.create_user(email=email, password="Str0ng-pass!", first_name=first, last_name=last)
+            OrganisationMember.objects.create(user=user, organisation=self.org, role=role)
+        self.client = APIClient()
+        token = RefreshToken.for_user(self.owner).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_X_ORG_ID=str(self.org.id))
+        self.url = f"/api/workspaces/{self.org.id}/members/"
+
+    def emails(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [member["email"] for member in response.data["members"]]
+
+    def test_pages_match_the_member_serializer(self):
+        first = self.client.get(self.url, {"page_size": 3})
+        second = self.client.get(first.data["next"])
+        self.assertIsNone(second.data["next"])
+        members = OrganisationMember.objects.select_related("user").filter(organisation=self.org).order_by("joined_at", "id")
+        expected = OrganisationMemberSerializer(members, many=True).data
+        self.assertEqual(first.data["members"] + second.data["members"], [dict(item) for item in expected])
+
+    def test_role_filter_and_prefix_search(self):
+        self.assertEqual(self.emails(role="member"), ["alan@example.com", "grace@example.com"])
+        self.assertEqual(self.emails(q="AD"), ["ada@example.com", "ADRIAN@example.com"])
+        self.assertEqual(self.emails(q="turing"), ["alan@example.com"])
+        self.assertEqual(self.emails(q="ada lov"), ["ada@example.com"])
+        self.assertEqual(self.emails(q="a%"), [])
+        self.assertEqual(self.client.get(self.url, {"role": "boss"}).status_code, 400)
+
+    def test_summary_counts_roles_in_one_query(self):
+        url = f"/api/workspaces/{self.org.id}/members/summary"
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(
+            response.data,
+            {"total": 5, "by_role": {"owner": 1, "admin": 1, "member": 2, "viewer": 1}},
+        )
+        member_queries = [q for q in context.captured_queries if '"organisation_members"' in q["sql"]]
+        self.assertEqual(len(member_queries), 1)
@@ -3,10 +3,13 @@ from rest_framework.routers import DefaultRouter
 from apps.organizations.views import (
     OrganisationViewSet,
     WorkspaceMembersView,
+    WorkspaceMemberSummaryView,
     WorkspaceMemberAddView,
+    WorkspaceMemberBulkAddView,
     WorkspaceMemberRoleView,
     WorkspaceMemberRemoveView,
     activity_feed,
+    ActivityListView,
 )
 
 router = DefaultRouter()
@@ -14,9 +17,12 @@ router.register(r"organisations", OrganisationViewSet, basename="organisation")
 
 urlpatterns = [
     path("activity/", activity_feed),
+    path("activities/", ActivityListView.as_view()),
     path("workspaces/<uuid:workspace_id>/members/", WorkspaceMembersView.as_view()),
+    path("workspaces/<uuid:workspace_id>/members/summary", WorkspaceMemberSummaryView.as_view()),
     path("workspaces/<uuid:workspace_id>/members/add", WorkspaceMemberAddView.as_view()),
-    path("workspaces/<uuid:workspace_id>/members/<uuid:member_id>/role", WorkspaceMemberRoleView.as_view()),
-    path("workspaces/<uuid:workspace_id>/members/<uuid:member_id>", WorkspaceMemberRemoveView.as_view()),
+    path("workspaces/<uuid:workspace_id>/members/bulk-add", WorkspaceMemberBulkAddView.as_view()),
+    path("workspaces/<uuid:workspace_id>/members/<int:member_id>/role", WorkspaceMemberRoleView.as_view()),
+    path("workspaces/<uuid:workspace_id>/members/<int:member_id>", WorkspaceMemberRemoveView.as_view()),
 ]
 urlpatterns += router.urls
@@ -0,0 +1,44 @@
+import hashlib
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils.http import parse_etags, quote_etag
+from apps.organizations.models import DataVersion
+
+
+def get_data_version(org_id):
+    version = DataVersion.objects.filter(organisation_id=org_id).values_list("version", flat=True).first()
+    return version or 0
+
+
+def bump_data_version(org_id):
+    """
+    Increment the organisation's data version once the surrounding
+    transaction commits, so a reader never pairs the new version with rows
+    from before the write.
+    """
+    transaction.on_commit(lambda: _increment(org_id))
+
+
+def _increment(org_id):
+    updated = DataVersion.objects.filter(organisation_id=org_id).update(version=F("version") + 1)
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            DataVersion.objects.create(organisation_id=org_id, version=1)
+    except IntegrityError:
+        # Another writer created the row first, or the organisation is gone.
+        DataVersion.objects.filter(organisation_id=org_id).update(version=F("version") + 1)
+
+
+def data_version_etag(request, version):
+    """
+    Strong ETag for a tenant list response: the org's data version plus the
+    full path, since cursors and filters select different pages.
+    """
+    key = f"{request.tenant.id}:{version}|{request.get_full_path()}"
+    return quote_etag(hashlib.sha1(key.encode()).hexdigest())
+
+
+def etag_matches(request, etag):
+    return etag in parse_etags(request.headers.get("If-None-Match", ""))
@@ -3,18 +3,28 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import JsonResponse
-from django.template.response import TemplateResponse
-from django.db import transaction
+import hashlib
+from django.http import HttpResponse, JsonResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+from django.db import IntegrityError, transaction
 from django.contrib.auth import get_user_model
 from apps.organizations.models import Organisation, OrganisationMember, Activity, AuditEvent
 from apps.organizations.serializers import (
     OrganisationSerializer,
     OrganisationMemberSerializer,
     AddMemberSerializer,
+    BulkAddMemberSerializer,
     RoleUpdateSerializer,
+    ActivitySerializer,
 )
 from apps.organizations.activity import log_activity
+from apps.organizations.bulk import bulk_add_members
+from apps.organizations.directory import ROLES, member_directory, member_rows, member_summary
+from apps.organizations.feed import render_activity_feed
+from apps.organizations.versions import data_version_etag, etag_matches, get_data_version
+from core.membership_cache import invalidate_membership, invalidate_organisation_memberships
+from core.pagination import KeysetPagination
+from core.response_cache import get_response_cache
 from core.permissions import IsOrganisationOwner
 
 User = get_user_model()
@@ -52,6 +62,7 @@ class OrganisationViewSet(viewsets.ModelViewSet):
                 organisation=organisation,
                 role="owner",
             )
+            invalidate_membership(self.request.user.id, organisation.id)
             AuditEvent.objects.create(
                 actor=self.request.user,
                 organisation=organisation,
@@ -67,6 +78,16 @@ class OrganisationViewSet(viewsets.ModelViewSet):
                 organisation.id,
             )
 
+    def perform_update(self, serializer):
+        organisation = serializer.save()
+        # Cached memberships carry the organisation row that becomes request.tenant.
+        invalidate_organisation_memberships(organisation.id)
+
+    def perform_destroy(self, instance):
+        organisation_id = instance.id
+        instance.delete()
+        invalidate_organisation_memberships(organisation_id)
+
 
 def activity_feed(request):
     """
@@ -76,15 +97,104 @@ def activity_feed(request):
     if not request.org_id:
         return JsonResponse({"detail": "X-ORG-ID header is required."}, status=400)
 
-    activities = Activity.objects.filter(org_id=request.org_id).order_by("-created_at")[:20]
-    return TemplateResponse(request, "organizations/activity_list.html", {"activities": activities})
+    tenant = getattr(request, "tenant", None)
+    return HttpResponse(render_activity_feed(tenant.id if tenant else request.org_id))
+
+
+class ActivityPagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    max_page_size = 200
+
+
+class ActivityListView(APIView):
+    """
+    JSON activity feed, newest first, paged by (created_at, id) cursor.
+
+    `since=<latest token>` returns only newer entries. Responses carry an ETag
+    derived from the org's newest entry, so an idle poller gets an empty 304.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if getattr(request, "tenant", None) is None:
+            return Response({"detail": "Active tenant is required."}, status=status.HTTP_400_BAD_REQUEST)
 
+        queryset = Activity.objects.filter(organisation_id=request.tenant.id)
+        paginator = ActivityPagination()
+        paginator.bind(Activity)
 
+        newest = queryset.order_by(*paginator.ordering).values_list("created_at", "id").first()
+        etag = quote_etag(hashlib.sha1(f"{newest}|{request.get_full_path()}".encode()).hexdigest())
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return HttpResponseNotModified(headers={"ETag": etag})
+
+        since = paginator.decode_token(request.query_params.get("since"))
+        if since is not None:
+            queryset = queryset.filter(paginator.seek_filter(since, reverse=True))
+
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        response = paginator.get_paginated_response(ActivitySerializer(page, many=True).data)
+        if newest is not None:
+            response.data["latest"] = paginator.encode_cursor(paginator.position_for(
+                {"created_at": newest[0], "id": newest[1]}
+            ))
+        else:
+            response.data["latest"] = request.query_params.get("since")
+        response["ETag"] = etag
+        return response
+
+
+class MemberPagination(KeysetPagination):
+    ordering = ("joined_at", "id")
+    page_size = 50
+    max_page_size = 200
 
 
 class WorkspaceMembersView(APIView):
     """
-    List members for a workspace.
+    List members for a workspace, oldest first, paged by (joined_at, id)
+    cursor. `role=admin` filters by role; `q=` matches a prefix of the
+    email, first name or last name ("ada lov" for first and last).
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, workspace_id):
+        if getattr(request, "tenant", None) is None:
+            return Response({"detail": "Active tenant is required."}, status=status.HTTP_400_BAD_REQUEST)
+        if str(request.tenant.id) != str(workspace_id):
+            return Response({"detail": "Workspace mismatch."}, status=status.HTTP_403_FORBIDDEN)
+
+        version = get_data_version(request.tenant.id)
+        etag = data_version_etag(request, version)
+        if etag_matches(request, etag):
+            return HttpResponseNotModified(headers={"ETag": etag})
+
+        cache = get_response_cache()
+        cached = cache.get(request, version) if cache is not None else None
+        if cached is not None:
+            cached["ETag"] = etag
+            return cached
+
+        role = request.query_params.get("role")
+        if role and role not in ROLES:
+            return Response({"role": [f"Must be one of: {', '.join(ROLES)}."]}, status=status.HTTP_400_BAD_REQUEST)
+        rows = member_directory(request.tenant.id, role=role, query=request.query_params.get("q"))
+        paginator = MemberPagination()
+        page = paginator.paginate_queryset(rows, request, view=self)
+        response = Response(
+            {"members": member_rows(page), "next": paginator.get_next_link()},
+            status=status.HTTP_200_OK,
+            headers={"ETag": etag},
+        )
+        if cache is not None:
+            cache.store(request, version, response)
+        return response
+
+
+class WorkspaceMemberSummaryView(APIView):
+    """
+    Member counts by role, for the members screen header.
     """
     permission_classes = [IsAuthenticated]
 
@@ -94,9 +204,10 @@ class WorkspaceMembersView(APIView):
         if str(request.tenant.id) != str(workspace_id):
             return Response({"detail": "Workspace mismatch."}, status=status.HTTP_403_FORBIDDEN)
 
-        members = OrganisationMember.objects.select_related("user").filter(organisation=request.tenant)
-        data = OrganisationMemberSerializer(members, many=True).data
-        return Response({"members": data}, status=status.HTTP_200_OK)
+        etag = data_version_etag(request, get_data_version(request.tenant.id))
+        if etag_matches(request, etag):
+            return HttpResponseNotModified(headers={"ETag": etag})
+        return Response(member_summary(request.tenant.id), status=status.HTTP_200_OK, headers={"ETag": etag})
 
 
 class WorkspaceMemberAddView(APIView):
@@ -131,6 +242,7 @@ class WorkspaceMemberAddView(APIView):
             organisation=request.tenant,
             role=role,
         )
+        invalidate_membership(user.id, request.tenant.id)
 
         log_activity(
             request.user,
@@ -145,6 +257,38 @@ class WorkspaceMemberAddView(APIView):
         )
 
 
+class WorkspaceMemberBulkAddView(APIView):
+    """
+    Add up to 1000 members in one request. Only owner/admin.
+    Body: {"members": [{"email": ..., "role": ...}, ...]}. Every email gets
+    a result; 400 only if nobody could be added.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, workspace_id):
+        if getattr(request, "tenant", None) is None:
+            return Response({"detail": "Active tenant is required."}, status=status.HTTP_400_BAD_REQUEST)
+        if str(request.tenant.id) != str(workspace_id):
+            return Response({"detail": "Workspace mismatch."}, status=status.HTTP_403_FORBIDDEN)
+
+        if getattr(request, "tenant_role", None) not in ["owner", "admin"]:
+            return Response({"detail": "Permission denied."}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = BulkAddMemberSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            results, added = bulk_add_members(request.tenant, request.user, serializer.validated_data["members"])
+        except IntegrityError:
+            return Response(
+                {"detail": "Members changed while adding. Please retry."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(
+            {"results": results, "added": added},
+            status=status.HTTP_201_CREATED if added else status.HTTP_400_BAD_REQUEST,
+        )
+
+
 class WorkspaceMemberRoleView(APIView):
     """
     Owner-only role updates.
@@ -176,6 +320,7 @@ class WorkspaceMemberRoleView(APIView):
 
         member.role = role
         member.save(update_fields=["role"])
+        invalidate_membership(member.user_id, request.tenant.id)
 
         log_activity(
             request.user,
@@ -221,6 +366,7 @@ class WorkspaceMemberRemoveView(APIView):
 
         target_email = member.user.email
         member.delete()
+        invalidate_membership(member.user_id, request.tenant.id)
 
         log_activity(
             request.user,
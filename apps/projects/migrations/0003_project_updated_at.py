@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-18 14:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_projects_organis_cb765f_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['organisation', 'updated_at'], name='projects_organis_3d7903_idx'),
+        ),
+    ]
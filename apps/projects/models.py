@@ -12,12 +12,14 @@ class Project(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "projects"
         unique_together = ("organisation", "name")
         indexes = [
             models.Index(fields=["organisation", "created_at"]),
+            models.Index(fields=["organisation", "updated_at"]),
         ]
 
     def __str__(self):
@@ -1,12 +1,40 @@
 from rest_framework import serializers
 from apps.projects.models import Project
+from apps.tasks.models import TaskCounter
+from core.serialization import ValuesSerializer
 
 class ProjectSerializer(serializers.ModelSerializer):
     """
     Serializer for Project model.
     Converts Project objects <-> JSON for API requests/responses.
     """
+    task_counts = serializers.SerializerMethodField()
+
     class Meta:
         model = Project
         fields = "__all__"
-        read_only_fields = ["organisation"]  # tenant context enforced in viewset
\ No newline at end of file
+        read_only_fields = ["organisation"]  # tenant context enforced in viewset
+
+    def get_task_counts(self, obj):
+        # Read from the maintained TaskCounter rows (prefetched by the viewset).
+        counts = {"todo": 0, "in_progress": 0, "done": 0}
+        for counter in obj.task_counters.all():
+            counts[counter.status] = counter.count
+        counts["total"] = sum(counts.values())
+        return counts
+
+
+class ProjectValuesSerializer(ValuesSerializer):
+    """
+    Fast list representation, identical to ProjectSerializer's.
+    """
+    serializer_class = ProjectSerializer
+
+    def get_task_counts_batch(self, rows):
+        counts = {row["id"]: {"todo": 0, "in_progress": 0, "done": 0} for row in rows}
+        counters = TaskCounter.objects.filter(project_id__in=list(counts)).values_list("project_id", "status", "count")
+        for project_id, status, count in counters:
+            counts[project_id][status] = count
+        for project_counts in counts.values():
+            project_counts["total"] = sum(project_counts.values())
+        return counts
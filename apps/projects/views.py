@@ -1,16 +1,24 @@
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from apps.projects.models import Project
-from apps.projects.serializers import ProjectSerializer
+from apps.projects.serializers import ProjectSerializer, ProjectValuesSerializer
 from apps.organizations.activity import log_activity
 from core.permissions import IsAdminOrOwner
-from core.tenancy import TenantScopedViewSetMixin
+from core.serialization import SparseFieldsMixin, ValuesListMixin
+from core.tenancy import DataVersionETagMixin, TenantScopedViewSetMixin
 
-class ProjectViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
+class ProjectViewSet(
+    DataVersionETagMixin,
+    ValuesListMixin,
+    SparseFieldsMixin,
+    TenantScopedViewSetMixin,
+    viewsets.ModelViewSet,
+):
     """
-    Tenant-aware Project API.
+    Tenant-aware Project API. List and retrieve accept `?fields=id,name,...`.
     """
     serializer_class = ProjectSerializer
+    values_serializer_class = ProjectValuesSerializer
     permission_classes = [IsAuthenticated, IsAdminOrOwner]
 
     def get_queryset(self):
@@ -20,7 +28,11 @@ class ProjectViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
         - Tenant isolation: only projects belonging to the active organisation.
         """
         self.ensure_tenant()
-        return self.filter_queryset_by_tenant(Project.objects.all())
+        queryset = Project.objects.all()
+        requested = self.get_requested_fields()
+        if requested is None or "task_counts" in requested:
+            queryset = queryset.prefetch_related("task_counters")
+        return self.filter_queryset_by_tenant(queryset)
 
     def perform_create(self, serializer):
         """
@@ -3,3 +3,9 @@ from django.apps import AppConfig
 
 class TasksConfig(AppConfig):
     name = "apps.tasks"
+
+    def ready(self):
+        # Tombstones and data versions follow every write path (API, admin, cascades).
+        from apps.tasks import signals  # noqa: F401
+        # Count connections and requests from start-up, management commands included.
+        from core import database  # noqa: F401
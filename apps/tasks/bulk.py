@@ -0,0 +1,135 @@
+from collections import Counter
+from django.db import transaction
+from django.utils import timezone
+from apps.organizations.activity import log_activities
+from apps.organizations.versions import bump_data_version
+from apps.projects.models import Project
+from apps.tasks.counters import apply_task_counter_changes
+from apps.tasks.models import Task
+from apps.tasks.serializers import BulkTaskItemSerializer
+from core.events import publish_event
+
+BULK_CHUNK_SIZE = 500
+STATUSES = ["todo", "in_progress", "done"]
+
+
+def normalize_status(raw_status):
+    """
+    Accept "DONE", " in_progress " etc. Returns None for unknown values.
+    """
+    normalized = str(raw_status).strip().lower()
+    return normalized if normalized in STATUSES else None
+
+
+def status_activity_action(normalized):
+    if normalized == "done":
+        return "completed task"
+    if normalized == "in_progress":
+        return "moved task to In Progress"
+    return "moved task to To Do"
+
+
+def bulk_create_tasks(tenant, user, rows, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Validate and insert many tasks for one tenant.
+
+    Uses one query for project ownership, one for existing (project, title)
+    pairs, chunked INSERTs, and one activity row per project touched.
+    Returns (created_tasks, errors) where errors are {"index", "errors"} dicts.
+    """
+    errors = []
+    valid = []
+    for index, row in enumerate(rows):
+        item = BulkTaskItemSerializer(data=row)
+        if item.is_valid():
+            valid.append((index, item.validated_data))
+        else:
+            errors.append({"index": index, "errors": item.errors})
+
+    project_ids = {data["project"] for _, data in valid}
+    projects = dict(
+        Project.objects.filter(organisation_id=tenant.id, id__in=project_ids).values_list("id", "name")
+    )
+    existing = set(
+        Task.objects.filter(
+            project_id__in=projects.keys(),
+            title__in={data["title"] for _, data in valid},
+        ).values_list("project_id", "title")
+    )
+
+    to_create = []
+    for index, data in valid:
+        key = (data["project"], data["title"])
+        if data["project"] not in projects:
+            errors.append({"index": index, "errors": {"project": ["Project does not belong to the active organisation."]}})
+        elif key in existing:
+            errors.append({"index": index, "errors": {"title": ["Task with this project and title already exists."]}})
+        else:
+            existing.add(key)
+            to_create.append(
+                Task(
+                    project_id=data["project"],
+                    organisation_id=tenant.id,
+                    title=data["title"],
+                    description=data["description"],
+                    status=data["status"],
+                    due_date=data["due_date"],
+                )
+            )
+
+    if to_create:
+        with transaction.atomic():
+            for start in range(0, len(to_create), chunk_size):
+                Task.objects.bulk_create(to_create[start:start + chunk_size])
+            apply_task_counter_changes(Counter((task.project_id, task.status) for task in to_create))
+            per_project = Counter(task.project_id for task in to_create)
+            log_activities(
+                user,
+                [
+                    ("imported tasks into", f"{projects[project_id]} ({count} task{'s' if count != 1 else ''})")
+                    for project_id, count in per_project.items()
+                ],
+                tenant.id,
+            )
+            # bulk_create sends no post_save signals.
+            bump_data_version(tenant.id)
+            publish_event(tenant.id, "tasks.created", {"ids": [task.id for task in to_create]})
+
+    errors.sort(key=lambda error: error["index"])
+    return to_create, errors
+
+
+def bulk_update_status(tenant, user, task_ids, normalized):
+    """
+    Move many tasks to `normalized` with one tenant-scoped UPDATE.
+
+    Tasks already in that status are left alone. Counters are adjusted and
+    one activity row per moved task is written in a single INSERT.
+    Returns the ids that were actually changed.
+    """
+    with transaction.atomic():
+        moving = list(
+            Task.objects.select_for_update()
+            .filter(organisation_id=tenant.id, id__in=task_ids)
+            .exclude(status=normalized)
+            .values_list("id", "project_id", "status", "title")
+        )
+        if not moving:
+            return []
+
+        moved_ids = [task_id for task_id, _, _, _ in moving]
+        Task.objects.filter(organisation_id=tenant.id, id__in=moved_ids).update(
+            status=normalized, updated_at=timezone.now()
+        )
+
+        changes = Counter()
+        for _, project_id, previous, _ in moving:
+            changes[(project_id, previous)] -= 1
+            changes[(project_id, normalized)] += 1
+        apply_task_counter_changes(changes)
+
+        action = status_activity_action(normalized)
+        log_activities(user, [(action, title) for _, _, _, title in moving], tenant.id)
+        bump_data_version(tenant.id)
+        publish_event(tenant.id, "tasks.updated", {"ids": moved_ids, "status": normalized})
+    return moved_ids
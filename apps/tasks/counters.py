@@ -0,0 +1,68 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from apps.tasks.models import Task, TaskCounter
+
+
+def adjust_task_counter(project_id, status, delta):
+    """
+    Add `delta` to the (project, status) counter, creating the row if needed.
+    Call inside the transaction that writes the task.
+    """
+    if not delta:
+        return
+    updated = TaskCounter.objects.filter(project_id=project_id, status=status).update(
+        count=F("count") + delta
+    )
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            TaskCounter.objects.create(project_id=project_id, status=status, count=delta)
+    except IntegrityError:
+        # Another writer created the row first.
+        TaskCounter.objects.filter(project_id=project_id, status=status).update(
+            count=F("count") + delta
+        )
+
+
+def apply_task_counter_changes(changes):
+    """
+    Apply a mapping of (project_id, status) -> delta, e.g. from a bulk write.
+    Rows are updated in key order so concurrent writers lock them in the
+    same order and can't deadlock each other.
+    """
+    for (project_id, status), delta in sorted(changes.items()):
+        adjust_task_counter(project_id, status, delta)
+
+
+def move_task_counter(old_key, new_key):
+    if old_key != new_key:
+        apply_task_counter_changes({old_key: -1, new_key: 1})
+
+
+def lock_task_counter_key(task_id):
+    """
+    Re-read a task's (project_id, status) under a row lock, or None if it is
+    gone. Call inside the transaction that changes the task so concurrent
+    writers take their deltas from the committed row, not an earlier read.
+    """
+    return Task.objects.select_for_update().filter(pk=task_id).values_list("project_id", "status").first()
+
+
+def count_tasks_by_project(project_ids=None):
+    """
+    Recount tasks from the tasks table as {(project_id, status): count}.
+    """
+    queryset = Task.objects.all()
+    if project_ids is not None:
+        queryset = queryset.filter(project_id__in=project_ids)
+    rows = queryset.values_list("project_id", "status").annotate(count=Count("id")).order_by()
+    return {(project_id, status): count for project_id, status, count in rows}
+
+
+def read_task_counters(project_ids=None):
+    queryset = TaskCounter.objects.all()
+    if project_ids is not None:
+        queryset = queryset.filter(project_id__in=project_ids)
+    rows = queryset.values_list("project_id", "status", "count")
+    return {(project_id, status): count for project_id, status, count in rows}
@@ -0,0 +1,105 @@
+import csv
+import json
+import logging
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from apps.tasks.serializers import TaskValuesSerializer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Spreadsheet apps run cells starting with these as formulas.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def get_chunk_size():
+    return getattr(settings, "TASK_EXPORT", {}).get("CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+
+class _Line:
+    """
+    File-like target for csv.writer that hands back what was written.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def _ndjson_chunk(items, field_names, writer):
+    return "".join(json.dumps(item, cls=DjangoJSONEncoder) + "\n" for item in items)
+
+
+def _csv_chunk(items, field_names, writer):
+    return "".join(writer.writerow([_csv_cell(item[name]) for name in field_names]) for item in items)
+
+
+FORMATS = {
+    "ndjson": ("application/x-ndjson", _ndjson_chunk),
+    "csv": ("text/csv", _csv_chunk),
+}
+
+
+def stream_tasks(queryset, output, chunk_size=None):
+    """
+    Yield the export as text, one piece per database chunk.
+
+    Rows come from a server-side cursor (.iterator()) as plain values and
+    are rendered like the API's task list, so memory depends on the chunk
+    size only. When the client disconnects the server closes this
+    generator, which closes the cursor straight away.
+    """
+    chunk_size = chunk_size or get_chunk_size()
+    _, render = FORMATS[output]
+    values_serializer = TaskValuesSerializer()
+    field_names = [name for name, _ in values_serializer.fields]
+    rows = values_serializer.values(queryset.order_by("created_at", "id")).iterator(chunk_size=chunk_size)
+    # One writer per export: csv writers keep state and aren't shared between threads.
+    writer = csv.writer(_Line()) if output == "csv" else None
+    exported = 0
+    finished = False
+    try:
+        if output == "csv":
+            yield _csv_chunk([dict(zip(field_names, field_names))], field_names, writer)
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                yield render(values_serializer.to_representation(batch), field_names, writer)
+                exported += len(batch)
+                batch = []
+        if batch:
+            yield render(values_serializer.to_representation(batch), field_names, writer)
+            exported += len(batch)
+        finished = True
+    finally:
+        rows.close()
+        if not finished:
+            logger.info("Task export closed early after %s rows.", exported)
+
+
+async def astream_tasks(queryset, output, chunk_size=None):
+    """
+    stream_tasks for ASGI, where responses are iterated asynchronously.
+
+    Each piece is produced on the request's sync thread, which owns the
+    database connection and its cursor, so the event loop isn't blocked
+    and memory stays bounded by the chunk size as it does under WSGI.
+    """
+    pieces = stream_tasks(queryset, output, chunk_size)
+    next_piece = sync_to_async(next)
+    try:
+        # next()'s default stands in for StopIteration, which can't cross into a coroutine.
+        while (piece := await next_piece(pieces, None)) is not None:
+            yield piece
+    finally:
+        await sync_to_async(pieces.close)()
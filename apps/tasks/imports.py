@@ -0,0 +1,281 @@
+import csv
+import io
+import json
+import uuid
+from collections import Counter
+from datetime import date
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+from apps.organizations.activity import log_activities
+from apps.organizations.versions import bump_data_version
+from apps.projects.models import Project
+from apps.tasks.bulk import normalize_status
+from apps.tasks.counters import apply_task_counter_changes
+from apps.tasks.models import Task
+from core.events import publish_event
+
+DEFAULTS = {
+    "BATCH_SIZE": 5000,
+    "MAX_ERRORS": 1000,
+    "USE_COPY": True,
+}
+FORMATS = ["ndjson", "csv"]
+EXTENSIONS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+TITLE_MAX_LENGTH = Task._meta.get_field("title").max_length
+# Row tuples built by TaskImporter, then organisation_id, created_at, updated_at.
+ROW_COLUMNS = ["id", "project_id", "title", "description", "status", "due_date"]
+INSERT_COLUMNS = [*ROW_COLUMNS, "organisation_id", "created_at", "updated_at"]
+
+
+def get_import_config():
+    return {**DEFAULTS, **getattr(settings, "TASK_IMPORT", {})}
+
+
+def format_for_filename(name):
+    for extension, file_format in EXTENSIONS.items():
+        if name.lower().endswith(extension):
+            return file_format
+    return None
+
+
+def read_rows(binary_file, file_format):
+    """
+    Yield (line, row) pairs from an NDJSON or CSV upload without reading it
+    all into memory. Rows that can't be parsed come back as a string error.
+    """
+    text = io.TextIOWrapper(binary_file, encoding="utf-8-sig", newline="")
+    if file_format == "csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line, raw in enumerate(text, start=1):
+        if not raw.strip():
+            continue
+        try:
+            row = json.loads(raw)
+        except ValueError:
+            yield line, "Invalid JSON."
+            continue
+        yield line, row if isinstance(row, dict) else "Each line must be a JSON object."
+
+
+class TaskImporter:
+    """
+    Validate and insert an organisation's tasks from a stream of rows.
+
+    Projects are resolved by name or id from one query up front. Rows are
+    handled in batches: one query for existing (project, title) pairs, then
+    COPY on PostgreSQL or one executemany INSERT elsewhere, each batch in
+    its own transaction. Rows stay plain tuples throughout; model instances
+    and bulk_create's per-value compilation cost more than the insert.
+
+    A batch that collides with tasks created concurrently is checked again
+    and retried once. Re-running after an interruption reports the rows
+    that already made it as duplicates and inserts the rest.
+    """
+
+    def __init__(self, tenant, user=None, dry_run=False, batch_size=None, max_errors=None, on_error=None):
+        config = get_import_config()
+        self.tenant = tenant
+        self.user = user
+        self.dry_run = dry_run
+        self.batch_size = batch_size or config["BATCH_SIZE"]
+        self.max_errors = config["MAX_ERRORS"] if max_errors is None else max_errors
+        self.use_copy = config["USE_COPY"] and connection.vendor == "postgresql"
+        self.projects = {}
+        self.project_names = {}
+        for project_id, name in Project.objects.filter(organisation_id=tenant.id).values_list("id", "name"):
+            self.projects[str(project_id)] = project_id
+            self.projects.setdefault(name, project_id)
+            self.project_names[project_id] = name
+        self.rows = 0
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        # Called for every failed row, e.g. to write a full error report.
+        self.on_error = on_error
+        self.per_project = Counter()
+        self._seen = set()
+
+    def run(self, rows):
+        batch = []
+        try:
+            for line, row in rows:
+                self.rows += 1
+                task = self._build(line, row)
+                if task is not None:
+                    batch.append((line, task))
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    batch = []
+            if batch:
+                self._flush(batch)
+        finally:
+            # Batches already committed stay, so record them even if a later one failed.
+            if self.created and not self.dry_run:
+                self._finish()
+        return self.report()
+
+    def report(self):
+        return {
+            "rows": self.rows,
+            "created": self.created,
+            "failed": self.failed,
+            "dry_run": self.dry_run,
+            "errors": sorted(self.errors, key=lambda error: error["line"]),
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+    def _error(self, line, errors):
+        self.failed += 1
+        if self.on_error is not None:
+            self.on_error(line, errors)
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "errors": errors})
+
+    def _build(self, line, row):
+        if isinstance(row, str):
+            self._error(line, {"non_field_errors": [row]})
+            return None
+        errors = {}
+
+        title = row.get("title")
+        title = title.strip() if isinstance(title, str) else ""
+        if not title:
+            errors["title"] = ["This field is required."]
+        elif len(title) > TITLE_MAX_LENGTH:
+            errors["title"] = [f"Ensure this field has no more than {TITLE_MAX_LENGTH} characters."]
+
+        project_id = self.projects.get(str(row.get("project") or "").strip())
+        if project_id is None:
+            errors["project"] = ["Unknown project for the active organisation."]
+
+        description = row.get("description") or ""
+        if not isinstance(description, str):
+            errors["description"] = ["Not a valid string."]
+
+        status = normalize_status(row.get("status") or "todo")
+        if status is None:
+            errors["status"] = ["Invalid status."]
+
+        due_date = row.get("due_date") or None
+        if due_date is not None:
+            try:
+                due_date = date.fromisoformat(str(due_date).strip())
+            except ValueError:
+                errors["due_date"] = ["Date has wrong format. Use YYYY-MM-DD."]
+
+        if not errors:
+            key = (project_id, title)
+            if key in self._seen:
+                errors["title"] = ["Duplicate of an earlier row in this file."]
+            else:
+                self._seen.add(key)
+        if errors:
+            self._error(line, errors)
+            return None
+        return (uuid.uuid4(), project_id, title, description, status, due_date)
+
+    def _flush(self, batch):
+        batch = self._without_existing(batch)
+        if batch and not self.dry_run:
+            try:
+                self._write(batch)
+            except IntegrityError:
+                # A concurrent create took some of these titles after the check.
+                batch = self._without_existing(batch)
+                try:
+                    self._write(batch)
+                except IntegrityError:
+                    for line, _ in batch:
+                        self._error(line, {"non_field_errors": ["Conflicted with a concurrent change; import it again."]})
+                    return
+        self.created += len(batch)
+        self.per_project.update(task[1] for _, task in batch)
+
+    def _without_existing(self, batch):
+        existing = set(
+            Task.objects.filter(
+                organisation_id=self.tenant.id,
+                title__in={task[2] for _, task in batch},
+            ).values_list("project_id", "title")
+        )
+        remaining = []
+        for line, task in batch:
+            if task[1:3] in existing:
+                self._error(line, {"title": ["Task with this project and title already exists."]})
+            else:
+                remaining.append((line, task))
+        return remaining
+
+    def _write(self, batch):
+        tasks = [task for _, task in batch]
+        if not tasks:
+            return
+        with transaction.atomic():
+            if self.use_copy:
+                self._copy(tasks)
+            else:
+                self._insert(tasks)
+            apply_task_counter_changes(Counter((task[1], task[4]) for task in tasks))
+
+    def _insert(self, tasks):
+        ops = connection.ops
+        native_uuid = connection.features.has_native_uuid_field
+
+        def to_uuid(value):
+            # What UUIDField.get_db_prep_value does, without the per-value dispatch.
+            return value if native_uuid else value.hex
+
+        now = ops.adapt_datetimefield_value(timezone.now())
+        organisation_id = to_uuid(self.tenant.id)
+        params = [
+            (
+                to_uuid(task_id), to_uuid(project_id), title, description, status,
+                ops.adapt_datefield_value(due_date), organisation_id, now, now,
+            )
+            for task_id, project_id, title, description, status, due_date in tasks
+        ]
+        columns = ", ".join(ops.quote_name(name) for name in INSERT_COLUMNS)
+        placeholders = ", ".join(["%s"] * len(INSERT_COLUMNS))
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {ops.quote_name(Task._meta.db_table)} ({columns}) VALUES ({placeholders})",
+                params,
+            )
+
+    def _copy(self, tasks):
+        now = timezone.now().isoformat()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        organisation_id = self.tenant.id
+        for task in tasks:
+            writer.writerow([*task[:5], task[5] or "", organisation_id, now, now])
+        buffer.seek(0)
+        # Empty CSV fields load as NULL (due_date); the text columns opt out.
+        sql = (
+            f"COPY {Task._meta.db_table} ({', '.join(INSERT_COLUMNS)}) FROM STDIN "
+            "WITH (FORMAT csv, FORCE_NOT_NULL (title, description))"
+        )
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if hasattr(raw, "copy_expert"):
+                raw.copy_expert(sql, buffer)
+            else:
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def _finish(self):
+        log_activities(
+            self.user,
+            [
+                ("imported tasks into", f"{self.project_names[project_id]} ({count} task{'s' if count != 1 else ''})")
+                for project_id, count in self.per_project.items()
+            ],
+            self.tenant.id,
+        )
+        # Raw inserts send no post_save signals.
+        bump_data_version(self.tenant.id)
+        publish_event(self.tenant.id, "tasks.imported", {"created": self.created})
@@ -0,0 +1,75 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from core.database import connection_mode
+
+BENCHMARK_ALIAS = "_connection_benchmark"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request database latency with a new connection per "
+        "request against the configured reuse (CONN_MAX_AGE or pool). Each "
+        "simulated request runs one query between the same connection "
+        "checks Django makes at the start and end of a request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--query", default="SELECT 1")
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+        if alias not in connections.settings:
+            raise CommandError(f"Unknown database alias: {alias}.")
+        configured = connections.settings[alias]
+        per_request = {**configured, "CONN_MAX_AGE": 0, "OPTIONS": {
+            key: value for key, value in configured.get("OPTIONS", {}).items() if key != "pool"
+        }}
+
+        mode = connection_mode(configured)
+        runs = [("per_request", per_request)]
+        if mode != "per_request":
+            runs.append((mode, configured))
+        results = {}
+        for label, settings_dict in runs:
+            results[label] = self._run(settings_dict, options["requests"], options["query"])
+            self.stdout.write(
+                f"{label:>12}  mean {results[label]['mean']:7.3f} ms  "
+                f"p50 {results[label]['p50']:7.3f} ms  p95 {results[label]['p95']:7.3f} ms"
+            )
+
+        if mode == "per_request":
+            self.stdout.write("CONN_MAX_AGE is 0 and no pool is configured; nothing is reused.")
+            return
+        saved = results["per_request"]["mean"] - results[mode]["mean"]
+        self.stdout.write(self.style.SUCCESS(f"Connection reuse saves {saved:.3f} ms per request."))
+
+    def _run(self, settings_dict, requests, query):
+        # A separate alias so the benchmark never closes the command's own connection.
+        connections.settings[BENCHMARK_ALIAS] = settings_dict
+        connection = connections.create_connection(BENCHMARK_ALIAS)
+        timings = []
+        try:
+            for _ in range(requests + 1):
+                started = time.perf_counter()
+                connection.close_if_unusable_or_obsolete()
+                with connection.cursor() as cursor:
+                    cursor.execute(query)
+                    cursor.fetchall()
+                connection.close_if_unusable_or_obsolete()
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connection.close()
+            if getattr(connection, "pool", None) is not None:
+                connection.close_pool()
+            del connections.settings[BENCHMARK_ALIAS]
+        # The first request pays the initial connect in every mode.
+        timings = sorted(timings[1:])
+        return {
+            "mean": statistics.fmean(timings),
+            "p50": timings[len(timings) // 2],
+            "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        }
@@ -0,0 +1,86 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from apps.accounts.models import User
+from apps.organizations.models import Organisation
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskSerializer, TaskValuesSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare TaskSerializer with the .values() list path on generated tasks. "
+        "Runs inside a transaction that is rolled back, so nothing is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per path.")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                project = self._setup()
+                created = 0
+                for rows in sorted(options["rows"]):
+                    created = self._fill(project, created, rows)
+                    self._compare(project, rows, options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _setup(self):
+        owner = User.objects.create_user(email="benchmark@example.invalid", password=None)
+        organisation = Organisation.objects.create(name="Serialization benchmark", owner=owner)
+        return Project.objects.create(organisation=organisation, name="Benchmark")
+
+    def _fill(self, project, created, rows):
+        Task.objects.bulk_create(
+            [
+                Task(
+                    project=project,
+                    organisation_id=project.organisation_id,
+                    title=f"Task {number}",
+                    status=("todo", "in_progress", "done")[number % 3],
+                )
+                for number in range(created, rows)
+            ],
+            batch_size=5000,
+        )
+        return max(created, rows)
+
+    def _compare(self, project, rows, repeat):
+        queryset = Task.objects.filter(organisation_id=project.organisation_id).order_by("created_at", "id")
+        renderer = JSONRenderer()
+
+        def model_path():
+            return renderer.render(TaskSerializer(list(queryset), many=True).data)
+
+        def values_path():
+            values_serializer = TaskValuesSerializer()
+            return renderer.render(values_serializer.to_representation(list(values_serializer.values(queryset))))
+
+        expected, model_seconds = self._time(model_path, repeat)
+        actual, values_seconds = self._time(values_path, repeat)
+        if actual != expected:
+            raise CommandError(f"Outputs differ at {rows} rows.")
+        self.stdout.write(
+            f"{rows:>7} rows  serializer {model_seconds * 1000:8.1f} ms  "
+            f"values {values_seconds * 1000:8.1f} ms  x{model_seconds / values_seconds:.1f}"
+        )
+
+    @staticmethod
+    def _time(run, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            output = run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return output, best
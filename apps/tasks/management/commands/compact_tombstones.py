@@ -0,0 +1,42 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.tasks.models import Tombstone
+from apps.tasks.sync import get_sync_config
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete sync tombstones older than the retention window, in batches. "
+        "Clients holding an older sync token get 410 and reload."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Keep this many days of tombstones (SYNC['TOMBSTONE_RETENTION_DAYS']).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would be deleted.")
+
+    def handle(self, *args, **options):
+        days = options["days"] or get_sync_config()["TOMBSTONE_RETENTION_DAYS"]
+        cutoff = timezone.now() - timedelta(days=days)
+        expired = Tombstone.objects.filter(deleted_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"{expired.count()} tombstones older than {cutoff:%Y-%m-%d}."))
+            return
+
+        total = 0
+        while True:
+            ids = list(expired.order_by("id").values_list("id", flat=True)[: options["batch_size"]])
+            if not ids:
+                break
+            total += Tombstone.objects.filter(id__in=ids).delete()[0]
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {total} tombstones older than {cutoff:%Y-%m-%d}."))
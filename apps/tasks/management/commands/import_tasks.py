@@ -0,0 +1,72 @@
+import json
+import time
+from contextlib import ExitStack
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from apps.accounts.models import User
+from apps.organizations.models import Organisation
+from apps.tasks.imports import FORMATS, TaskImporter, format_for_filename, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks for one organisation from an NDJSON or CSV file. Projects "
+        "are matched by name or id; rows that fail validation are reported."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--org", required=True, help="Organisation id.")
+        parser.add_argument("--user", help="Email of the user the activity is attributed to.")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, help="Rows per insert (TASK_IMPORT['BATCH_SIZE']).")
+        parser.add_argument("--report", help="Write every failed row to this NDJSON file.")
+        parser.add_argument("--dry-run", action="store_true", help="Validate only; nothing is written.")
+
+    def handle(self, *args, **options):
+        try:
+            tenant = Organisation.objects.filter(id=options["org"]).first()
+        except ValidationError:
+            tenant = None
+        if tenant is None:
+            raise CommandError(f"Organisation {options['org']} not found.")
+        user = None
+        if options["user"]:
+            user = User.objects.filter(email=options["user"]).first()
+            if user is None:
+                raise CommandError(f"User {options['user']} not found.")
+        file_format = options["format"] or format_for_filename(options["path"])
+        if file_format is None:
+            raise CommandError("Could not tell the format from the file name; pass --format.")
+
+        def write_error(line, errors):
+            report_file.write(json.dumps({"line": line, "errors": errors}) + "\n")
+
+        started = time.monotonic()
+        with ExitStack() as stack:
+            handle = stack.enter_context(open(options["path"], "rb"))
+            report_file = None
+            if options["report"]:
+                report_file = stack.enter_context(open(options["report"], "w", encoding="utf-8"))
+            importer = TaskImporter(
+                tenant,
+                user,
+                dry_run=options["dry_run"],
+                batch_size=options["batch_size"],
+                max_errors=0 if report_file else 20,
+                on_error=write_error if report_file else None,
+            )
+            report = importer.run(read_rows(handle, file_format))
+        elapsed = max(time.monotonic() - started, 1e-6)
+
+        for error in report["errors"]:
+            self.stdout.write(f"line {error['line']}: {json.dumps(error['errors'])}")
+        if report["errors_truncated"] and not report_file:
+            self.stdout.write("... more errors not shown; use --report to write them all.")
+        verb = "would be imported" if options["dry_run"] else "imported"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{report['created']} of {report['rows']} rows {verb}, {report['failed']} failed "
+                f"in {elapsed:.1f}s ({report['rows'] / elapsed:.0f} rows/s)."
+            )
+        )
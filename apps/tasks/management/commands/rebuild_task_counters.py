@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.organizations.versions import bump_data_version
+from apps.projects.models import Project
+from apps.tasks.counters import count_tasks_by_project, read_task_counters
+from apps.tasks.models import TaskCounter
+
+
+class Command(BaseCommand):
+    help = "Rebuild per-project task counters from the tasks table, or verify them with --verify."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--org", help="Limit to one organisation id.")
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report counters that differ from the tasks table without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        project_ids = None
+        if options["org"]:
+            project_ids = list(
+                Project.objects.filter(organisation_id=options["org"]).values_list("id", flat=True)
+            )
+
+        with transaction.atomic():
+            if not options["verify"]:
+                # Lock the counter rows so concurrent task writes wait for the rebuild.
+                list(self._counters(project_ids).select_for_update().values_list("id", flat=True))
+            expected = count_tasks_by_project(project_ids)
+            actual = read_task_counters(project_ids)
+            mismatches = {
+                key: (actual.get(key, 0), expected.get(key, 0))
+                for key in set(expected) | set(actual)
+                if actual.get(key, 0) != expected.get(key, 0)
+            }
+
+            if options["verify"]:
+                for (project_id, status), (stored, counted) in sorted(mismatches.items(), key=str):
+                    self.stdout.write(f"{project_id} {status}: stored={stored} actual={counted}")
+                if mismatches:
+                    self.stdout.write(self.style.WARNING(f"{len(mismatches)} counters out of date."))
+                else:
+                    self.stdout.write(self.style.SUCCESS("All task counters match."))
+                return
+
+            self._counters(project_ids).delete()
+            TaskCounter.objects.bulk_create(
+                [
+                    TaskCounter(project_id=project_id, status=status, count=count)
+                    for (project_id, status), count in expected.items()
+                ],
+                batch_size=1000,
+            )
+            # Project lists show these counts, so their ETags must change too.
+            corrected = {project_id for project_id, _ in mismatches}
+            for org_id in set(
+                Project.objects.filter(id__in=corrected).values_list("organisation_id", flat=True)
+            ):
+                bump_data_version(org_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {len(expected)} task counters ({len(mismatches)} corrected).")
+        )
+
+    def _counters(self, project_ids):
+        queryset = TaskCounter.objects.all()
+        if project_ids is not None:
+            queryset = queryset.filter(project_id__in=project_ids)
+        return queryset
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0005_activity"),
+        ("tasks", "0002_task_tasks_project_a56d01_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="organisation",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tasks",
+                to="organizations.organisation",
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 5000
+
+
+def backfill_task_organisation(apps, schema_editor):
+    """
+    Copy project.organisation_id onto tasks in primary-key batches so each
+    UPDATE stays short and commits on its own (the migration is non-atomic).
+    """
+    Task = apps.get_model("tasks", "Task")
+    Project = apps.get_model("projects", "Project")
+    organisation_of_project = Project.objects.filter(id=OuterRef("project_id")).values("organisation_id")[:1]
+
+    while True:
+        batch = list(
+            Task.objects.filter(organisation__isnull=True)
+            .order_by("id")
+            .values_list("id", flat=True)[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        Task.objects.filter(id__in=batch).update(organisation_id=Subquery(organisation_of_project))
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("projects", "0002_project_projects_organis_cb765f_idx"),
+        ("tasks", "0003_task_organisation"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_task_organisation, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0005_activity"),
+        ("tasks", "0004_backfill_task_organisation"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="task",
+            name="organisation",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tasks",
+                to="organizations.organisation",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["organisation", "created_at", "id"], name="tasks_organis_e15757_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["organisation", "status", "created_at"], name="tasks_organis_8b8360_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_task_counters(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    TaskCounter = apps.get_model("tasks", "TaskCounter")
+    rows = Task.objects.values_list("project_id", "status").annotate(count=Count("id")).order_by()
+    TaskCounter.objects.bulk_create(
+        [TaskCounter(project_id=project_id, status=status, count=count) for project_id, status, count in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0002_project_projects_organis_cb765f_idx"),
+        ("tasks", "0005_alter_task_organisation_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskCounter",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("status", models.CharField(max_length=50)),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="task_counters",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "task_counters",
+                "unique_together": {("project", "status")},
+            },
+        ),
+        migrations.RunPython(populate_task_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 6.0.1 on 2026-10-18 16:20
+
+from django.db import migrations, transaction
+
+# PostgreSQL keeps the vector itself in a column filled by a trigger, so
+# every write path (ORM, bulk_create, COPY, raw SQL) stays in step. A STORED
+# generated column would do the same but rewrites the whole table under an
+# ACCESS EXCLUSIVE lock; a nullable column is added without a rewrite,
+# existing rows are filled in small batches and the index is built
+# CONCURRENTLY, so reads and writes carry on throughout.
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')"
+)
+BATCH_SIZE = 5000
+
+POSTGRES_FORWARD = [
+    "ALTER TABLE tasks ADD COLUMN search_vector tsvector",
+    f"""
+    CREATE FUNCTION tasks_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {SEARCH_VECTOR.format(row="NEW.")};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER tasks_search_vector_update BEFORE INSERT OR UPDATE OF title, description ON tasks
+    FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_update()
+    """,
+]
+POSTGRES_BACKFILL = f"""
+    UPDATE tasks SET search_vector = {SEARCH_VECTOR.format(row="")}
+    WHERE id IN (SELECT id FROM tasks WHERE id > %s ORDER BY id LIMIT %s)
+    RETURNING id
+"""
+# An interrupted CONCURRENTLY build leaves an invalid index behind; drop
+# it before retrying.
+POSTGRES_INDEX = "CREATE INDEX CONCURRENTLY IF NOT EXISTS tasks_search_vector_gin ON tasks USING GIN (search_vector)"
+POSTGRES_BACKWARD = [
+    "DROP TRIGGER IF EXISTS tasks_search_vector_update ON tasks",
+    "DROP FUNCTION IF EXISTS tasks_search_vector_update()",
+    "ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector",
+]
+
+# SQLite (dev and tests): an FTS5 table kept in step by triggers.
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE tasks_fts USING fts5(
+        task_id UNINDEXED, title, description, tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (task_id, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+        UPDATE tasks_fts SET title = new.title, description = new.description WHERE task_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        DELETE FROM tasks_fts WHERE task_id = old.id;
+    END
+    """,
+    "INSERT INTO tasks_fts (task_id, title, description) SELECT id, title, description FROM tasks",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS tasks_fts_insert",
+    "DROP TRIGGER IF EXISTS tasks_fts_update",
+    "DROP TRIGGER IF EXISTS tasks_fts_delete",
+    "DROP TABLE IF EXISTS tasks_fts",
+]
+
+
+def _run(schema_editor, statements):
+    with transaction.atomic(using=schema_editor.connection.alias):
+        with schema_editor.connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+
+def _backfill_search_vector(schema_editor):
+    """
+    Fill search_vector for existing rows in primary-key batches, each its
+    own short statement (the migration is non-atomic). The trigger already
+    covers rows written meanwhile.
+    """
+    last_id = "00000000-0000-0000-0000-000000000000"
+    while True:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(POSTGRES_BACKFILL, [last_id, BATCH_SIZE])
+            batch = [row[0] for row in cursor.fetchall()]
+        if not batch:
+            return
+        last_id = max(batch)
+
+
+def add_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+        _backfill_search_vector(schema_editor)
+        # CONCURRENTLY can't run inside a transaction block.
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(POSTGRES_INDEX)
+    elif vendor == "sqlite":
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def remove_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("DROP INDEX CONCURRENTLY IF EXISTS tasks_search_vector_gin")
+        _run(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == "sqlite":
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    # The backfill commits per batch and the index is built CONCURRENTLY.
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0007_task_updated_at_tombstone'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_index, remove_search_index),
+    ]
@@ -1,6 +1,7 @@
 # apps/tasks/models.py
 import uuid
 from django.db import models
+from apps.organizations.models import Organisation
 from apps.projects.models import Project
 
 class Task(models.Model):
@@ -9,6 +10,13 @@ class Task(models.Model):
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="tasks")
+    # Denormalised from project.organisation so tenant filters skip the projects join.
+    organisation = models.ForeignKey(
+        Organisation,
+        on_delete=models.CASCADE,
+        related_name="tasks",
+        editable=False,
+    )
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     status = models.CharField(
@@ -22,6 +30,7 @@ class Task(models.Model):
     )
     due_date = models.DateField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "tasks"
@@ -29,8 +38,66 @@ class Task(models.Model):
         indexes = [
             models.Index(fields=["project", "created_at"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["organisation", "created_at", "id"]),
+            models.Index(fields=["organisation", "status", "created_at"]),
+            models.Index(fields=["organisation", "updated_at"]),
         ]
 
+    def save(self, *args, **kwargs):
+        """
+        Keep organisation in step with project on create and project moves.
+        Saves limited to other update_fields don't touch (or load) the project,
+        but always refresh updated_at so delta sync sees the change.
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = kwargs["update_fields"] = {*update_fields, "updated_at"}
+        if update_fields is None or "project" in update_fields:
+            self.organisation_id = self.project.organisation_id
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "organisation"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.title} ({self.project.name})"
 
+
+
+class TaskCounter(models.Model):
+    """
+    Number of tasks per (project, status), maintained alongside task writes.
+    """
+    id = models.BigAutoField(primary_key=True)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="task_counters")
+    status = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "task_counters"
+        unique_together = ("project", "status")
+
+    def __str__(self):
+        return f"{self.project_id} {self.status}: {self.count}"
+
+
+class Tombstone(models.Model):
+    """
+    Marks a deleted task or project so delta sync can report the deletion.
+    org_id is a plain value, not a foreign key, so rows outlive the cascade
+    that removed them; compact_tombstones drops them after the retention window.
+    """
+    id = models.BigAutoField(primary_key=True)
+    org_id = models.UUIDField()
+    model = models.CharField(max_length=20, choices=[("task", "Task"), ("project", "Project")])
+    object_id = models.UUIDField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "tombstones"
+        indexes = [
+            models.Index(fields=["org_id", "deleted_at"]),
+            models.Index(fields=["deleted_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id} deleted {self.deleted_at:%Y-%m-%d}"
@@ -0,0 +1,63 @@
+import re
+from django.db import connections
+from django.db.models import BooleanField, Case, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from apps.tasks.models import Task
+
+# Must match the configuration of the search_vector trigger (migration 0008).
+SEARCH_CONFIG = "english"
+MAX_QUERY_LENGTH = 200
+
+
+def fts5_query(query):
+    """
+    Turn free text into an FTS5 expression that can't be a syntax error:
+    every word is quoted, and all of them must match.
+    """
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
+
+
+def search_tasks(queryset, query):
+    """
+    Filter `queryset` to tasks matching `query` and annotate `rank` (higher
+    is better), ordered by rank then id.
+
+    PostgreSQL uses the GIN-indexed search_vector column, SQLite the
+    tasks_fts table; other databases fall back to icontains.
+    """
+    table = Task._meta.db_table
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        tsquery = f"websearch_to_tsquery('{SEARCH_CONFIG}', %s)"
+        queryset = queryset.filter(
+            RawSQL(f"{table}.search_vector @@ {tsquery}", [query], output_field=BooleanField())
+        ).annotate(
+            rank=RawSQL(f"ts_rank_cd({table}.search_vector, {tsquery})", [query], output_field=FloatField())
+        )
+    elif vendor == "sqlite":
+        match = fts5_query(query)
+        if not match:
+            return queryset.none()
+        # The MATCH in the IN subquery runs once. bm25() is only available
+        # next to a MATCH, so the rank repeats it per matching task; fine for
+        # the development databases SQLite serves here.
+        queryset = queryset.filter(
+            RawSQL(
+                f"{table}.id IN (SELECT task_id FROM tasks_fts WHERE tasks_fts MATCH %s)",
+                [match],
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            # bm25() is lower-is-better; title hits weigh ten times description hits.
+            rank=RawSQL(
+                "(SELECT -bm25(tasks_fts, 0.0, 10.0, 1.0) FROM tasks_fts "
+                f"WHERE tasks_fts MATCH %s AND tasks_fts.task_id = {table}.id)",
+                [match],
+                output_field=FloatField(),
+            )
+        )
+    else:
+        queryset = queryset.filter(Q(title__icontains=query) | Q(description__icontains=query)).annotate(
+            rank=Case(When(title__icontains=query, then=Value(2.0)), default=Value(1.0), output_field=FloatField())
+        )
+    return queryset.order_by("-rank", "id")
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from apps.tasks.models import Task
+from core.serialization import ValuesSerializer
 
 class TaskSerializer(serializers.ModelSerializer):
     """
@@ -8,4 +9,32 @@ class TaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = "__all__"
-        read_only_fields = []  # project provided by client, validated in viewset
+        read_only_fields = ["organisation"]  # derived from project, which is validated in viewset
+
+
+class BulkTaskItemSerializer(serializers.Serializer):
+    """
+    One row of a bulk create. The project is a plain UUID so ownership can be
+    checked for the whole batch in one query.
+    """
+    project = serializers.UUIDField()
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+    status = serializers.ChoiceField(choices=Task._meta.get_field("status").choices, default="todo")
+    due_date = serializers.DateField(required=False, allow_null=True, default=None)
+
+
+class BulkTaskCreateSerializer(serializers.Serializer):
+    tasks = serializers.ListField(child=serializers.DictField(), allow_empty=False, max_length=1000)
+
+
+class BulkTaskStatusSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=1000)
+    status = serializers.CharField()
+
+
+class TaskValuesSerializer(ValuesSerializer):
+    """
+    Fast list representation, identical to TaskSerializer's.
+    """
+    serializer_class = TaskSerializer
@@ -0,0 +1,54 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from apps.organizations.models import Organisation
+from apps.organizations.versions import bump_data_version
+from apps.projects.models import Project
+from apps.tasks.models import Task, Tombstone
+
+
+def _deleted_via(origin, model):
+    if isinstance(origin, QuerySet):
+        return origin.model is model
+    return isinstance(origin, model)
+
+
+@receiver(pre_delete, sender=Project, dispatch_uid="tasks.project_task_tombstones")
+def project_deleting(sender, instance, origin=None, **kwargs):
+    # One INSERT for the project's tasks instead of one per cascaded row.
+    if _deleted_via(origin, Organisation):
+        return
+    Tombstone.objects.bulk_create([
+        Tombstone(org_id=org_id, model="task", object_id=task_id)
+        for task_id, org_id in Task.objects.filter(project=instance).values_list("id", "organisation_id")
+    ])
+
+
+@receiver(post_delete, sender=Project, dispatch_uid="tasks.project_tombstone")
+def project_deleted(sender, instance, origin=None, **kwargs):
+    # Nobody syncs an organisation that no longer exists.
+    if _deleted_via(origin, Organisation):
+        return
+    Tombstone.objects.create(org_id=instance.organisation_id, model="project", object_id=instance.pk)
+
+
+@receiver(post_delete, sender=Task, dispatch_uid="tasks.task_tombstone")
+def task_deleted(sender, instance, origin=None, **kwargs):
+    if _deleted_via(origin, Organisation) or _deleted_via(origin, Project):
+        return
+    Tombstone.objects.create(org_id=instance.organisation_id, model="task", object_id=instance.pk)
+
+
+@receiver(post_save, sender=Task, dispatch_uid="tasks.task_version")
+@receiver(post_save, sender=Project, dispatch_uid="tasks.project_version")
+def task_or_project_saved(sender, instance, **kwargs):
+    bump_data_version(instance.organisation_id)
+
+
+@receiver(post_delete, sender=Task, dispatch_uid="tasks.task_delete_version")
+@receiver(post_delete, sender=Project, dispatch_uid="tasks.project_delete_version")
+def task_or_project_deleted(sender, instance, origin=None, **kwargs):
+    # A cascade is covered by the bump for the object that was deleted.
+    if _deleted_via(origin, Organisation) or (sender is Task and _deleted_via(origin, Project)):
+        return
+    bump_data_version(instance.organisation_id)
@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from apps.organizations.versions import get_data_version
+from apps.projects.models import Project
+from apps.tasks.models import Task, TaskCounter
+
+STATUSES = ["todo", "in_progress", "done"]
+
+
+def _cache_key(org_id, version, today):
+    return f"dashboard-stats:{org_id}:{version}:{today.isoformat()}"
+
+
+def compute_dashboard_stats(org_id, today=None):
+    """
+    Dashboard counters for one organisation in three queries: projects, the
+    maintained (project, status) task counters, and overdue tasks.
+    """
+    projects = list(
+        Project.objects.filter(organisation_id=org_id)
+        .order_by("-created_at")
+        .values_list("id", "name")
+    )
+    per_project = {
+        project_id: {"id": str(project_id), "name": name, "total": 0, **{s: 0 for s in STATUSES}}
+        for project_id, name in projects
+    }
+    by_status = {s: 0 for s in STATUSES}
+
+    grouped = TaskCounter.objects.filter(project__organisation_id=org_id).values_list(
+        "project_id", "status", "count"
+    )
+    for project_id, task_status, count in grouped:
+        by_status[task_status] = by_status.get(task_status, 0) + count
+        entry = per_project.get(project_id)
+        if entry is not None:
+            entry[task_status] = entry.get(task_status, 0) + count
+            entry["total"] += count
+
+    overdue = (
+        Task.objects.filter(organisation_id=org_id, due_date__lt=today or timezone.localdate())
+        .exclude(status="done")
+        .count()
+    )
+
+    return {
+        "projects": len(projects),
+        "tasks": {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "overdue": overdue,
+        },
+        "by_project": list(per_project.values()),
+    }
+
+
+def get_dashboard_stats(org_id):
+    """
+    Cached per organisation data version, which every task, project and
+    counter write bumps in the database. Each worker therefore misses on its
+    first read after any write, wherever it happened, with no invalidation
+    step. The date is part of the key because it moves the overdue count.
+    """
+    today = timezone.localdate()
+    key = _cache_key(org_id, get_data_version(org_id), today)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_dashboard_stats(org_id, today)
+        cache.set(key, stats, getattr(settings, "DASHBOARD_STATS_TIMEOUT", 300))
+    return stats
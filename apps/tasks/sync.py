@@ -0,0 +1,154 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from apps.projects.models import Project
+from apps.tasks.models import Task, Tombstone
+from core.pagination import KeysetPagination
+
+DEFAULTS = {
+    "OVERLAP_SECONDS": 5,
+    "PAGE_SIZE": 500,
+    "TOMBSTONE_RETENTION_DAYS": 30,
+}
+
+# What each part of a sync response pages through, oldest write first.
+FEEDS = {
+    "projects": ("updated_at", "id"),
+    "tasks": ("updated_at", "id"),
+    "deleted": ("deleted_at", "id"),
+}
+
+
+class SyncTokenExpired(Exception):
+    """The token predates the tombstone retention window; the client must reload."""
+
+
+def get_sync_config():
+    return {**DEFAULTS, **getattr(settings, "SYNC", {})}
+
+
+def commit_watermark(now=None):
+    """
+    A moment before which every write is committed: the start of the oldest
+    transaction still open on PostgreSQL, or `now` if none is older. Rows a
+    long transaction wrote early but commits late carry updated_at values
+    after its start, so a token taken here never skips them.
+
+    Other databases can't list open transactions and fall back to `now`;
+    there OVERLAP_SECONDS is the only cover for late commits.
+    """
+    now = now or timezone.now()
+    if connection.vendor != "postgresql":
+        return now
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT min(xact_start) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND backend_type = 'client backend' "
+            "AND pid <> pg_backend_pid() AND xact_start IS NOT NULL"
+        )
+        (oldest,) = cursor.fetchone()
+    return min(now, oldest) if oldest else now
+
+
+def encode_sync_token(moment, resume=None):
+    value = {"t": moment.isoformat()}
+    if resume:
+        value["r"] = resume
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+def initial_sync_token():
+    return encode_sync_token(commit_watermark())
+
+
+def decode_sync_token(raw):
+    """
+    Return (since, resume): the moment the client last synced to, and for
+    a page that had more to send, where each feed continues plus the
+    watermark of the next token.
+    """
+    try:
+        value = json.loads(base64.urlsafe_b64decode(raw.encode()).decode())
+        moment = datetime.fromisoformat(value["t"])
+        resume = value.get("r")
+        if resume is not None:
+            datetime.fromisoformat(resume["w"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError, AttributeError):
+        raise ValidationError({"since": "Invalid sync token."})
+    if timezone.is_naive(moment):
+        raise ValidationError({"since": "Invalid sync token."})
+    return moment, resume
+
+
+def _page(queryset, ordering, lower, position, limit):
+    keyset = KeysetPagination()
+    keyset.ordering = ordering
+    keyset.bind(queryset.model)
+    queryset = queryset.filter(**{f"{ordering[0]}__gt": lower}).order_by(*ordering)
+    if position is not None:
+        try:
+            if not isinstance(position, list) or len(position) != len(keyset.fields):
+                raise ValueError
+            position = [field.to_python(value) for field, value in zip(keyset.fields, position)]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise ValidationError({"since": "Invalid sync token."})
+        queryset = queryset.filter(keyset.seek_filter(position))
+    rows = list(queryset[: limit + 1])
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return rows, keyset.position_for(rows[-1]) if rows else position, more
+
+
+def collect_changes(org_id, since, resume=None):
+    """
+    Projects and tasks written, and ids deleted, in the organisation since
+    `since`, plus the token for the next call.
+
+    Each part is paged by (updated_at, id), at most PAGE_SIZE rows per call.
+    While `has_more` is true the token continues the same window; once it
+    is false the token starts the next window at the commit watermark taken
+    on the window's first call. OVERLAP_SECONDS on top covers clock skew
+    between app servers and the database. Rows may repeat; clients upsert
+    by id.
+    """
+    config = get_sync_config()
+    if since < timezone.now() - timedelta(days=config["TOMBSTONE_RETENTION_DAYS"]):
+        raise SyncTokenExpired()
+    lower = since - timedelta(seconds=config["OVERLAP_SECONDS"])
+    resume = resume or {"w": commit_watermark().isoformat()}
+
+    querysets = {
+        "projects": Project.objects.filter(organisation_id=org_id).prefetch_related("task_counters"),
+        "tasks": Task.objects.filter(organisation_id=org_id),
+        "deleted": Tombstone.objects.filter(org_id=org_id).values("id", "deleted_at", "model", "object_id"),
+    }
+    changes = {}
+    positions = {}
+    has_more = False
+    for name, ordering in FEEDS.items():
+        rows, positions[name], more = _page(
+            querysets[name], ordering, lower, resume.get(name), config["PAGE_SIZE"]
+        )
+        changes[name] = rows
+        has_more = has_more or more
+
+    deleted = {"projects": [], "tasks": []}
+    for row in changes["deleted"]:
+        deleted[f"{row['model']}s"].append(row["object_id"])
+    if has_more:
+        token = encode_sync_token(since, {**positions, "w": resume["w"]})
+    else:
+        token = encode_sync_token(datetime.fromisoformat(resume["w"]))
+    return {
+        "projects": changes["projects"],
+        "tasks": changes["tasks"],
+        "deleted": deleted,
+        "has_more": has_more,
+        "token": token,
+    }
@@ -1,3 +1,728 @@
-from django.test import TestCase
+import asyncio
+import json
+import os
+import tempfile
+import uuid
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.accounts.models import User
+from apps.organizations.models import Organisation, OrganisationMember
+from apps.projects.models import Project
+from apps.projects.serializers import ProjectSerializer, ProjectValuesSerializer
+from apps.tasks.bulk import bulk_update_status
+from apps.tasks.export import astream_tasks, stream_tasks
+from apps.tasks.imports import TaskImporter
+from apps.tasks.counters import adjust_task_counter, move_task_counter
+from apps.tasks.models import Task, TaskCounter, Tombstone
+from apps.tasks.serializers import TaskSerializer, TaskValuesSerializer
+from apps.tasks.sync import encode_sync_token as sync_token
+from apps.tasks.views import TaskViewSet
+from core import events
+from core.database import connection_mode, database_stats
+from core.membership_cache import membership_cache
+from core.response_cache import get_response_cache
 
-# Create your tests here.
+
+class TaskAPITestCase(TestCase):
+    def setUp(self):
+        membership_cache.clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="Str0ng-pass!")
+        self.org = Organisation.objects.create(name="Acme", owner=self.user)
+        OrganisationMember.objects.create(user=self.user, organisation=self.org, role="owner")
+        self.project = Project.objects.create(organisation=self.org, name="Website")
+        self.client = self.client_for(self.user, self.org)
+        self.client.post("/api/tasks/", {"title": "Landing page", "project": str(self.project.id)}, format="json")
+
+    def client_for(self, user, org):
+        client = APIClient()
+        token = RefreshToken.for_user(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_X_ORG_ID=str(org.id))
+        return client
+
+
+class TaskListAuthQueryTests(TaskAPITestCase):
+    def users_queries(self, context):
+        return [q for q in context.captured_queries if '"users"' in q["sql"]]
+
+    def test_list_loads_user_once(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(self.users_queries(context)), 1)
+
+    @override_settings(TENANT_AUTH={"TOKEN_USER_READS": True, "TOKEN_USER_PATHS": ["/api/tasks/"]})
+    def test_token_user_mode_skips_users_table(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.users_queries(context)), 0)
+
+    @override_settings(TENANT_AUTH={"TOKEN_USER_READS": True, "TOKEN_USER_PATHS": ["/api/tasks/"]})
+    def test_token_user_mode_loads_user_for_writes(self):
+        response = self.client.post(
+            "/api/tasks/",
+            {"title": "Pricing page", "project": str(self.project.id)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+
+class TaskListPaginationTests(TaskAPITestCase):
+    def test_cursor_walks_every_task_once(self):
+        for index in range(4):
+            Task.objects.create(project=self.project, title=f"Task {index}")
+
+        seen = []
+        url = "/api/tasks/?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+
+        expected = list(Task.objects.order_by("created_at", "id").values_list("id", flat=True))
+        self.assertEqual(seen, [str(task_id) for task_id in expected])
+
+    def test_seek_starts_an_index_range_and_handles_ties(self):
+        for index in range(4):
+            Task.objects.create(project=self.project, title=f"Task {index}")
+        Task.objects.update(created_at=timezone.now())
+
+        first = self.client.get("/api/tasks/?page_size=2")
+        with CaptureQueriesContext(connection) as context:
+            second = self.client.get(first.data["next"])
+        task_queries = [q["sql"] for q in context.captured_queries if '"tasks"."created_at" >=' in q["sql"]]
+        self.assertEqual(len(task_queries), 1)
+        third = self.client.get(second.data["next"])
+        self.assertIsNone(third.data["next"])
+        seen = [task["id"] for page in (first, second, third) for task in page.data["results"]]
+        expected = Task.objects.order_by("created_at", "id").values_list("id", flat=True)
+        self.assertEqual(seen, [str(task_id) for task_id in expected])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get("/api/tasks/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskOrganisationTests(TaskAPITestCase):
+    def test_organisation_follows_project(self):
+        task = Task.objects.get(title="Landing page")
+        self.assertEqual(task.organisation_id, self.org.id)
+
+        other_org = Organisation.objects.create(name="Globex", owner=self.user)
+        other_project = Project.objects.create(organisation=other_org, name="Intranet")
+        task.project = other_project
+        task.save()
+        task.refresh_from_db()
+        self.assertEqual(task.organisation_id, other_org.id)
+
+    def test_update_rejects_project_from_other_tenant(self):
+        task = Task.objects.get(title="Landing page")
+        other_org = Organisation.objects.create(name="Globex", owner=self.user)
+        other_project = Project.objects.create(organisation=other_org, name="Intranet")
+        response = self.client.patch(
+            f"/api/tasks/{task.id}/", {"project": str(other_project.id)}, format="json"
+        )
+        self.assertEqual(response.status_code, 403)
+        task.refresh_from_db()
+        self.assertEqual(task.organisation_id, self.org.id)
+
+
+class TaskStatsTests(TaskAPITestCase):
+    def test_stats_are_invalidated_by_writes(self):
+        response = self.client.get("/api/tasks/stats/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["projects"], 1)
+        self.assertEqual(response.data["tasks"]["by_status"]["todo"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.get(title="Landing page")
+            self.client.patch(f"/api/tasks/{task.id}/status/", {"status": "done"}, format="json")
+
+        response = self.client.get("/api/tasks/stats/")
+        self.assertEqual(response.data["tasks"]["by_status"], {"todo": 0, "in_progress": 0, "done": 1})
+        self.assertEqual(response.data["by_project"][0]["done"], 1)
+
+    def test_writes_outside_the_api_refresh_stats(self):
+        self.assertEqual(self.client.get("/api/tasks/stats/").data["projects"], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(organisation=self.org, name="Intranet")
+        self.assertEqual(self.client.get("/api/tasks/stats/").data["projects"], 2)
+
+
+class TaskCounterTests(TaskAPITestCase):
+    def counts(self):
+        return dict(
+            TaskCounter.objects.filter(project=self.project).values_list("status", "count")
+        )
+
+    def test_counters_follow_create_status_and_delete(self):
+        self.assertEqual(self.counts(), {"todo": 1})
+        task = Task.objects.get(title="Landing page")
+        self.client.patch(f"/api/tasks/{task.id}/status/", {"status": "in_progress"}, format="json")
+        self.assertEqual(self.counts(), {"todo": 0, "in_progress": 1})
+        self.client.delete(f"/api/tasks/{task.id}/")
+        self.assertEqual(self.counts(), {"todo": 0, "in_progress": 0})
+
+    def test_stale_reads_do_not_move_counters_twice(self):
+        stale = Task.objects.get(title="Landing page")
+        # Another request moved the task to done and committed first.
+        Task.objects.filter(pk=stale.pk).update(status="done")
+        move_task_counter((self.project.id, "todo"), (self.project.id, "done"))
+        with mock.patch.object(TaskViewSet, "get_object", return_value=stale):
+            response = self.client.patch(f"/api/tasks/{stale.id}/status/", {"status": "done"}, format="json")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(self.counts(), {"todo": 0, "done": 1})
+
+            # ...and then deleted it.
+            Task.objects.filter(pk=stale.pk).delete()
+            adjust_task_counter(self.project.id, "done", -1)
+            self.client.delete(f"/api/tasks/{stale.id}/")
+            self.assertEqual(self.counts(), {"todo": 0, "done": 0})
+
+    def test_counter_rows_are_updated_in_one_order(self):
+        def statuses_updated(old, new):
+            with CaptureQueriesContext(connection) as context:
+                move_task_counter((self.project.id, old), (self.project.id, new))
+            updates = [q["sql"] for q in context.captured_queries if q["sql"].startswith('UPDATE "task_counters"')]
+            return [status for sql in updates for status in ("done", "todo") if f"'{status}'" in sql]
+
+        self.assertEqual(statuses_updated("todo", "done"), ["done", "todo"])
+        self.assertEqual(statuses_updated("done", "todo"), ["done", "todo"])
+
+    def test_rebuild_command_repairs_drift(self):
+        Task.objects.create(project=self.project, title="Created outside the API")
+        out = StringIO()
+        call_command("rebuild_task_counters", "--verify", stdout=out)
+        self.assertIn("1 counters out of date", out.getvalue())
+
+        call_command("rebuild_task_counters", stdout=StringIO())
+        self.assertEqual(self.counts(), {"todo": 2})
+
+
+class TaskBulkCreateTests(TaskAPITestCase):
+    def test_bulk_create_reports_per_row_errors(self):
+        other_org = Organisation.objects.create(name="Globex", owner=self.user)
+        foreign = Project.objects.create(organisation=other_org, name="Intranet")
+        payload = {"tasks": [
+            {"project": str(self.project.id), "title": "Pricing page"},
+            {"project": str(self.project.id), "title": "Landing page"},
+            {"project": str(foreign.id), "title": "Sneaky"},
+            {"project": str(self.project.id), "title": "Pricing page"},
+            {"project": str(self.project.id), "title": "Blog", "status": "done"},
+        ]}
+        response = self.client.post("/api/tasks/bulk/", payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([task["title"] for task in response.data["created"]], ["Pricing page", "Blog"])
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2, 3])
+        self.assertEqual(Task.objects.filter(organisation=self.org).count(), 3)
+        self.assertEqual(
+            dict(TaskCounter.objects.filter(project=self.project).values_list("status", "count")),
+            {"todo": 2, "done": 1},
+        )
+
+
+class TaskBulkStatusTests(TaskAPITestCase):
+    def test_bulk_status_updates_tenant_tasks_only(self):
+        self.client.post("/api/tasks/bulk/", {"tasks": [
+            {"project": str(self.project.id), "title": "Pricing page"},
+            {"project": str(self.project.id), "title": "Blog", "status": "done"},
+        ]}, format="json")
+        other_org = Organisation.objects.create(name="Globex", owner=self.user)
+        foreign = Task.objects.create(
+            project=Project.objects.create(organisation=other_org, name="Intranet"), title="Secret"
+        )
+        ids = [str(task_id) for task_id in Task.objects.filter(organisation=self.org).values_list("id", flat=True)]
+
+        response = self.client.patch(
+            "/api/tasks/bulk-status/", {"ids": ids + [str(foreign.id)], "status": " DONE "}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({task["status"] for task in response.data["tasks"]}, {"done"})
+        self.assertEqual(response.data["missing"], [str(foreign.id)])
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, "todo")
+        self.assertEqual(
+            dict(TaskCounter.objects.filter(project=self.project).values_list("status", "count")),
+            {"todo": 0, "done": 3},
+        )
+
+    def test_bulk_status_rejects_unknown_status(self):
+        task = Task.objects.get(title="Landing page")
+        response = self.client.patch(
+            "/api/tasks/bulk-status/", {"ids": [str(task.id)], "status": "archived"}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskEventStreamTests(TaskAPITestCase):
+    def stream_headers(self, org):
+        token = RefreshToken.for_user(self.user).access_token
+        return {"Authorization": f"Bearer {token}", "X-Org-Id": str(org.id)}
+
+    def create_task(self, title):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/api/tasks/", {"title": title, "project": str(self.project.id)}, format="json")
+
+    async def test_stream_pushes_committed_task_events(self):
+        response = await self.async_client.get("/api/events/", headers=self.stream_headers(self.org))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+
+        await sync_to_async(self.create_task)("Pricing page")
+        event = (await anext(stream)).decode()
+        self.assertTrue(event.startswith("event: task.created\n"))
+        self.assertIn('"title": "Pricing page"', event)
+        response.close()
+
+    @override_settings(EVENT_STREAM={"MAX_CONNECTIONS_PER_TENANT": 1})
+    async def test_streams_are_capped_per_tenant(self):
+        events._backend = None
+        self.addCleanup(setattr, events, "_backend", None)
+        first = await self.async_client.get("/api/events/", headers=self.stream_headers(self.org))
+        second = await self.async_client.get("/api/events/", headers=self.stream_headers(self.org))
+        self.assertEqual(second.status_code, 429)
+        first.close()
+        third = await self.async_client.get("/api/events/", headers=self.stream_headers(self.org))
+        self.assertEqual(third.status_code, 200)
+        third.close()
+
+    def test_slow_subscriber_is_reset(self):
+        async def scenario():
+            hub = events.EventHub(max_per_tenant=5, queue_size=2, heartbeat=1)
+            subscription = hub.subscribe(self.org.id)
+            for number in range(3):
+                hub.deliver(self.org.id, "task.updated", str(number))
+            await asyncio.sleep(0)
+            chunks = [chunk async for chunk in subscription]
+            return chunks, hub.stats()
+
+        chunks, stats = asyncio.run(scenario())
+        self.assertEqual(chunks, ["retry: 3000\n\n", "event: reset\ndata: {}\n\n"])
+        self.assertEqual(stats["connections"], 0)
+
+
+class TaskSyncTests(TaskAPITestCase):
+    def sync(self, token=None):
+        url = "/api/sync/" if token is None else f"/api/sync/?since={token}"
+        return self.client.get(url)
+
+    def test_changes_since_token(self):
+        landing = Task.objects.get(title="Landing page")
+        blog = Task.objects.create(project=self.project, title="Blog")
+        Task.objects.filter(id__in=[landing.id, blog.id]).update(updated_at=timezone.now() - timedelta(minutes=5))
+        Project.objects.filter(id=self.project.id).update(updated_at=timezone.now() - timedelta(minutes=5))
+        token = sync_token(timezone.now() - timedelta(minutes=1))
+
+        self.client.patch(f"/api/tasks/{landing.id}/status/", {"status": "done"}, format="json")
+        self.client.delete(f"/api/tasks/{blog.id}/")
+
+        response = self.sync(token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task["title"] for task in response.data["tasks"]], ["Landing page"])
+        self.assertEqual(response.data["deleted"]["tasks"], [blog.id])
+        self.assertEqual(response.data["projects"], [])
+        self.assertIn("token", response.data)
+
+    @override_settings(SYNC={"PAGE_SIZE": 2, "OVERLAP_SECONDS": 0})
+    def test_large_changes_are_paged(self):
+        token = self.sync().data["token"]
+        for index in range(4):
+            Task.objects.create(project=self.project, title=f"Task {index}")
+        Task.objects.filter(title="Task 0").delete()
+
+        titles, deleted, pages = [], [], 0
+        while True:
+            response = self.sync(token)
+            self.assertEqual(response.status_code, 200)
+            titles += [task["title"] for task in response.data["tasks"]]
+            deleted += response.data["deleted"]["tasks"]
+            token = response.data["token"]
+            pages += 1
+            if not response.data["has_more"]:
+                break
+        self.assertEqual(pages, 2)
+        self.assertEqual(titles, ["Task 1", "Task 2", "Task 3"])
+        self.assertEqual(len(deleted), 1)
+        self.assertEqual(self.sync(token).data["tasks"], [])
+
+    def test_project_delete_tombstones_its_tasks(self):
+        project = Project.objects.create(organisation=self.org, name="Intranet")
+        tasks = Task.objects.bulk_create([
+            Task(project=project, organisation=self.org, title=f"Page {i}") for i in range(3)
+        ])
+        with CaptureQueriesContext(connection) as context:
+            project.delete()
+        inserts = [q for q in context.captured_queries if q["sql"].startswith('INSERT INTO "tombstones"')]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(
+            set(Tombstone.objects.filter(model="task").values_list("object_id", flat=True)),
+            {task.id for task in tasks},
+        )
+
+    def test_expired_token_requires_reload(self):
+        response = self.sync(sync_token(timezone.now() - timedelta(days=31)))
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(self.sync("not-a-token").status_code, 400)
+
+    def test_compact_tombstones_drops_old_rows(self):
+        Tombstone.objects.create(org_id=self.org.id, model="task", object_id=uuid.uuid4())
+        old = Tombstone.objects.create(org_id=self.org.id, model="task", object_id=uuid.uuid4())
+        Tombstone.objects.filter(id=old.id).update(deleted_at=timezone.now() - timedelta(days=40))
+
+        call_command("compact_tombstones", "--days", "30", stdout=StringIO())
+        self.assertEqual(Tombstone.objects.count(), 1)
+        self.assertFalse(Tombstone.objects.filter(id=old.id).exists())
+
+
+class TaskListETagTests(TaskAPITestCase):
+    def test_unchanged_list_returns_304_without_task_queries(self):
+        first = self.client.get("/api/tasks/")
+        self.assertEqual(first.status_code, 200)
+        with CaptureQueriesContext(connection) as context:
+            cached = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], first["ETag"])
+        self.assertFalse([q for q in context.captured_queries if 'FROM "tasks"' in q["sql"]])
+        self.assertNotEqual(self.client.get("/api/tasks/?page_size=1")["ETag"], first["ETag"])
+
+    def test_writes_outside_the_api_change_the_etag(self):
+        etag = self.client.get("/api/tasks/")["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(project=self.project, title="Made in admin")
+        changed = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+
+        etag = changed["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_update_status(self.org, self.user, list(Task.objects.values_list("id", flat=True)), "done")
+        self.assertEqual(self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        projects = self.client.get("/api/projects/")
+        self.assertEqual(self.client.get("/api/projects/", HTTP_IF_NONE_MATCH=projects["ETag"]).status_code, 304)
+
+
+@override_settings(RESPONSE_CACHE={"ENABLED": True, "MAX_ENTRIES": 10})
+class ResponseCacheTests(TaskAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.other_org = Organisation.objects.create(name="Globex", owner=self.user)
+        OrganisationMember.objects.create(user=self.user, organisation=self.other_org, role="owner")
+        other_project = Project.objects.create(organisation=self.other_org, name="Intranet")
+        Task.objects.create(project=other_project, title="Secret")
+        self.other_client = self.client_for(self.user, self.other_org)
+
+    def titles(self, response):
+        return [task["title"] for task in json.loads(response.content)["results"]]
+
+    def test_cache_never_crosses_tenants(self):
+        self.assertEqual(self.titles(self.client.get("/api/tasks/")), ["Landing page"])
+        with CaptureQueriesContext(connection) as context:
+            hit = self.client.get("/api/tasks/")
+        self.assertEqual(self.titles(hit), ["Landing page"])
+        self.assertFalse([q for q in context.captured_queries if 'FROM "tasks"' in q["sql"]])
+
+        # Same path and query, same user, other tenant: its own data, never the cached body.
+        self.assertEqual(self.titles(self.other_client.get("/api/tasks/")), ["Secret"])
+        self.assertEqual(self.titles(self.other_client.get("/api/tasks/")), ["Secret"])
+
+        stats = get_response_cache().stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+        self.assertGreater(stats["bytes"], 0)
+
+    @override_settings(RESPONSE_CACHE={"ENABLED": True, "BACKEND": "core.response_cache.DjangoCacheBackend"})
+    def test_shared_backend_reports_writes_not_size(self):
+        self.client.get("/api/tasks/")
+        self.client.get("/api/tasks/")
+        stats = get_response_cache().stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["writes"]), (1, 1, 1))
+        self.assertGreater(stats["bytes_written"], 0)
+        self.assertNotIn("bytes", stats)
+
+    def test_encoded_separators_get_their_own_entry(self):
+        Task.objects.create(project=self.project, title="Pricing page")
+        self.assertEqual(len(self.titles(self.client.get("/api/tasks/?a=1%26page_size%3D1"))), 2)
+        self.assertEqual(len(self.titles(self.client.get("/api/tasks/?a=1&page_size=1"))), 1)
+
+    def test_write_moves_readers_to_a_new_entry(self):
+        self.client.get("/api/tasks/")
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(project=self.project, title="Pricing page")
+        self.assertEqual(self.titles(self.client.get("/api/tasks/")), ["Landing page", "Pricing page"])
+
+
+class ValuesSerializerTests(TaskAPITestCase):
+    def test_values_path_renders_like_model_serializers(self):
+        Task.objects.create(project=self.project, title="Launch", status="done", due_date="2026-11-01")
+        Task.objects.create(project=self.project, title="Ünïcode “quotes”", description="multi\nline")
+        renderer = JSONRenderer()
+
+        tasks = Task.objects.order_by("created_at", "id")
+        values_serializer = TaskValuesSerializer()
+        self.assertEqual(
+            renderer.render(values_serializer.to_representation(list(values_serializer.values(tasks)))),
+            renderer.render(TaskSerializer(tasks, many=True).data),
+        )
+
+        projects = Project.objects.prefetch_related("task_counters").order_by("created_at")
+        values_serializer = ProjectValuesSerializer()
+        self.assertEqual(
+            renderer.render(values_serializer.to_representation(list(values_serializer.values(projects)))),
+            renderer.render(ProjectSerializer(projects, many=True).data),
+        )
+
+    def test_benchmark_command_checks_outputs_match(self):
+        out = StringIO()
+        call_command("benchmark_task_serialization", "--rows", "50", "--repeat", "1", stdout=out)
+        self.assertIn("50 rows", out.getvalue())
+        self.assertFalse(Task.objects.filter(title="Task 0").exists())
+
+
+class SparseFieldsTests(TaskAPITestCase):
+    def test_fields_trims_output_and_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/tasks/?fields=id,title,status")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"id", "title", "status"})
+        task_sql = [q["sql"] for q in context.captured_queries if 'FROM "tasks"' in q["sql"]]
+        self.assertTrue(task_sql)
+        self.assertFalse(any('"description"' in sql for sql in task_sql))
+
+        task_id = response.data["results"][0]["id"]
+        detail = self.client.get(f"/api/tasks/{task_id}/?fields=title")
+        self.assertEqual(detail.data, {"title": "Landing page"})
+
+        projects = self.client.get("/api/projects/?fields=id,name")
+        self.assertEqual(projects.data, [{"id": str(self.project.id), "name": "Website"}])
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get("/api/tasks/?fields=id,secret")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("secret", str(response.data["fields"]))
+        self.assertEqual(self.client.get("/api/projects/?fields=").status_code, 400)
+
+    def test_cursor_pagination_works_without_ordering_fields(self):
+        Task.objects.create(project=self.project, title="Second")
+        first = self.client.get("/api/tasks/?fields=title&page_size=1")
+        self.assertEqual(first.data["results"], [{"title": "Landing page"}])
+        second = self.client.get(first.data["next"])
+        self.assertEqual(second.data["results"], [{"title": "Second"}])
+
+
+class TaskExportTests(TaskAPITestCase):
+    def read(self, response):
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_export_matches_the_api(self):
+        Task.objects.create(project=self.project, title="Launch", status="done")
+        lines = self.read(self.client.get("/api/tasks/export/")).splitlines()
+        listed = self.client.get("/api/tasks/").data["results"]
+        self.assertEqual([json.loads(line) for line in lines], json.loads(JSONRenderer().render(listed)))
+
+    def test_csv_export_with_filters(self):
+        Task.objects.create(project=self.project, title="=HYPERLINK(1)", status="done")
+        other = Project.objects.create(organisation=self.org, name="Other")
+        Task.objects.create(project=other, title="Elsewhere", status="done")
+        response = self.client.get(f"/api/tasks/export/?output=csv&status=DONE&project={self.project.id}")
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = self.read(response).splitlines()
+        self.assertTrue(lines[0].startswith("id,"))
+        self.assertEqual(len(lines), 2)
+        self.assertIn("'=HYPERLINK(1)", lines[1])
+
+    def test_invalid_parameters_are_rejected(self):
+        self.assertEqual(self.client.get("/api/tasks/export/?output=xml").status_code, 400)
+        self.assertEqual(self.client.get("/api/tasks/export/?status=later").status_code, 400)
+
+    def test_stream_yields_per_chunk_and_stops_when_closed(self):
+        Task.objects.bulk_create(
+            [Task(project=self.project, organisation=self.org, title=f"Row {i}") for i in range(5)]
+        )
+        stream = stream_tasks(Task.objects.filter(organisation=self.org), "ndjson", chunk_size=2)
+        self.assertEqual(len(next(stream).splitlines()), 2)
+        stream.close()
+        self.assertEqual(len(list(stream_tasks(Task.objects.all(), "ndjson", chunk_size=2))), 3)
+
+    async def test_asgi_export_streams_asynchronously(self):
+        token = RefreshToken.for_user(self.user).access_token
+        response = await self.async_client.get(
+            "/api/tasks/export/?output=csv",
+            headers={"Authorization": f"Bearer {token}", "X-Org-Id": str(self.org.id)},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        lines = b"".join([chunk async for chunk in response.streaming_content]).decode().splitlines()
+        self.assertTrue(lines[0].startswith("id,"))
+        self.assertIn("Landing page", lines[1])
+
+    async def test_async_stream_closes_the_cursor_when_closed_early(self):
+        await sync_to_async(Task.objects.bulk_create)(
+            [Task(project=self.project, organisation=self.org, title=f"Row {i}") for i in range(5)]
+        )
+        stream = astream_tasks(Task.objects.filter(organisation=self.org), "ndjson", chunk_size=2)
+        self.assertEqual(len((await anext(stream)).splitlines()), 2)
+        await stream.aclose()
+        pieces = [piece async for piece in astream_tasks(Task.objects.all(), "ndjson", chunk_size=2)]
+        self.assertEqual(len(pieces), 3)
+
+
+class TaskImportTests(TaskAPITestCase):
+    def upload(self, name, content, **data):
+        return self.client.post(
+            "/api/tasks/import/",
+            {"file": SimpleUploadedFile(name, content.encode()), **data},
+            format="multipart",
+        )
+
+    def test_csv_import_resolves_projects_and_reports_errors(self):
+        other = Project.objects.create(organisation=self.org, name="Mobile")
+        content = (
+            "project,title,status,due_date,description\n"
+            "Website,Hero copy,DONE,2026-12-01,\n"
+            f"{other.id},Release notes,in_progress,,Draft\n"
+            "Website,Landing page,todo,,\n"
+            "Nowhere,Lost,todo,,\n"
+            "Website,Bad date,todo,01/12/2026,\n"
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.upload("tasks.csv", content)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data["created"], response.data["failed"]), (2, 3))
+        self.assertEqual([error["line"] for error in response.data["errors"]], [4, 5, 6])
+        self.assertIn("already exists", str(response.data["errors"][0]["errors"]))
+        hero = Task.objects.get(title="Hero copy")
+        self.assertEqual((hero.status, str(hero.due_date), hero.organisation_id), ("done", "2026-12-01", self.org.id))
+        self.assertEqual(TaskCounter.objects.get(project=other, status="in_progress").count, 1)
+
+    def test_ndjson_dry_run_writes_nothing(self):
+        content = '{"project": "Website", "title": "A"}\n\nnot json\n{"project": "Website", "title": "A"}\n'
+        response = self.upload("tasks.ndjson", content, dry_run="true")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["rows"], response.data["created"], response.data["failed"]), (3, 1, 2))
+        self.assertFalse(Task.objects.filter(title="A").exists())
+
+    def test_concurrent_create_is_reported_and_the_rest_imported(self):
+        write = TaskImporter._write
+
+        def write_after_concurrent_create(importer, batch):
+            if not Task.objects.filter(title="Hero copy").exists():
+                Task.objects.create(project=self.project, title="Hero copy")
+            return write(importer, batch)
+
+        content = '{"project": "Website", "title": "Hero copy"}\n{"project": "Website", "title": "Footer"}\n'
+        with mock.patch.object(TaskImporter, "_write", write_after_concurrent_create):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.upload("tasks.ndjson", content)
+        self.assertEqual((response.data["created"], response.data["failed"]), (1, 1))
+        self.assertEqual(response.data["errors"][0]["line"], 1)
+        self.assertEqual(Task.objects.filter(title__in=["Hero copy", "Footer"]).count(), 2)
+        self.assertEqual(TaskCounter.objects.get(project=self.project, status="todo").count, 2)
+
+    def test_members_cannot_import(self):
+        member = User.objects.create_user(email="member@example.com", password="Str0ng-pass!")
+        OrganisationMember.objects.create(user=member, organisation=self.org, role="member")
+        client = self.client_for(member, self.org)
+        response = client.post(
+            "/api/tasks/import/",
+            {"file": SimpleUploadedFile("tasks.csv", b"project,title\nWebsite,X\n")},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_command_imports_file_with_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tasks.ndjson")
+            report = os.path.join(directory, "errors.ndjson")
+            with open(path, "w") as handle:
+                for number in range(30):
+                    handle.write(json.dumps({"project": "Website", "title": f"Row {number}"}) + "\n")
+                handle.write(json.dumps({"project": "Website"}) + "\n")
+            out = StringIO()
+            call_command("import_tasks", path, "--org", str(self.org.id), "--batch-size", "7", "--report", report, stdout=out)
+            with open(report) as handle:
+                self.assertEqual(json.loads(handle.read())["line"], 31)
+        self.assertIn("30 of 31 rows imported, 1 failed", out.getvalue())
+        self.assertEqual(Task.objects.filter(organisation=self.org).count(), 31)
+
+
+class TaskSearchTests(TaskAPITestCase):
+    def search(self, query, client=None):
+        response = (client or self.client).get("/api/tasks/search/", {"q": query} if isinstance(query, str) else query)
+        self.assertEqual(response.status_code, 200)
+        return [task["title"] for task in response.data["results"]]
+
+    def test_title_matches_rank_above_description_matches(self):
+        Task.objects.create(project=self.project, title="Write copy", description="Mention the landing experience")
+        Task.objects.create(project=self.project, title="Unrelated")
+        self.assertEqual(self.search("landing"), ["Landing page", "Write copy"])
+        # Stemming: "pages" finds "page".
+        self.assertEqual(self.search("pages"), ["Landing page"])
+
+    def test_index_follows_updates_and_deletes(self):
+        task = Task.objects.get(title="Landing page")
+        task.title = "Pricing table"
+        task.save()
+        self.assertEqual(self.search("landing"), [])
+        self.assertEqual(self.search("pricing"), ["Pricing table"])
+        task.delete()
+        self.assertEqual(self.search("pricing"), [])
+
+    def test_search_is_tenant_scoped_and_filterable(self):
+        other_user = User.objects.create_user(email="other@example.com", password="Str0ng-pass!")
+        other_org = Organisation.objects.create(name="Other", owner=other_user)
+        OrganisationMember.objects.create(user=other_user, organisation=other_org, role="owner")
+        other_project = Project.objects.create(organisation=other_org, name="Site")
+        Task.objects.create(project=other_project, title="Landing page")
+        Task.objects.create(project=self.project, title="Landing video", status="done")
+
+        self.assertEqual(self.search("landing", self.client_for(other_user, other_org)), ["Landing page"])
+        self.assertEqual(self.search({"q": "landing", "status": "done"}), ["Landing video"])
+        self.assertEqual(self.search({"q": "landing", "project": str(other_project.id)}), [])
+
+    def test_results_are_paginated(self):
+        Task.objects.bulk_create(
+            [Task(project=self.project, organisation=self.org, title=f"Launch step {n}") for n in range(5)]
+        )
+        first = self.client.get("/api/tasks/search/?q=launch&page_size=3")
+        self.assertEqual(len(first.data["results"]), 3)
+        second = self.client.get(first.data["next"])
+        self.assertEqual(len(second.data["results"]), 2)
+        self.assertIsNone(second.data["next"])
+        titles = {task["title"] for task in first.data["results"] + second.data["results"]}
+        self.assertEqual(len(titles), 5)
+
+    def test_query_is_required_and_punctuation_is_safe(self):
+        self.assertEqual(self.client.get("/api/tasks/search/").status_code, 400)
+        self.assertEqual(self.search('landing" (*'), ["Landing page"])
+
+
+class DatabaseMetricsTests(TaskAPITestCase):
+    def test_metrics_report_connection_reuse(self):
+        self.user.is_staff = True
+        self.user.save(update_fields=["is_staff"])
+        before = database_stats()["requests"]
+        response = self.client.get("/api/internal/metrics/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["database"]["requests"], before + 1)
+        default = response.data["database"]["aliases"]["default"]
+        self.assertGreaterEqual(default["connections_opened"], 1)
+        self.assertEqual(default["vendor"], connection.vendor)
+        self.assertIn(default["mode"], ["per_request", "persistent", "pool"])
+        self.assertIsNone(default["pool"])
+
+    def test_connection_mode_follows_settings(self):
+        self.assertEqual(connection_mode({"CONN_MAX_AGE": 0}), "per_request")
+        self.assertEqual(connection_mode({"CONN_MAX_AGE": 60}), "persistent")
+        self.assertEqual(connection_mode({"CONN_MAX_AGE": 0, "OPTIONS": {"pool": {"max_size": 4}}}), "pool")
@@ -1,7 +1,10 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from apps.tasks.views import TaskViewSet
+from apps.tasks.views import SyncView, TaskViewSet
 
 router = DefaultRouter()
 router.register(r"tasks", TaskViewSet, basename="task")
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("sync/", SyncView.as_view()),
+] + router.urls
@@ -1,31 +1,71 @@
+import uuid
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.parsers import MultiPartParser
+from rest_framework.views import APIView
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from apps.tasks.models import Task
-from apps.tasks.serializers import TaskSerializer
+from apps.tasks.serializers import (
+    TaskSerializer,
+    TaskValuesSerializer,
+    BulkTaskCreateSerializer,
+    BulkTaskStatusSerializer,
+)
+from apps.tasks.export import FORMATS as EXPORT_FORMATS, astream_tasks, stream_tasks
+from apps.tasks.search import MAX_QUERY_LENGTH, search_tasks
+from apps.tasks.imports import FORMATS as IMPORT_FORMATS, TaskImporter, format_for_filename, read_rows
+from apps.tasks.bulk import bulk_create_tasks, bulk_update_status, normalize_status, status_activity_action
+from apps.tasks.counters import adjust_task_counter, lock_task_counter_key, move_task_counter
+from apps.tasks.sync import SyncTokenExpired, collect_changes, decode_sync_token, initial_sync_token
+from apps.projects.serializers import ProjectSerializer
+from apps.tasks.stats import get_dashboard_stats
 from apps.organizations.activity import log_activity
+from core.events import publish_event
+from core.pagination import KeysetPagination, OffsetPagination
 from core.permissions import IsMember, IsAdminOrOwner
-from core.tenancy import TenantScopedViewSetMixin
+from core.serialization import SparseFieldsMixin, ValuesListMixin
+from core.tenancy import DataVersionETagMixin, TenantScopedViewSetMixin
 
-class TaskViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
+class TaskViewSet(
+    DataVersionETagMixin,
+    ValuesListMixin,
+    SparseFieldsMixin,
+    TenantScopedViewSetMixin,
+    viewsets.ModelViewSet,
+):
     """
-    Tenant-aware Task API.
+    Tenant-aware Task API. List and retrieve accept `?fields=id,title,...`.
     """
     serializer_class = TaskSerializer
+    values_serializer_class = TaskValuesSerializer
     permission_classes = [IsAuthenticated, IsMember]
+    pagination_class = KeysetPagination
 
     def get_permissions(self):
-        if self.action == "destroy":
+        if self.action in ("destroy", "import_tasks"):
             return [IsAuthenticated(), IsAdminOrOwner()]
         return super().get_permissions()
 
     def get_queryset(self):
         # DRF built-in hook: defines what data is returned
         self.ensure_tenant()
-        return self.filter_queryset_by_tenant(Task.objects.all())
+        queryset = self.filter_queryset_by_tenant(Task.objects.all())
+        if self.action == "list":
+            project_id = self.request.query_params.get("project")
+            if project_id:
+                # Single-project pages walk the (project, created_at) index.
+                try:
+                    queryset = queryset.filter(project_id=uuid.UUID(project_id))
+                except ValueError:
+                    raise ValidationError({"project": "Must be a valid UUID."})
+        return queryset
 
     def perform_create(self, serializer):
         # DRF built-in hook: called when saving new objects
@@ -33,7 +73,10 @@ class TaskViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
         project = serializer.validated_data.get("project")
         if project.organisation_id != self.request.tenant.id:
             raise PermissionDenied("Project does not belong to the active organisation.")
-        task = serializer.save()
+        with transaction.atomic():
+            task = serializer.save()
+            adjust_task_counter(task.project_id, task.status, 1)
+        publish_event(self.request.tenant.id, "task.created", serializer.data)
         log_activity(
             self.request.user,
             "created task",
@@ -41,6 +84,32 @@ class TaskViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
             self.request.tenant.id,
         )
 
+    def perform_update(self, serializer):
+        # Moving a task re-derives its organisation, so keep moves inside the tenant.
+        self.ensure_tenant()
+        project = serializer.validated_data.get("project")
+        if project is not None and project.organisation_id != self.request.tenant.id:
+            raise PermissionDenied("Project does not belong to the active organisation.")
+        with transaction.atomic():
+            previous = lock_task_counter_key(serializer.instance.pk)
+            if previous is None:
+                raise NotFound()
+            task = serializer.save()
+            move_task_counter(previous, (task.project_id, task.status))
+        publish_event(self.request.tenant.id, "task.updated", serializer.data)
+
+    def perform_destroy(self, instance):
+        task_id = instance.id
+        with transaction.atomic():
+            key = lock_task_counter_key(task_id)
+            if key is None:
+                # A concurrent delete got there first and already counted it.
+                return
+            _, deleted = instance.delete()
+            if deleted.get(Task._meta.label):
+                adjust_task_counter(*key, -1)
+        publish_event(self.request.tenant.id, "task.deleted", {"id": task_id})
+
     @action(detail=True, methods=["patch"], url_path="status")
     def update_status(self, request, pk=None):
         self.ensure_tenant()
@@ -49,29 +118,198 @@ class TaskViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
         if not raw_status:
             return Response({"detail": "Status is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        normalized = str(raw_status).strip().lower()
-        allowed = ["todo", "in_progress", "done"]
-        if normalized not in allowed:
+        normalized = normalize_status(raw_status)
+        if normalized is None:
             return Response(
                 {"detail": "Invalid status."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        task.status = normalized
-        task.save(update_fields=["status"])
-
-        if normalized == "done":
-            action = "completed task"
-        elif normalized == "in_progress":
-            action = "moved task to In Progress"
-        else:
-            action = "moved task to To Do"
+        with transaction.atomic():
+            previous = lock_task_counter_key(task.pk)
+            if previous is None:
+                raise NotFound()
+            task.project_id, task.status = previous[0], normalized
+            task.save(update_fields=["status"])
+            move_task_counter(previous, (task.project_id, normalized))
 
         log_activity(
             request.user,
-            action,
+            status_activity_action(normalized),
             task.title,
             request.tenant.id,
         )
-        return Response(TaskSerializer(task).data, status=status.HTTP_200_OK)
+        data = TaskSerializer(task).data
+        publish_event(request.tenant.id, "task.updated", data)
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="stats")
+    def stats(self, request):
+        """
+        Dashboard counters (per status, per project, overdue, project count),
+        cached per organisation and dropped on task/project writes.
+        """
+        self.ensure_tenant()
+        return Response(get_dashboard_stats(request.tenant.id), status=status.HTTP_200_OK)
+
+    def filter_by_project_and_status(self, queryset):
+        """
+        Apply the optional ?project=<uuid> and ?status=todo,done filters.
+        """
+        project_id = self.request.query_params.get("project")
+        if project_id:
+            try:
+                queryset = queryset.filter(project_id=uuid.UUID(project_id))
+            except ValueError:
+                raise ValidationError({"project": "Must be a valid UUID."})
+        raw_status = self.request.query_params.get("status")
+        if raw_status:
+            statuses = [normalize_status(value) for value in raw_status.split(",")]
+            if None in statuses:
+                raise ValidationError({"status": "Invalid status."})
+            queryset = queryset.filter(status__in=statuses)
+        return queryset
+
+    @action(detail=False, methods=["get"], url_path="search", pagination_class=OffsetPagination)
+    def search(self, request):
+        """
+        Full-text search over titles and descriptions, best match first.
+        ?q= is required; ?project= and ?status= narrow it. Title matches
+        rank above description matches.
+        """
+        self.ensure_tenant()
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "A search query is required."})
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValidationError({"q": f"Ensure this field has no more than {MAX_QUERY_LENGTH} characters."})
+        queryset = self.filter_by_project_and_status(self.filter_queryset_by_tenant(Task.objects.all()))
+        values_serializer = self.values_serializer_class()
+        rows = values_serializer.values(search_tasks(queryset, query), extra=["rank"])
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(values_serializer.to_representation(page))
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        """
+        Stream every task in the organisation as NDJSON (default) or CSV
+        (?output=csv), oldest first. Optional ?project=<uuid> and
+        ?status=todo,done filters.
+        """
+        self.ensure_tenant()
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({"output": f"Must be one of: {', '.join(EXPORT_FORMATS)}."})
+        queryset = self.filter_by_project_and_status(self.filter_queryset_by_tenant(Task.objects.all()))
+        content_type, _ = EXPORT_FORMATS[output]
+        # ASGI servers iterate responses asynchronously and would otherwise
+        # buffer a sync generator's whole output before sending it.
+        stream = astream_tasks if isinstance(request._request, ASGIRequest) else stream_tasks
+        response = StreamingHttpResponse(stream(queryset, output), content_type=content_type)
+        filename = f"tasks-{timezone.now():%Y%m%d}.{output}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["Cache-Control"] = "no-store"
+        # Ask nginx not to buffer the whole export before sending it on.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        """
+        Create up to 1000 tasks in one request. Valid rows are inserted and
+        invalid ones reported by index; 400 only if nothing could be created.
+        """
+        self.ensure_tenant()
+        serializer = BulkTaskCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            created, errors = bulk_create_tasks(request.tenant, request.user, serializer.validated_data["tasks"])
+        except IntegrityError:
+            return Response(
+                {"detail": "Tasks changed while importing. Please retry."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(
+            {"created": TaskSerializer(created, many=True).data, "errors": errors},
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_tasks(self, request):
+        """
+        Import an NDJSON or CSV upload (multipart field `file`). Projects are
+        matched by name or id. `dry_run=true` validates without writing.
+        The format comes from the file extension unless `format` is given.
+        """
+        self.ensure_tenant()
+        upload = request.data.get("file")
+        if upload is None:
+            raise ValidationError({"file": "An NDJSON or CSV file is required."})
+        file_format = request.data.get("format") or format_for_filename(upload.name)
+        if file_format not in IMPORT_FORMATS:
+            raise ValidationError({"format": f"Must be one of: {', '.join(IMPORT_FORMATS)}."})
+        dry_run = str(request.data.get("dry_run", "")).lower() in ("1", "true", "yes")
+
+        importer = TaskImporter(request.tenant, request.user, dry_run=dry_run)
+        report = importer.run(read_rows(upload, file_format))
+        if dry_run or not report["created"]:
+            code = status.HTTP_200_OK if dry_run or not report["failed"] else status.HTTP_400_BAD_REQUEST
+        else:
+            code = status.HTTP_201_CREATED
+        return Response(report, status=code)
+
+    @action(detail=False, methods=["patch"], url_path="bulk-status")
+    def bulk_status(self, request):
+        """
+        Move many tasks to one status. Status rules match update_status.
+        """
+        self.ensure_tenant()
+        serializer = BulkTaskStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        normalized = normalize_status(serializer.validated_data["status"])
+        if normalized is None:
+            return Response({"detail": "Invalid status."}, status=status.HTTP_400_BAD_REQUEST)
+
+        task_ids = serializer.validated_data["ids"]
+        bulk_update_status(request.tenant, request.user, task_ids, normalized)
+
+        tasks = list(self.filter_queryset_by_tenant(Task.objects.filter(id__in=task_ids)))
+        found = {task.id for task in tasks}
+        return Response(
+            {
+                "tasks": TaskSerializer(tasks, many=True).data,
+                "missing": [str(task_id) for task_id in task_ids if task_id not in found],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class SyncView(APIView):
+    """
+    Delta sync for the active organisation.
+
+    GET without `since` returns a token only: take it before loading the
+    lists. GET ?since=<token> returns projects and tasks written since then,
+    ids deleted since then, and the next token; while `has_more` is true,
+    call again straight away with that token. 410 means the token is older
+    than the tombstone retention window and the client must reload.
+    """
+    permission_classes = [IsAuthenticated, IsMember]
 
+    def get(self, request):
+        if getattr(request, "tenant", None) is None:
+            raise PermissionDenied("Active tenant is required.")
+        raw = request.query_params.get("since")
+        if not raw:
+            return Response({"token": initial_sync_token()})
+        try:
+            changes = collect_changes(request.tenant.id, *decode_sync_token(raw))
+        except SyncTokenExpired:
+            return Response({"detail": "Sync token expired; reload all data."}, status=status.HTTP_410_GONE)
+        return Response({
+            "projects": ProjectSerializer(changes["projects"], many=True).data,
+            "tasks": TaskSerializer(changes["tasks"], many=True).data,
+            "deleted": changes["deleted"],
+            "has_more": changes["has_more"],
+            "token": changes["token"],
+        })
@@ -12,5 +12,9 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+# Sync code runs in a new thread per request under ASGI, so persistent
+# connections are never reused or closed. Pool them unless told otherwise.
+os.environ.setdefault("DB_POOL", "True")
+os.environ.setdefault("DB_CONN_MAX_AGE", "0")
 
 application = get_asgi_application()
@@ -0,0 +1,49 @@
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+_UNSET = object()
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _uses_token_user(request):
+    """
+    Token-user mode builds request.user from the JWT claims instead of the
+    users table. It is opt-in and limited to safe methods on the configured
+    paths, because writes need a real User row (owner FKs, activity names).
+    """
+    config = getattr(settings, "TENANT_AUTH", {})
+    if not config.get("TOKEN_USER_READS"):
+        return False
+    if request.method not in SAFE_METHODS:
+        return False
+    return any(request.path.startswith(path) for path in config.get("TOKEN_USER_PATHS", []))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that decodes the bearer token once per request.
+
+    TenantMiddleware authenticates first and stores the result on the Django
+    request; DRF views reuse it instead of decoding and loading the user again.
+    """
+
+    def authenticate(self, request):
+        django_request = getattr(request, "_request", request)
+        result = getattr(django_request, "_jwt_auth_result", _UNSET)
+        if result is not _UNSET:
+            return result
+
+        result = None
+        header = self.get_header(request)
+        raw_token = self.get_raw_token(header) if header is not None else None
+        if raw_token is not None:
+            validated_token = self.get_validated_token(raw_token)
+            if _uses_token_user(django_request):
+                user = api_settings.TOKEN_USER_CLASS(validated_token)
+            else:
+                user = self.get_user(validated_token)
+            result = (user, validated_token)
+
+        django_request._jwt_auth_result = result
+        return result
@@ -0,0 +1,85 @@
+import threading
+from collections import Counter
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Receivers are connected from TasksConfig.ready(), before the first connection
+# or request, so the counts below start at process start-up.
+_lock = threading.Lock()
+_opened = Counter()
+_requests = 0
+
+
+@receiver(connection_created, dispatch_uid="core.database.count_connection")
+def _count_connection(sender, connection, **kwargs):
+    with _lock:
+        _opened[connection.alias] += 1
+
+
+@receiver(request_started, dispatch_uid="core.database.count_request")
+def _count_request(sender, **kwargs):
+    global _requests
+    with _lock:
+        _requests += 1
+
+
+def connection_mode(settings_dict):
+    if "pool" in settings_dict.get("OPTIONS", {}):
+        return "pool"
+    max_age = settings_dict.get("CONN_MAX_AGE", 0)
+    return "per_request" if max_age == 0 else "persistent"
+
+
+def pool_stats(wrapper):
+    """
+    In use, idle and wait figures from a psycopg pool, or None without one.
+    """
+    pool = getattr(wrapper, "pool", None)
+    if pool is None:
+        return None
+    stats = pool.get_stats()
+    size = stats.get("pool_size", 0)
+    idle = stats.get("pool_available", 0)
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+    return {
+        "min_size": stats.get("pool_min", 0),
+        "max_size": stats.get("pool_max", 0),
+        "size": size,
+        "in_use": size - idle,
+        "idle": idle,
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests,
+        "queued": stats.get("requests_queued", 0),
+        "wait_ms_total": wait_ms,
+        "wait_ms_avg": round(wait_ms / requests, 2) if requests else 0.0,
+        "timeouts": stats.get("requests_errors", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
+
+
+def database_stats():
+    """
+    Per alias: how connections are reused, how many this process has
+    opened since start-up, and pool figures when pooling is on.
+    """
+    with _lock:
+        opened = dict(_opened)
+        requests = _requests
+    stats = {}
+    for alias in connections:
+        settings_dict = connections.settings[alias]
+        mode = connection_mode(settings_dict)
+        count = opened.get(alias, 0)
+        stats[alias] = {
+            "vendor": connections[alias].vendor,
+            "mode": mode,
+            "conn_max_age": settings_dict.get("CONN_MAX_AGE", 0),
+            "health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+            "connections_opened": count,
+            "requests_per_connection": round(requests / count, 2) if count else None,
+            "pool": pool_stats(connections[alias]) if mode == "pool" else None,
+        }
+    return {"requests": requests, "aliases": stats}
@@ -0,0 +1,269 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+from collections import defaultdict
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, connections, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "BACKEND": "core.events.LocalEventBackend",
+    "HEARTBEAT_SECONDS": 15.0,
+    "QUEUE_SIZE": 100,
+    "MAX_CONNECTIONS_PER_TENANT": 50,
+}
+
+# Put on a subscriber's queue when it falls too far behind; the stream tells
+# the client to reload and closes instead of buffering without limit.
+_RESET = object()
+
+
+def get_event_config():
+    return {**DEFAULTS, **getattr(settings, "EVENT_STREAM", {})}
+
+
+class StreamLimitExceeded(Exception):
+    pass
+
+
+class Subscription:
+    """
+    One open event stream. Iterating it yields Server-Sent Events text,
+    with a comment line as heartbeat when nothing happened for a while.
+    close() is called by the response when the client goes away.
+    """
+
+    def __init__(self, hub, org_id, loop, queue_size, heartbeat):
+        self.hub = hub
+        self.org_id = org_id
+        self.loop = loop
+        self.heartbeat = heartbeat
+        self.queue = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, event):
+        # Runs on the subscriber's event loop.
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_RESET)
+            self.hub.unsubscribe(self)
+
+    async def __aiter__(self):
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(self.queue.get(), self.heartbeat)
+            except TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event is _RESET:
+                yield "event: reset\ndata: {}\n\n"
+                return
+            event_type, payload = event
+            yield f"event: {event_type}\ndata: {payload}\n\n"
+
+    def close(self):
+        self.hub.unsubscribe(self)
+
+
+class EventHub:
+    """
+    In-process fan-out of tenant events to open streams.
+
+    deliver() may be called from any thread; each event is handed to the
+    subscriber's own event loop.
+    """
+
+    def __init__(self, max_per_tenant, queue_size, heartbeat):
+        self.max_per_tenant = max_per_tenant
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, org_id):
+        org_id = str(org_id)
+        with self._lock:
+            if len(self._subscribers[org_id]) >= self.max_per_tenant:
+                raise StreamLimitExceeded(org_id)
+            subscription = Subscription(
+                self, org_id, asyncio.get_running_loop(), self.queue_size, self.heartbeat
+            )
+            self._subscribers[org_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.org_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.org_id]
+
+    def deliver(self, org_id, event_type, payload):
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(org_id), ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.push, (event_type, payload))
+            except RuntimeError:
+                # The loop is gone (worker shutting down).
+                self.unsubscribe(subscription)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "tenants": len(self._subscribers),
+                "connections": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            }
+
+
+class LocalEventBackend:
+    """
+    Delivers events to streams in this process only.
+    """
+
+    def __init__(self, hub):
+        self.hub = hub
+
+    def start(self):
+        pass
+
+    def publish(self, org_id, event_type, payload):
+        self.hub.deliver(org_id, event_type, payload)
+
+
+class PostgresEventBackend:
+    """
+    Shares events between worker processes with PostgreSQL LISTEN/NOTIFY.
+
+    Every process runs one listener thread on its own connection and hands
+    notifications to its local hub, so publishers never deliver directly.
+    """
+
+    channel = "tenant_events"
+    # NOTIFY payloads are limited to 8000 bytes.
+    max_payload = 7900
+
+    def __init__(self, hub):
+        self.hub = hub
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name="event-listener", daemon=True)
+                self._listener.start()
+
+    def publish(self, org_id, event_type, payload):
+        message = json.dumps({"org": str(org_id), "type": event_type, "payload": payload})
+        if len(message.encode()) > self.max_payload:
+            message = json.dumps({"org": str(org_id), "type": "reset", "payload": "{}"})
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, message])
+
+    def _listen(self):
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        # A dedicated connection outside Django's pool: LISTEN holds it for good.
+        params = connections["default"].get_connection_params()
+        listen = self._listen_psycopg3 if is_psycopg3 else self._listen_psycopg2
+        while True:
+            try:
+                listen(params)
+            except Exception:
+                logger.exception("Event listener lost its connection; reconnecting.")
+                threading.Event().wait(1.0)
+
+    def _listen_psycopg3(self, params):
+        import psycopg
+
+        with psycopg.connect(**params, autocommit=True) as conn:
+            conn.execute(f"LISTEN {self.channel}")
+            for notify in conn.notifies():
+                self._deliver(notify.payload)
+
+    def _listen_psycopg2(self, params):
+        import psycopg2
+        import psycopg2.extensions
+
+        conn = psycopg2.connect(**params)
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            while True:
+                if select.select([conn], [], [], 5.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    self._deliver(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+
+    def _deliver(self, raw):
+        message = json.loads(raw)
+        self.hub.deliver(message["org"], message["type"], message["payload"])
+
+
+_hub = None
+_backend = None
+_setup_lock = threading.Lock()
+
+
+def get_event_backend():
+    global _hub, _backend
+    if _backend is None:
+        with _setup_lock:
+            if _backend is None:
+                config = get_event_config()
+                _hub = EventHub(
+                    max_per_tenant=config["MAX_CONNECTIONS_PER_TENANT"],
+                    queue_size=config["QUEUE_SIZE"],
+                    heartbeat=config["HEARTBEAT_SECONDS"],
+                )
+                _backend = import_string(config["BACKEND"])(_hub)
+    return _backend
+
+
+def open_event_stream(org_id):
+    """
+    Subscribe to an organisation's events. Must run on the event loop that
+    will serve the stream. Raises StreamLimitExceeded at the tenant cap.
+    """
+    backend = get_event_backend()
+    backend.start()
+    return backend.hub.subscribe(org_id)
+
+
+def send_event(org_id, event_type, data):
+    """
+    Publish immediately. Use for writes that are already committed.
+    """
+    payload = json.dumps(data, cls=DjangoJSONEncoder)
+    try:
+        get_event_backend().publish(org_id, event_type, payload)
+    except Exception:
+        # Live updates are best effort; the write itself already succeeded.
+        logger.exception("Failed to publish %s event.", event_type)
+
+
+def publish_event(org_id, event_type, data):
+    """
+    Publish once the surrounding transaction commits; dropped on rollback.
+    """
+    transaction.on_commit(lambda: send_event(org_id, event_type, data))
+
+
+def event_stream_stats():
+    if _backend is None:
+        return {"tenants": 0, "connections": 0}
+    return _backend.hub.stats()
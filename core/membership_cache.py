@@ -0,0 +1,256 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+DEFAULTS = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 10000,
+    "TIMEOUT": 60,
+    "LOCAL_TIMEOUT": None,
+    "CACHE_ALIAS": None,
+    "KEY_PREFIX": "tenant-membership",
+}
+
+
+class MembershipCache:
+    """
+    Caches (organisation, role) per (user_id, org_id) for TenantMiddleware.
+
+    Entries live in an in-process LRU with a TTL. When CACHE_ALIAS is set the
+    shared Django cache is used as a second level so several workers can reuse
+    lookups; LOCAL_TIMEOUT bounds how long a worker trusts its own copy.
+
+    Invalidation bumps a generation per (user, org) and per org. A caller
+    reads generation() before loading the membership and passes it to set(),
+    which stores nothing if an invalidation ran in between, so a slow
+    request can't put a removed member or an old role back.
+    """
+
+    def __init__(self, max_entries, timeout, local_timeout=None, cache_alias=None, key_prefix="tenant-membership"):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.local_timeout = timeout if local_timeout is None else local_timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def shared(self):
+        if not self.cache_alias:
+            return None
+        return caches[self.cache_alias]
+
+    def _shared_key(self, user_id, org_id):
+        return f"{self.key_prefix}:{user_id}:{org_id}"
+
+    def _generation_keys(self, key):
+        return f"{self.key_prefix}:gen:{key[0]}:{key[1]}", f"{self.key_prefix}:gen:{key[1]}"
+
+    def generation(self, user_id, org_id):
+        """
+        Token for set(): changes whenever the membership or its organisation
+        is invalidated, in this worker or (with CACHE_ALIAS) any other.
+        """
+        key = (str(user_id), str(org_id))
+        with self._lock:
+            local = (self._generations.get(key, 0), self._generations.get(key[1], 0))
+        shared = self.shared
+        if shared is None:
+            return local
+        values = shared.get_many(self._generation_keys(key))
+        return local + tuple(values.get(name) for name in self._generation_keys(key))
+
+    def get(self, user_id, org_id):
+        key = (str(user_id), str(org_id))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._copy(value)
+                del self._entries[key]
+
+        shared = self.shared
+        if shared is not None:
+            entry_key = self._shared_key(*key)
+            org_generation_key = self._generation_keys(key)[1]
+            values = shared.get_many([entry_key, org_generation_key])
+            entry = values.get(entry_key)
+            # Entries saved before the organisation was last invalidated are stale.
+            if entry is not None and len(entry) == 3 and entry[2] == values.get(org_generation_key):
+                value = entry[:2]
+                self._store_local(key, value)
+                with self._lock:
+                    self.hits += 1
+                return self._copy(value)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, user_id, org_id, organisation, role, generation=None):
+        """
+        Store a membership loaded after generation() returned `generation`.
+        Without a generation the value is stored unconditionally.
+        """
+        key = (str(user_id), str(org_id))
+        value = (organisation, role)
+        if generation is not None and self.generation(user_id, org_id) != generation:
+            return
+        self._store_local(key, value, generation)
+        shared = self.shared
+        if shared is None:
+            return
+        shared.set(self._shared_key(*key), (*value, generation[3] if generation else None), self.timeout)
+        # An invalidation between the check above and this write already ran
+        # its delete; take the entry back out ourselves.
+        if generation is not None and self.generation(user_id, org_id) != generation:
+            shared.delete(self._shared_key(*key))
+
+    def invalidate(self, user_id, org_id):
+        self.invalidate_many([user_id], org_id)
+
+    def invalidate_many(self, user_ids, org_id):
+        keys = [(str(user_id), str(org_id)) for user_id in user_ids]
+        with self._lock:
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+                self._entries.pop(key, None)
+        shared = self.shared
+        if shared is not None:
+            # Bump before deleting so a racing set() either fails its check or removes itself.
+            self._bump_shared([self._generation_keys(key)[0] for key in keys])
+            shared.delete_many([self._shared_key(*key) for key in keys])
+
+    def invalidate_organisation(self, org_id):
+        """
+        Drop every cached membership of an organisation, e.g. after it was
+        renamed, since entries carry the Organisation row.
+        """
+        org_id = str(org_id)
+        with self._lock:
+            self._generations[org_id] = self._generations.get(org_id, 0) + 1
+            for key in [key for key in self._entries if key[1] == org_id]:
+                del self._entries[key]
+        if self.shared is not None:
+            self._bump_shared([self._generation_keys((None, org_id))[1]])
+
+    def _bump_shared(self, keys):
+        # A fresh clock value rather than incr: one call for many keys, and an
+        # evicted generation never comes back as a value a reader still holds.
+        now = time.time_ns()
+        self.shared.set_many({key: now for key in keys}, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def _store_local(self, key, value, generation=None):
+        if self.max_entries <= 0 or self.local_timeout <= 0:
+            return
+        with self._lock:
+            current = (self._generations.get(key, 0), self._generations.get(key[1], 0))
+            if generation is not None and generation[:2] != current:
+                return
+            self._entries[key] = (time.monotonic() + self.local_timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(value):
+        # Hand out a fresh Organisation so one request can't mutate another's tenant.
+        organisation, role = value
+        return copy.copy(organisation), role
+
+
+def _build_cache():
+    config = {**DEFAULTS, **getattr(settings, "TENANT_MEMBERSHIP_CACHE", {})}
+    if not config["ENABLED"]:
+        return None
+    return MembershipCache(
+        max_entries=config["MAX_ENTRIES"],
+        timeout=config["TIMEOUT"],
+        local_timeout=config["LOCAL_TIMEOUT"],
+        cache_alias=config["CACHE_ALIAS"],
+        key_prefix=config["KEY_PREFIX"],
+    )
+
+
+membership_cache = _build_cache()
+
+
+def get_membership(user_id, org_id):
+    if membership_cache is None:
+        return None
+    return membership_cache.get(user_id, org_id)
+
+
+def membership_generation(user_id, org_id):
+    """
+    Read before loading a membership from the database; pass to set_membership.
+    """
+    if membership_cache is None:
+        return None
+    return membership_cache.generation(user_id, org_id)
+
+
+def set_membership(user_id, org_id, organisation, role, generation=None):
+    if membership_cache is not None:
+        membership_cache.set(user_id, org_id, organisation, role, generation)
+
+
+def invalidate_membership(user_id, org_id):
+    """
+    Drop a cached membership. Call after any role change or removal.
+    """
+    if membership_cache is not None:
+        membership_cache.invalidate(user_id, org_id)
+
+
+def invalidate_memberships(user_ids, org_id):
+    """
+    invalidate_membership for many users at once (two shared-cache calls).
+    """
+    if membership_cache is not None:
+        membership_cache.invalidate_many(user_ids, org_id)
+
+
+def invalidate_organisation_memberships(org_id):
+    """
+    Drop all cached memberships of an organisation. Call after the
+    organisation row itself changes.
+    """
+    if membership_cache is not None:
+        membership_cache.invalidate_organisation(org_id)
+
+
+def membership_cache_stats():
+    if membership_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **membership_cache.stats()}
@@ -0,0 +1,15 @@
+from apps.organizations.activity import buffered_activity
+
+
+class ActivityBufferMiddleware:
+    """
+    Writes every activity committed during a request in a single INSERT
+    once the response is ready.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffered_activity():
+            return self.get_response(request)
@@ -1,6 +1,7 @@
 from django.http import JsonResponse
 from apps.organizations.models import OrganisationMember
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.membership_cache import get_membership, membership_generation, set_membership
+from core.authentication import CachedJWTAuthentication
 
 
 class TenantMiddleware:
@@ -14,6 +15,7 @@ class TenantMiddleware:
     ]
     TENANT_OPTIONAL_PATHS = [
         "/api/organisations/",
+        "/api/internal/",
     ]
 
     def __init__(self, get_response):
@@ -27,11 +29,10 @@ class TenantMiddleware:
             if path.startswith(skip_path):
                 return self.get_response(request)
 
-        # 2. Ensure JWT auth is applied before checking user
+        # 2. Ensure JWT auth is applied before checking user (DRF reuses the result)
         if not request.user.is_authenticated:
             try:
-                jwt_auth = JWTAuthentication()
-                user_auth_tuple = jwt_auth.authenticate(request)
+                user_auth_tuple = CachedJWTAuthentication().authenticate(request)
                 if user_auth_tuple is not None:
                     request.user, request.auth = user_auth_tuple
             except Exception:
@@ -59,20 +60,24 @@ class TenantMiddleware:
                 status=400
             )
 
-        # 6. Validate membership
-        try:
-            membership = OrganisationMember.objects.select_related("organisation").get(
-                user=request.user,
-                organisation_id=org_id
-            )
-        except OrganisationMember.DoesNotExist:
-            return JsonResponse(
-                {"detail": "Invalid organization or access denied."},
-                status=403
-            )
+        # 6. Validate membership (cached per user/org)
+        cached = get_membership(request.user.id, org_id)
+        if cached is None:
+            generation = membership_generation(request.user.id, org_id)
+            try:
+                membership = OrganisationMember.objects.select_related("organisation").get(
+                    user_id=request.user.id,
+                    organisation_id=org_id
+                )
+            except OrganisationMember.DoesNotExist:
+                return JsonResponse(
+                    {"detail": "Invalid organization or access denied."},
+                    status=403
+                )
+            set_membership(request.user.id, org_id, membership.organisation, membership.role, generation)
+            cached = (membership.organisation, membership.role)
 
         # 5. Attach tenant context
-        request.tenant = membership.organisation
-        request.tenant_role = membership.role
+        request.tenant, request.tenant_role = cached
 
         return self.get_response(request)
@@ -0,0 +1,166 @@
+import base64
+import binascii
+import json
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _dump(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a unique ordering such as (created_at, id).
+
+    Each page is a single range query for page_size + 1 rows: no COUNT(*) and
+    no OFFSET, so page 1000 costs the same as page 1. Cursors are opaque
+    base64 tokens holding the ordering values of the last row served.
+    """
+    ordering = ("created_at", "id")
+    page_size = 50
+    max_page_size = 500
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.bind(queryset.model)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(position))
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        self.next_position = self.position_for(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.page_size
+        try:
+            size = int(raw)
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def seek_filter(self, position, reverse=False):
+        """
+        Rows strictly after `position` in ordering order:
+        a >= x AND ((a > x) OR (a = x AND b > y) ...) for ascending fields,
+        lte/lt for descending. With reverse=True, rows strictly before it.
+
+        The leading a >= x is redundant logically but gives the planner an
+        index range start; the OR alone makes it scan from the beginning of
+        the tenant's range and filter.
+        """
+        condition = Q()
+        equal_prefix = Q()
+        for name, value in zip(self.ordering, position):
+            column = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") != reverse else "gt"
+            condition |= equal_prefix & Q(**{f"{column}__{lookup}": value})
+            equal_prefix &= Q(**{column: value})
+        if len(self.ordering) > 1:
+            name, value = self.ordering[0], position[0]
+            lookup = "lte" if name.startswith("-") != reverse else "gte"
+            condition = Q(**{f"{name.lstrip('-')}__{lookup}": value}) & condition
+        return condition
+
+    def position_for(self, row):
+        values = []
+        for field in self.fields:
+            if isinstance(row, dict):
+                value = row[field.attname] if field.attname in row else row[field.name]
+            else:
+                value = getattr(row, field.attname)
+            values.append(_dump(value))
+        return values
+
+    def encode_cursor(self, position):
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request):
+        return self.decode_token(request.query_params.get(self.cursor_query_param))
+
+    def decode_token(self, raw):
+        if not raw:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(raw.encode()).decode())
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError
+            return [field.to_python(value) for field, value in zip(self.fields, values)]
+        except (binascii.Error, UnicodeDecodeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def bind(self, model):
+        self.fields = [model._meta.get_field(name.lstrip("-")) for name in self.ordering]
+
+
+class OffsetPagination(BasePagination):
+    """
+    Page-number pagination for orderings keyset can't seek on, such as
+    search rank. Like KeysetPagination it fetches page_size + 1 rows and
+    never counts; OFFSET cost grows with depth, so pages stop at max_page.
+    """
+    page_size = 20
+    max_page_size = 100
+    max_page = 50
+    page_size_query_param = "page_size"
+    page_query_param = "page"
+
+    get_page_size = KeysetPagination.get_page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        try:
+            self.page = int(request.query_params.get(self.page_query_param, 1))
+        except (TypeError, ValueError):
+            raise NotFound("Invalid page.")
+        if not 1 <= self.page <= self.max_page:
+            raise NotFound("Invalid page.")
+
+        offset = (self.page - 1) * self.page_size
+        rows = list(queryset[offset: offset + self.page_size + 1])
+        self.has_next = len(rows) > self.page_size and self.page < self.max_page
+        return rows[: self.page_size]
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.page_query_param, self.page + 1)
@@ -0,0 +1,216 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+
+DEFAULTS = {
+    "ENABLED": False,
+    "BACKEND": "core.response_cache.LocalLRUBackend",
+    "MAX_ENTRIES": 1000,
+    "MAX_BYTES": 64 * 1024 * 1024,
+    "TIMEOUT": 300,
+    "CACHE_ALIAS": "default",
+    "KEY_PREFIX": "tenant-response",
+}
+
+
+class LocalLRUBackend:
+    """
+    In-process store bounded by entry count and total bytes; the least
+    recently used entries are evicted first.
+    """
+
+    def __init__(self, config):
+        self.max_entries = config["MAX_ENTRIES"]
+        self.max_bytes = config["MAX_BYTES"]
+        self.timeout = config["TIMEOUT"]
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= now:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.timeout, value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+
+class DjangoCacheBackend:
+    """
+    Stores entries in a CACHES alias (locmem, file-based, Redis, ...), so
+    workers can share them. Size limits and eviction are the cache's own.
+
+    The cache doesn't tell us what it evicts or expires, so stats only count
+    this process's writes; the current size is for the cache itself to report.
+    """
+
+    def __init__(self, config):
+        self.alias = config["CACHE_ALIAS"]
+        self.timeout = config["TIMEOUT"]
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.bytes_written = 0
+
+    def get(self, key):
+        return caches[self.alias].get(key)
+
+    def set(self, key, value, size):
+        caches[self.alias].set(key, value, self.timeout)
+        with self._lock:
+            self.writes += 1
+            self.bytes_written += size
+
+    def clear(self):
+        pass
+
+    def stats(self):
+        with self._lock:
+            return {"alias": self.alias, "writes": self.writes, "bytes_written": self.bytes_written}
+
+
+class ResponseCache:
+    """
+    Rendered list responses keyed by tenant, path, query string, renderer
+    and the organisation's data version, so any write moves readers to new
+    keys. Each entry also records its tenant and is checked on read.
+    """
+
+    def __init__(self, backend, key_prefix):
+        self.backend = backend
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, request, version):
+        # Re-encoded so a value containing "&" or "=" can't pass for extra parameters.
+        query = urlencode(sorted(request.GET.lists()), doseq=True)
+        renderer = getattr(getattr(request, "accepted_renderer", None), "format", "")
+        # The host is part of the key because paginated bodies embed absolute next links.
+        digest = hashlib.sha1(f"{request.get_host()}{request.path}?{query}|{renderer}".encode()).hexdigest()
+        return f"{self.key_prefix}:{request.tenant.id}:{version}:{digest}"
+
+    def get(self, request, version):
+        entry = self.backend.get(self.key_for(request, version))
+        hit = entry is not None and entry[0] == str(request.tenant.id)
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if not hit:
+            return None
+        _, content_type, content = entry
+        return HttpResponse(content, content_type=content_type)
+
+    def store(self, request, version, response):
+        """
+        Save the response once it has been rendered. Only plain 200 JSON
+        responses are kept.
+        """
+        if response.status_code != 200 or getattr(request.accepted_renderer, "format", None) != "json":
+            return
+        key = self.key_for(request, version)
+        tenant_id = str(request.tenant.id)
+
+        def save(rendered):
+            content = rendered.content
+            self.backend.set(key, (tenant_id, rendered["Content-Type"], content), len(content))
+
+        response.add_post_render_callback(save)
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            counters = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+        return {**counters, **self.backend.stats()}
+
+
+_response_cache = None
+_build_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    The configured ResponseCache, or None when RESPONSE_CACHE is disabled.
+    """
+    global _response_cache
+    config = {**DEFAULTS, **getattr(settings, "RESPONSE_CACHE", {})}
+    if not config["ENABLED"]:
+        return None
+    if _response_cache is None:
+        with _build_lock:
+            if _response_cache is None:
+                backend = import_string(config["BACKEND"])(config)
+                _response_cache = ResponseCache(backend, config["KEY_PREFIX"])
+    return _response_cache
+
+
+@receiver(setting_changed)
+def _reset_on_setting_change(setting, **kwargs):
+    global _response_cache
+    if setting == "RESPONSE_CACHE":
+        _response_cache = None
+
+
+def response_cache_stats():
+    cache = get_response_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
@@ -0,0 +1,181 @@
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+
+def _skip_none(convert):
+    return lambda value: None if value is None else convert(value)
+
+
+def _datetime_converter(field):
+    if getattr(field, "format", api_settings.DATETIME_FORMAT) != ISO_8601:
+        return field.to_representation
+    tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+
+    def convert(value):
+        # Same steps as DateTimeField.to_representation, without the per-call lookups.
+        if tz is not None:
+            value = value.astimezone(tz)
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return convert
+
+
+def _converter_for(field):
+    if isinstance(field, (PrimaryKeyRelatedField, serializers.UUIDField)):
+        if getattr(field, "pk_field", None) is not None or getattr(field, "uuid_format", "hex_verbose") != "hex_verbose":
+            return field.to_representation
+        return str
+    if isinstance(field, serializers.ChoiceField):
+        mapping = field.choice_strings_to_values
+        return lambda value: mapping.get(str(value), value)
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_converter(field)
+    if isinstance(field, serializers.DateField):
+        if getattr(field, "format", api_settings.DATE_FORMAT) != ISO_8601:
+            return field.to_representation
+        return lambda value: value.isoformat()
+    if isinstance(field, serializers.CharField):
+        # Text columns already come back as str.
+        return None
+    # Anything else goes through DRF itself: slower, but always identical.
+    return field.to_representation
+
+
+class ValuesSerializer:
+    """
+    Read-only list path for a ModelSerializer.
+
+    Rows come from one .values() query and each column goes through a
+    converter chosen once per list, instead of building model instances and
+    running every DRF field per row. The result matches
+    serializer_class(many=True).data once rendered to JSON.
+
+    SerializerMethodFields are filled in by a `get_<name>_batch(rows)` method
+    on the subclass returning {pk: value} for the whole page.
+    """
+    serializer_class = None
+
+    def __init__(self, fields=None):
+        serializer = self.serializer_class()
+        self.model = serializer.Meta.model
+        self.pk_name = self.model._meta.pk.attname
+        self.fields = [
+            (name, field)
+            for name, field in serializer.fields.items()
+            if not field.write_only and (fields is None or name in fields)
+        ]
+        self.columns = []
+        self.batch_fields = []
+        for name, field in self.fields:
+            if isinstance(field, serializers.SerializerMethodField):
+                self.batch_fields.append(name)
+            else:
+                self.columns.append((name, self.model._meta.get_field(field.source).attname))
+
+    def values(self, queryset, extra=()):
+        """
+        `extra` names columns needed besides the output, e.g. cursor ordering.
+        """
+        names = {self.pk_name, *extra, *(attname for _, attname in self.columns)}
+        return queryset.prefetch_related(None).values(*names)
+
+    def to_representation(self, rows):
+        columns = dict(self.columns)
+        batches = {name: getattr(self, f"get_{name}_batch")(rows) for name in self.batch_fields}
+        plan = []
+        for name, field in self.fields:
+            convert = None if name in batches else _converter_for(field)
+            if convert is not None and field.allow_null:
+                convert = _skip_none(convert)
+            plan.append((name, columns.get(name), batches.get(name), convert))
+        pk_name = self.pk_name
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, batch, convert in plan:
+                if batch is not None:
+                    item[name] = batch[row[pk_name]]
+                elif convert is None:
+                    item[name] = row[column]
+                else:
+                    item[name] = convert(row[column])
+            data.append(item)
+        return data
+
+
+class SparseFieldsMixin:
+    """
+    `?fields=a,b` on list and retrieve limits the output to those fields and
+    the SQL to their columns (.only()). Unknown names are a 400.
+    """
+    fields_query_param = "fields"
+
+    def get_requested_fields(self):
+        if not hasattr(self, "_requested_fields"):
+            self._requested_fields = self._parse_requested_fields()
+        return self._requested_fields
+
+    def _parse_requested_fields(self):
+        raw = self.request.query_params.get(self.fields_query_param)
+        if raw is None or self.action not in ("list", "retrieve"):
+            return None
+        names = list(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+        available = {
+            name for name, field in self.get_serializer_class()().fields.items() if not field.write_only
+        }
+        unknown = [name for name in names if name not in available]
+        if unknown or not names:
+            raise ValidationError({
+                self.fields_query_param: f"Unknown field(s): {', '.join(unknown)}." if unknown
+                else "List at least one field.",
+            })
+        return names
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        requested = self.get_requested_fields()
+        if requested is not None:
+            fields = getattr(serializer, "child", serializer).fields
+            for name in list(fields):
+                if name not in requested:
+                    fields.pop(name)
+        return serializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        requested = self.get_requested_fields()
+        if requested is None:
+            return queryset
+        serializer_fields = self.get_serializer_class()().fields
+        model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+        columns = [serializer_fields[name].source for name in requested if serializer_fields[name].source in model_fields]
+        ordering = [name.lstrip("-") for name in getattr(self.paginator, "ordering", ())]
+        return queryset.only(*columns, *ordering)
+
+
+class ValuesListMixin:
+    """
+    Serve `list` through `values_serializer_class` (a ValuesSerializer)
+    rather than the model serializer. Honours SparseFieldsMixin's `fields`.
+    """
+    values_serializer_class = None
+
+    def get_values_serializer(self):
+        requested = self.get_requested_fields() if hasattr(self, "get_requested_fields") else None
+        return self.values_serializer_class(fields=requested)
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+        values_serializer = self.get_values_serializer()
+        # Keyset cursors read their position from the ordering columns.
+        ordering = [name.lstrip("-") for name in getattr(self.paginator, "ordering", ())]
+        rows = values_serializer.values(self.filter_queryset(self.get_queryset()), extra=ordering)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.to_representation(page))
+        return Response(values_serializer.to_representation(list(rows)))
@@ -65,6 +65,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
 
     "core.middleware.tenant.TenantMiddleware",
+    "core.middleware.activity.ActivityBufferMiddleware",
 
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -107,9 +108,29 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST"),
         "PORT": os.getenv("DB_PORT"),
+        # Reuse connections across requests instead of reconnecting each time;
+        # health checks replace a connection the server dropped while idle.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "True") == "True",
     }
 }
 
+# Native connection pool (psycopg 3 with psycopg[pool]). core.asgi turns it on by
+# default: under ASGI requests don't keep to one thread, so persistent connections
+# are never reused. Pooling replaces CONN_MAX_AGE, which must then be 0.
+if os.getenv("DB_POOL", "False") == "True":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            # Seconds a request waits for a free connection before failing.
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "600")),
+            "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+        },
+    }
+
 
 
 # Password validation
@@ -151,7 +172,7 @@ STATIC_URL = "static/"
 # DRF settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -172,6 +193,96 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
 }
 
+# Authentication: TOKEN_USER_READS builds request.user from JWT claims on safe
+# requests to TOKEN_USER_PATHS, skipping the users lookup. Inactive users keep
+# read access on those paths until their access token expires.
+TENANT_AUTH = {
+    "TOKEN_USER_READS": os.getenv("TOKEN_USER_READS", "False") == "True",
+    "TOKEN_USER_PATHS": [
+        "/api/tasks/",
+        "/api/projects/",
+        "/api/activity/",
+    ],
+}
+
+# Tenant membership cache used by TenantMiddleware.
+# Role changes and removals only clear the writing worker's local copy, so other workers
+# trust theirs for up to LOCAL_TIMEOUT seconds. With several workers, set
+# TENANT_MEMBERSHIP_CACHE_ALIAS to a shared CACHES alias and LOCAL_TIMEOUT to 0 so
+# changes apply in every worker on the next request.
+TENANT_MEMBERSHIP_CACHE = {
+    "ENABLED": os.getenv("TENANT_MEMBERSHIP_CACHE_ENABLED", "True") == "True",
+    "MAX_ENTRIES": int(os.getenv("TENANT_MEMBERSHIP_CACHE_MAX_ENTRIES", "10000")),
+    "TIMEOUT": int(os.getenv("TENANT_MEMBERSHIP_CACHE_TIMEOUT", "60")),
+    "LOCAL_TIMEOUT": int(os.getenv("TENANT_MEMBERSHIP_CACHE_LOCAL_TIMEOUT", "5")),
+    "CACHE_ALIAS": os.getenv("TENANT_MEMBERSHIP_CACHE_ALIAS") or None,
+}
+
+# Activity feed writes. Entries are written after commit, once per request.
+# ACTIVITY_BACKGROUND_WRITER batches them across requests in a bounded in-process queue.
+ACTIVITY_WRITER = {
+    "BACKGROUND": os.getenv("ACTIVITY_BACKGROUND_WRITER", "False") == "True",
+    "MAX_QUEUE": int(os.getenv("ACTIVITY_WRITER_MAX_QUEUE", "10000")),
+    "BATCH_SIZE": int(os.getenv("ACTIVITY_WRITER_BATCH_SIZE", "500")),
+    "FLUSH_INTERVAL": float(os.getenv("ACTIVITY_WRITER_FLUSH_INTERVAL", "1.0")),
+}
+
+# Retention used by `manage.py archive_activity`; ORGS maps org ids to their own window.
+ACTIVITY_RETENTION = {
+    "DEFAULT_DAYS": int(os.getenv("ACTIVITY_RETENTION_DAYS", "90")),
+    "ORGS": {},
+}
+
+# Seconds a rendered activity feed stays cached; new activity switches to a fresh key.
+ACTIVITY_FEED_CACHE_TIMEOUT = int(os.getenv("ACTIVITY_FEED_CACHE_TIMEOUT", "3600"))
+
+# Seconds cached dashboard stats are kept; any write moves readers to a fresh key.
+DASHBOARD_STATS_TIMEOUT = int(os.getenv("DASHBOARD_STATS_TIMEOUT", "300"))
+
+# Opt-in cache of rendered task/project/member lists, keyed by tenant, path, query and
+# data version. Use core.response_cache.DjangoCacheBackend to store entries in the
+# RESPONSE_CACHE_ALIAS cache (locmem, file-based or shared) instead of this process.
+RESPONSE_CACHE = {
+    "ENABLED": os.getenv("RESPONSE_CACHE_ENABLED", "False") == "True",
+    "BACKEND": os.getenv("RESPONSE_CACHE_BACKEND", "core.response_cache.LocalLRUBackend"),
+    "MAX_ENTRIES": int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000")),
+    "MAX_BYTES": int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    "TIMEOUT": int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300")),
+    "CACHE_ALIAS": os.getenv("RESPONSE_CACHE_ALIAS", "default"),
+}
+
+# Delta sync (GET /api/sync/). Tokens start at the oldest open transaction on PostgreSQL;
+# OVERLAP_SECONDS re-sends a little more to cover clock skew. Responses carry at most PAGE_SIZE
+# rows per part; tokens older than TOMBSTONE_RETENTION_DAYS get 410. Run
+# `manage.py compact_tombstones` daily.
+SYNC = {
+    "OVERLAP_SECONDS": int(os.getenv("SYNC_OVERLAP_SECONDS", "5")),
+    "PAGE_SIZE": int(os.getenv("SYNC_PAGE_SIZE", "500")),
+    "TOMBSTONE_RETENTION_DAYS": int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30")),
+}
+
+# Live event streams (GET /api/events/, ASGI only).
+# Use core.events.PostgresEventBackend to share events between worker processes.
+EVENT_STREAM = {
+    "BACKEND": os.getenv("EVENT_STREAM_BACKEND", "core.events.LocalEventBackend"),
+    "HEARTBEAT_SECONDS": float(os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", "15")),
+    "QUEUE_SIZE": int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "100")),
+    "MAX_CONNECTIONS_PER_TENANT": int(os.getenv("EVENT_STREAM_MAX_CONNECTIONS_PER_TENANT", "50")),
+}
+
+# Streaming task export (GET /api/tasks/export/): rows fetched and sent per chunk.
+TASK_EXPORT = {
+    "CHUNK_SIZE": int(os.getenv("TASK_EXPORT_CHUNK_SIZE", "2000")),
+}
+
+# Task import (POST /api/tasks/import/, manage.py import_tasks).
+# USE_COPY loads batches with COPY on PostgreSQL instead of one executemany INSERT.
+TASK_IMPORT = {
+    "BATCH_SIZE": int(os.getenv("TASK_IMPORT_BATCH_SIZE", "5000")),
+    "MAX_ERRORS": int(os.getenv("TASK_IMPORT_MAX_ERRORS", "1000")),
+    "USE_COPY": os.getenv("TASK_IMPORT_USE_COPY", "True") == "True",
+}
+
 CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:5173",
     "http://localhost:5173",
@@ -1,4 +1,7 @@
+from django.http import HttpResponseNotModified
 from rest_framework.exceptions import PermissionDenied
+from apps.organizations.versions import data_version_etag, etag_matches, get_data_version
+from core.response_cache import get_response_cache
 
 
 class TenantScopedViewSetMixin:
@@ -21,3 +24,30 @@ class TenantScopedViewSetMixin:
         if hasattr(queryset.model, "project_id"):
             return queryset.filter(project__organisation_id=tenant.id)
         return queryset
+
+
+class DataVersionETagMixin:
+    """
+    Tags list responses with the organisation's data version. A matching
+    If-None-Match gets 304 before the queryset or serializer runs, and with
+    RESPONSE_CACHE enabled other clients get the cached rendered body.
+    """
+
+    def list(self, request, *args, **kwargs):
+        self.ensure_tenant()
+        version = get_data_version(request.tenant.id)
+        etag = data_version_etag(request, version)
+        if etag_matches(request, etag):
+            return HttpResponseNotModified(headers={"ETag": etag})
+
+        cache = get_response_cache()
+        cached = cache.get(request, version) if cache is not None else None
+        if cached is not None:
+            cached["ETag"] = etag
+            return cached
+
+        response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        if cache is not None:
+            cache.store(request, version, response)
+        return response
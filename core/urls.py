@@ -17,10 +17,13 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import path, include
+from core.views import InternalMetricsView, event_stream
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/auth/", include("apps.accounts.urls")),
+    path("api/internal/metrics/", InternalMetricsView.as_view()),
+    path("api/events/", event_stream),
     path("api/", include("apps.organizations.urls")),
     path("api/", include("apps.projects.urls")),
     path("api/", include("apps.tasks.urls")),
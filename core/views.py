@@ -0,0 +1,44 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.database import database_stats
+from core.events import StreamLimitExceeded, event_stream_stats, open_event_stream
+from core.membership_cache import membership_cache_stats
+from core.response_cache import response_cache_stats
+
+
+class InternalMetricsView(APIView):
+    """
+    Staff-only runtime counters for caches and connection reuse.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            "membership_cache": membership_cache_stats(),
+            "event_streams": event_stream_stats(),
+            "response_cache": response_cache_stats(),
+            "database": database_stats(),
+        })
+
+
+async def event_stream(request):
+    """
+    Server-Sent Events for the active organisation: task changes and new
+    activity as they are committed. TenantMiddleware has already checked
+    the bearer token and X-ORG-ID membership.
+    """
+    if not isinstance(request, ASGIRequest):
+        # A WSGI worker would be held for the lifetime of the stream.
+        return JsonResponse({"detail": "Event streams are only served over ASGI."}, status=501)
+    try:
+        subscription = open_event_stream(request.tenant.id)
+    except StreamLimitExceeded:
+        return JsonResponse({"detail": "Too many open event streams for this organization."}, status=429)
+
+    response = StreamingHttpResponse(subscription, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
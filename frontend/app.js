@@ -7,8 +7,12 @@ const state = {
   memberships: [],
   projects: [],
   tasks: [],
+  tasksNext: null,
   members: [],
+  membersNext: null,
   savingTasks: new Set(),
+  events: null,
+  syncToken: null,
 };
 
 const views = document.querySelectorAll(".view");
@@ -101,13 +105,17 @@ async function refreshToken() {
 }
 
 function logout() {
+  disconnectEvents();
   state.access = "";
   state.refresh = "";
   state.orgId = "";
   state.memberships = [];
   state.projects = [];
   state.tasks = [];
+  state.tasksNext = null;
+  state.syncToken = null;
   state.members = [];
+  state.membersNext = null;
   state.savingTasks.clear();
   localStorage.removeItem("access");
   localStorage.removeItem("refresh");
@@ -120,6 +128,57 @@ function logout() {
   setView("auth");
 }
 
+function disconnectEvents() {
+  if (state.events) {
+    state.events.abort();
+    state.events = null;
+  }
+}
+
+function handleLiveEvent(type) {
+  if (type.startsWith("task") || type === "reset") {
+    syncChanges();
+  } else if (type === "activity") {
+    renderActivity();
+  }
+}
+
+// Live updates over Server-Sent Events. fetch() is used instead of
+// EventSource so the stream sends the same Authorization/X-ORG-ID headers.
+async function connectEvents() {
+  disconnectEvents();
+  if (!state.access || !state.orgId) return;
+  const controller = new AbortController();
+  state.events = controller;
+
+  try {
+    const response = await apiFetch("/api/events/", { signal: controller.signal });
+    if (!response.ok || !response.body) {
+      // 501 means the API runs without ASGI; keep the manual refresh flow.
+      if (response.status !== 501) setTimeout(() => state.events === controller && connectEvents(), 10000);
+      return;
+    }
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = "";
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += value;
+      const blocks = buffer.split("\n\n");
+      buffer = blocks.pop();
+      blocks.forEach((block) => {
+        const line = block.split("\n").find((item) => item.startsWith("event: "));
+        if (line) handleLiveEvent(line.slice(7));
+      });
+    }
+  } catch (error) {
+    if (controller.signal.aborted) return;
+  }
+  if (state.events === controller) {
+    setTimeout(() => state.events === controller && connectEvents(), 3000);
+  }
+}
+
 function toast(message) {
   if (!toastContainer) return;
   const el = document.createElement("div");
@@ -186,7 +245,7 @@ function formatDate(value) {
   }
 }
 
-function renderStats() {
+async function renderStats() {
   const statOrgs = document.getElementById("statOrgs");
   const statProjects = document.getElementById("statProjects");
   const statTasks = document.getElementById("statTasks");
@@ -194,9 +253,18 @@ function renderStats() {
 
   if (!statOrgs) return;
   statOrgs.textContent = state.memberships.length;
-  statProjects.textContent = state.projects.length;
-  statTasks.textContent = state.tasks.length;
   statMemberships.textContent = state.memberships.length;
+
+  if (!state.orgId) {
+    statProjects.textContent = 0;
+    statTasks.textContent = 0;
+    return;
+  }
+  const response = await apiFetch("/api/tasks/stats/");
+  if (!response.ok) return;
+  const stats = await response.json();
+  statProjects.textContent = stats.projects;
+  statTasks.textContent = stats.tasks.total;
 }
 
 async function renderActivity() {
@@ -314,6 +382,14 @@ function renderMembers() {
     table.appendChild(row);
   });
 
+  if (state.membersNext) {
+    const more = document.createElement("button");
+    more.className = "btn btn-secondary";
+    more.textContent = "Load more members";
+    more.addEventListener("click", loadMoreMembers);
+    table.appendChild(more);
+  }
+
   table.querySelectorAll(".member-role").forEach((select) => {
     select.addEventListener("change", async (event) => {
       const memberId = event.target.dataset.id;
@@ -443,6 +519,62 @@ async function createOrg(name) {
   await loadMe();
 }
 
+// Delta sync: take a token before a full load, then fetch only what changed.
+async function startSync() {
+  state.syncToken = null;
+  if (!state.orgId) return;
+  const response = await apiFetch("/api/sync/");
+  if (!response.ok) return;
+  state.syncToken = (await response.json()).token;
+}
+
+function mergeById(items, changed, deletedIds, appendNew) {
+  const deleted = new Set(deletedIds);
+  const updates = new Map(changed.map((item) => [item.id, item]));
+  const merged = items
+    .filter((item) => !deleted.has(item.id))
+    .map((item) => {
+      const update = updates.get(item.id);
+      updates.delete(item.id);
+      return update || item;
+    });
+  return appendNew ? [...merged, ...updates.values()] : merged;
+}
+
+async function syncChanges() {
+  if (!state.orgId) return;
+  let synced = false;
+  let expired = !state.syncToken;
+  while (state.syncToken) {
+    const response = await apiFetch(`/api/sync/?since=${encodeURIComponent(state.syncToken)}`);
+    if (!response.ok) {
+      expired = response.status === 410;
+      break;
+    }
+    const data = await response.json();
+    state.syncToken = data.token;
+    state.projects = mergeById(state.projects, data.projects, data.deleted.projects, true);
+    // Unloaded pages pick new tasks up when they are fetched.
+    state.tasks = mergeById(state.tasks, data.tasks, data.deleted.tasks, !state.tasksNext);
+    synced = true;
+    // Large changes arrive in pages; keep going until the token is current.
+    if (!data.has_more) break;
+  }
+  if (expired) {
+    await startSync();
+    await loadProjects();
+    await loadTasks();
+    return;
+  }
+  if (!synced) return;
+  const projectIds = new Set(state.projects.map((project) => project.id));
+  state.tasks = state.tasks.filter((task) => projectIds.has(task.project));
+  renderProjects();
+  renderProjectSelect();
+  renderTasks();
+  renderDashboard();
+}
+
 async function loadProjects() {
   if (!state.orgId) return;
   const response = await apiFetch("/api/projects/");
@@ -511,18 +643,34 @@ async function createProject(name, description) {
     body: JSON.stringify({ name, description }),
   });
   if (!response.ok) return;
-  await loadProjects();
+  await syncChanges();
 }
 
+// Only the columns the board renders; the API trims the query to match.
+const TASK_LIST_FIELDS = "id,title,status,project,due_date,created_at";
+
 async function loadTasks() {
   if (!state.orgId) return;
-  const response = await apiFetch("/api/tasks/");
+  const response = await apiFetch(`/api/tasks/?fields=${TASK_LIST_FIELDS}`);
   if (!response.ok) return;
-  state.tasks = await response.json();
+  const data = await response.json();
+  state.tasks = data.results || [];
+  state.tasksNext = data.next;
   renderTasks();
   renderDashboard();
 }
 
+async function loadMoreTasks() {
+  if (!state.tasksNext) return;
+  const next = new URL(state.tasksNext);
+  const response = await apiFetch(`${next.pathname}${next.search}`);
+  if (!response.ok) return;
+  const data = await response.json();
+  state.tasks = [...state.tasks, ...(data.results || [])];
+  state.tasksNext = data.next;
+  renderTasks();
+}
+
 function renderTasks() {
   const groups = document.getElementById("taskGroups");
   if (!groups) return;
@@ -604,6 +752,14 @@ function renderTasks() {
     });
   });
 
+  if (state.tasksNext) {
+    const more = document.createElement("button");
+    more.className = "btn btn-secondary";
+    more.textContent = "Load more tasks";
+    more.addEventListener("click", loadMoreTasks);
+    groups.appendChild(more);
+  }
+
   groups.querySelectorAll("[data-task-delete]").forEach((button) => {
     button.addEventListener("click", () => {
       const taskId = button.dataset.taskDelete;
@@ -624,7 +780,7 @@ async function createTask(title, project) {
     body: JSON.stringify({ title, project }),
   });
   if (!response.ok) return;
-  await loadTasks();
+  await syncChanges();
 }
 
 async function deleteProject(projectId) {
@@ -636,8 +792,7 @@ async function deleteProject(projectId) {
     toast(payload.detail || "Unable to delete project.");
     return;
   }
-  await loadProjects();
-  await loadTasks();
+  await syncChanges();
   toast("Project deleted.");
 }
 
@@ -650,7 +805,7 @@ async function deleteTask(taskId) {
     toast(payload.detail || "Unable to delete task.");
     return;
   }
-  await loadTasks();
+  await syncChanges();
   toast("Task deleted.");
 }
 
@@ -693,6 +848,18 @@ async function loadMembers() {
   if (!response.ok) return;
   const data = await response.json();
   state.members = data.members || [];
+  state.membersNext = data.next;
+  renderMembers();
+}
+
+async function loadMoreMembers() {
+  if (!state.membersNext) return;
+  const next = new URL(state.membersNext);
+  const response = await apiFetch(`${next.pathname}${next.search}`);
+  if (!response.ok) return;
+  const data = await response.json();
+  state.members = [...state.members, ...(data.members || [])];
+  state.membersNext = data.next;
   renderMembers();
 }
 
@@ -789,10 +956,12 @@ document.getElementById("loginForm").addEventListener("submit", async (event) =>
     localStorage.setItem("refresh", payload.refresh);
     msg.textContent = "Login successful.";
     await loadMe();
+    await startSync();
     await loadProjects();
     await loadTasks();
     await loadMembers();
     setView("dashboard");
+    connectEvents();
   } catch (error) {
     msg.textContent = "Network error. Is the backend running?";
   } finally {
@@ -887,9 +1056,11 @@ orgSelect.addEventListener("change", async (event) => {
   localStorage.setItem("orgId", state.orgId);
   updateRoleBadge();
   updatePermissionUI();
+  await startSync();
   await loadProjects();
   await loadTasks();
   await loadMembers();
+  connectEvents();
 });
 
 document.getElementById("logoutBtn").addEventListener("click", () => {
@@ -905,8 +1076,7 @@ navLinks.forEach((link) => {
   link.addEventListener("click", async () => {
     const target = link.dataset.viewTarget;
     setView(target);
-    if (target === "projects") await loadProjects();
-    if (target === "tasks") await loadTasks();
+    if (target === "projects" || target === "tasks") await syncChanges();
     if (target === "members") await loadMembers();
   });
 });
@@ -915,8 +1085,7 @@ document.querySelectorAll("[data-view-target]").forEach((button) => {
   button.addEventListener("click", async () => {
     const target = button.dataset.viewTarget;
     setView(target);
-    if (target === "projects") await loadProjects();
-    if (target === "tasks") await loadTasks();
+    if (target === "projects" || target === "tasks") await syncChanges();
     if (target === "members") await loadMembers();
   });
 });
@@ -970,10 +1139,12 @@ if (addMemberForm) {
 function initialize() {
   if (state.access) {
     loadMe().then(async () => {
+      await startSync();
       await loadProjects();
       await loadTasks();
       await loadMembers();
       setView("dashboard");
+      connectEvents();
     });
   } else {
     setView("auth");